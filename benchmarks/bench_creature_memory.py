@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria y acceso a atributos de las criaturas
+
+Compara el objeto criatura con __slots__ frente a uno equivalente con
+__dict__ y los mismos atributos. En CPython 3.11+ un __dict__ con claves
+compartidas es casi tan compacto como __slots__ mientras la clase no
+pase de 30 atributos; con más (o en versiones anteriores) cada instancia
+lleva su propio diccionario, que es lo que mide la comparación.
+
+Uso: python benchmarks/bench_creature_memory.py [número de criaturas]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import config
+config.DEBUG = {key: False for key in config.DEBUG}
+
+from engine.creature import Creature
+from engine.world import World
+
+
+class DictRecord:
+    """Mismos atributos que una criatura, guardados en __dict__"""
+
+
+class SlotRecord:
+    """Mismos atributos que una criatura, en __slots__"""
+    __slots__ = Creature.__slots__
+
+
+def fill(record, creature):
+    for name in Creature.__slots__:
+        setattr(record, name, getattr(creature, name))
+    return record
+
+
+def traced_bytes(factory, count: int) -> float:
+    """Bytes reservados por objeto al crear ``count`` objetos"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def read_ns(obj, number: int = 200000) -> float:
+    """Nanosegundos por lectura de los atributos opcionales más consultados"""
+    def probe():
+        return (obj.infection, obj.is_predator, obj.kills, obj.custom_name, obj.intelligence)
+    return timeit.timeit(probe, number=number) / number / 5 * 1e9
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    world = World(config.WORLD_WIDTH, config.WORLD_HEIGHT)
+    sample = Creature(100, 100, world)
+
+    print(f"📏 Benchmark de criaturas ({count} instancias)\n")
+
+    creature_bytes = traced_bytes(lambda: Creature(100, 100, world), count)
+    print(f"Criatura completa (genoma, red, subsistemas): {creature_bytes:,.0f} B")
+    print(f"  __dict__ por instancia: {'sí' if hasattr(sample, '__dict__') else 'no'}\n")
+
+    dict_bytes = traced_bytes(lambda: fill(DictRecord(), sample), count)
+    slot_bytes = traced_bytes(lambda: fill(SlotRecord(), sample), count)
+    print("Solo el objeto criatura (mismos atributos):")
+    print(f"  con __dict__:  {dict_bytes:7.0f} B")
+    print(f"  con __slots__: {slot_bytes:7.0f} B  ({1 - slot_bytes / dict_bytes:.0%} menos)\n")
+
+    dict_ns = read_ns(fill(DictRecord(), sample))
+    slot_ns = read_ns(sample)
+    print("Lectura de atributo (infection, is_predator, kills, custom_name, intelligence):")
+    print(f"  con __dict__:  {dict_ns:5.1f} ns")
+    print(f"  con __slots__: {slot_ns:5.1f} ns")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark del procesado por lotes de redes neuronales
+
+Mide el tiempo por lote y las reservas de memoria por lote en régimen
+estable: el procesador trabaja sobre búferes persistentes y escribe la
+memoria de corto plazo en el BrainStore, así que tras el primer lote no
+debería reservar ningún array nuevo. Se compara con el forward escalar
+(una red cada vez), que crea varios arrays temporales por criatura.
+
+Uso: python benchmarks/bench_neural_batch.py [criaturas] [tamaño de lote]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import config
+config.DEBUG = {key: False for key in config.DEBUG}
+
+from engine.world import World
+from engine.neural_batch import NeuralBatchProcessor
+
+
+def run_batched(processor, creatures, inputs, batch_size):
+    for start in range(0, len(creatures), batch_size):
+        end = start + batch_size
+        for outputs in processor.process_batch(creatures[start:end], inputs[start:end]):
+            pass
+
+
+def run_scalar(processor, creatures, inputs, batch_size):
+    for creature, values in zip(creatures, inputs):
+        creature.brain.forward(values)
+
+
+def measure(step, repeats: int = 50):
+    """(µs por pasada, pico reservado por pasada, bytes retenidos tras todas)"""
+    step()  # Calentar: el primer lote dimensiona los búferes
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        step()
+    elapsed = (time.perf_counter() - started) / repeats * 1e6
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    peak = 0
+    for _ in range(repeats):
+        tracemalloc.reset_peak()
+        step()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return elapsed, peak, retained
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else config.GPU_BATCH_SIZE
+
+    world = World(config.WORLD_WIDTH, config.WORLD_HEIGHT)
+    world.populate(count)
+    creatures = list(world.creatures)
+    inputs = [creature.prepare_neural_inputs() for creature in creatures]
+    processor = NeuralBatchProcessor()
+    backend = "OpenCL" if processor.initialized else "numpy"
+
+    print(f"🧠 Procesado neuronal ({count} criaturas, lotes de {batch_size}, {backend})\n")
+    print(f"{'Modo':<10}{'µs/pasada':>12}{'pico/pasada':>14}{'retenido':>12}")
+    for name, runner in (('lotes', run_batched), ('escalar', run_scalar)):
+        elapsed, peak, retained = measure(lambda: runner(processor, creatures, inputs, batch_size))
+        print(f"{name:<10}{elapsed:12.0f}{peak:12d} B{retained:10d} B")
+
+
+if __name__ == '__main__':
+    main()
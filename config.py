@@ -25,6 +25,7 @@ CYCLES_PER_DAY = 100  # 100 ciclos = 1 día en el simulador
 
 # Evolución
 COMPLEXITY_THRESHOLD_VOCAL = 500
+COMPLEXITY_THRESHOLD_NEURAL = 50  # Por encima, la red neuronal participa en el movimiento
 AUDIO_DATA_REQUIREMENT = 100
 
 # Datos (Alimento)
@@ -63,10 +64,14 @@ NEURAL_LEARNING_RATE = 0.1
 
 # OpenCL y Optimización GPU
 USE_GPU = True
-GPU_THRESHOLD_CREATURES = 20  # Activar GPU con más de 20 criaturas
-GPU_BATCH_SIZE = 64  # Procesar 64 criaturas por lote (aumentado)
-GPU_PRIORITY_COMPLEX = True  # Priorizar GPU para criaturas complejas
-COMPLEX_THRESHOLD = 1000  # Umbral de complejidad alta
+GPU_THRESHOLD_CREATURES = 20  # Lotes con más de 20 criaturas (solo sin autoajuste)
+GPU_BATCH_SIZE = 64  # Criaturas por lote (solo sin autoajuste)
+DISPATCH_AUTOTUNE = True  # Medir escalar / lotes CPU / lotes OpenCL y usar el más rápido
+DISPATCH_BATCH_SIZES = (16, 32, 64, 128, 256)  # Tamaños de lote que se prueban
+DISPATCH_RETUNE_CYCLES = 1800  # Ciclos entre rondas de medición
+DISPATCH_RETUNE_GROWTH = 1.5  # Medir de nuevo si la población cambia más de este factor
+DISPATCH_SAMPLES = 3  # Ticks medidos por candidato (se toma el mejor)
+DISPATCH_PROBE_INTERVAL = 10  # Ticks con la decisión vigente entre dos mediciones
 OPENCL_FALLBACK_TO_CPU = True
 
 # Vocalización
@@ -92,10 +97,10 @@ ADVANCED_VOCABULARY_CONTEXTS = {
     'reproducir': lambda c: c.can_reproduce(),  # Momento de reproducirse
     'defender': lambda c: c.detects_threat() and c.fitness > 100,  # Defender territorio
     'peligro_aqui': lambda c: c.detects_threat() and c.energy < c.max_energy * 0.5,  # Peligro específico
-    'seguir': lambda c: hasattr(c, 'intelligence') and c.intelligence and c.energy > c.max_energy * 0.6,  # Seguir al líder
+    'seguir': lambda c: c.intelligence and c.energy > c.max_energy * 0.6,  # Seguir al líder
     'explorar': lambda c: len(c.world.get_data_near(c.x, c.y, 150)) == 0,  # No hay comida cerca
     'descansar': lambda c: c.energy > c.max_energy * 0.8 and c.age > 100,  # Conservar energía
-    'atacar': lambda c: hasattr(c, 'is_predator') and c.is_predator and c.energy > c.max_energy * 0.4,  # Coordinar ataque
+    'atacar': lambda c: c.is_predator and c.energy > c.max_energy * 0.4,  # Coordinar ataque
     'huir': lambda c: c.detects_threat() and c.fitness < 50,  # Huir de peligro
     'compartir': lambda c: c.sees_food_nearby() and c.energy > c.max_energy * 0.7  # Compartir recursos
 }
@@ -108,6 +113,11 @@ SHOW_GENOME_VISUALIZATION = True
 SHOW_ENERGY_BAR = True
 SHOW_NAMES = True
 
+# Nivel de detalle según zoom
+LOD_DETAIL_ZOOM = 0.8  # Por debajo: sin nombres ni barras de energía
+LOD_DOT_ZOOM = 0.65    # Por debajo: criaturas como puntos y alimento como mapa de calor
+LOD_HEATMAP_CELL = 8   # Tamaño de celda del mapa de calor de alimento (px del mundo)
+
 # Colores de fases evolutivas
 PHASE_COLORS = {
     'primitive': (255, 100, 100),    # Rojo
@@ -118,13 +128,40 @@ PHASE_COLORS = {
 
 # Performance
 TARGET_FPS = 60
-PHYSICS_SUBSTEPS = 1
+SIM_TICK_RATE = 60  # Pasos de simulación por segundo simulado (independiente de los FPS)
+PHYSICS_SUBSTEPS = 1  # Subpasos por tick (paso fijo = 1 / (SIM_TICK_RATE * PHYSICS_SUBSTEPS))
+MAX_SIM_STEPS_PER_FRAME = 40  # Límite de pasos por frame antes de ralentizar la simulación
+BEHAVIOR_PERIODS = {  # Segundos simulados entre ejecuciones de cada comportamiento
+    'reproduce': 10,
+    'appearance': 5,
+    'predation': 20,
+    'collaboration': 15,
+    'communication': 10,
+}
+SIM_THREADED = False  # Simulación en un hilo propio (publica instantáneas al renderizado)
+SPRITE_CACHE_SIZE = 2048  # Sprites de criaturas en caché (LRU)
+SPRITE_ROTATIONS = 64  # Ángulos de rotación precalculados por sprite
+TEXT_CACHE_SIZE = 1024  # Superficies de texto en caché (LRU)
+SPATIAL_CELL_SIZE = 100  # Tamaño de celda del índice espacial (px)
+KNOWLEDGE_GRID = (16, 12)  # Rejilla de densidad del análisis del mundo (columnas, filas)
+KNOWLEDGE_HOTSPOTS = 4  # Celdas de comida más densas que se recuerdan
 
 # UI
 UI_PANEL_WIDTH = 350  # Aumentado para más información
 UI_FONT_SIZE = 14
 UI_BACKGROUND_COLOR = (40, 40, 50)
 UI_TEXT_COLOR = (220, 220, 220)
+STATS_REFRESH_HZ = 4  # Refrescos por segundo del panel de estadísticas
+
+# Historial de métricas (gráficos de evolución)
+METRICS_CAPACITY = 2000  # Muestras por nivel de resolución
+METRICS_DOWNSAMPLE = 10  # Factor de agregación entre niveles
+METRICS_LEVELS = 3       # Niveles: ciclo a ciclo, x10 y x100
+
+# Informe de memoria (tecla I o --headless)
+MEMORY_REPORT_TOP = 10         # Líneas de código con más crecimiento entre informes
+MEMORY_TRACE_FRAMES = 1        # Marcos de pila que guarda tracemalloc por reserva
+MEMORY_REPORT_INTERVAL = 1000  # Ciclos entre informes en modo headless
 
 # Debug
 DEBUG = {
@@ -83,7 +83,7 @@ def parallel_distance_check(creatures: List, x: float, y: float, radius: float)
 def parallel_update_infections(creatures: List, dt: float):
     """Actualizar infecciones en paralelo"""
     def update_infection(creature):
-        if hasattr(creature, 'infection') and creature.infection:
+        if creature.infection:
             return creature.update_infection(dt)
         return True
     
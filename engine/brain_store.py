@@ -0,0 +1,183 @@
+"""
+Almacén apilado de pesos neuronales de toda la población
+"""
+
+import numpy as np
+from typing import List, Optional, Sequence
+
+
+class BrainStore:
+    """Pesos de todas las redes neuronales en tensores (N, entrada, salida)
+
+    Cada criatura viva ocupa la fila de su slot en el SlotMap del mundo. Todos
+    los parámetros de una red viven en una fila de la matriz ``params``
+    (N, P); cada tensor es una vista (N, entrada, salida) de sus columnas. Las
+    redes adjuntas exponen vistas de su fila, así que el resto del código
+    sigue usando ``brain.weights_ih1`` sin cambios.
+
+    La memoria de corto plazo de cada red vive igual en la fila de su slot
+    de ``memory`` (N, oculta2): el procesado por lotes la lee y la escribe
+    en su sitio, sin que ninguna red quede apuntando a búferes de un lote.
+    """
+
+    # Nombres de los tensores (mismo nombre que el atributo de NeuralNetwork)
+    TENSORS = ('weights_ih1', 'weights_h1h2', 'weights_h2o', 'bias_h1', 'bias_h2', 'bias_o')
+
+    # Fuerza relativa de mutación por capa (más agresiva en capas tempranas)
+    LAYER_SCALES = {
+        'weights_ih1': 1.2,
+        'weights_h1h2': 1.0,
+        'weights_h2o': 0.8,
+        'bias_h1': 0.5,
+        'bias_h2': 0.5,
+        'bias_o': 0.5,
+    }
+
+    def __init__(self, input_size: int, hidden_size: int, output_size: int,
+                 capacity: int = 64, seed: Optional[int] = None):
+        self.input_size = input_size
+        self.hidden_size = hidden_size
+        self.hidden_size2 = hidden_size // 2
+        self.output_size = output_size
+
+        self.shapes = {
+            'weights_ih1': (input_size, hidden_size),
+            'weights_h1h2': (hidden_size, self.hidden_size2),
+            'weights_h2o': (self.hidden_size2, output_size),
+            'bias_h1': (hidden_size,),
+            'bias_h2': (self.hidden_size2,),
+            'bias_o': (output_size,),
+        }
+
+        # Columnas de cada tensor dentro de una fila de parámetros
+        self.columns = {}
+        offset = 0
+        for name in self.TENSORS:
+            size = int(np.prod(self.shapes[name]))
+            self.columns[name] = (offset, offset + size)
+            offset += size
+        self.param_count = offset
+
+        # Escala de mutación por columna (capa) y escala uniforme (herencia)
+        self.layer_scales = np.empty(self.param_count, dtype=np.float32)
+        for name, (start, end) in self.columns.items():
+            self.layer_scales[start:end] = self.LAYER_SCALES[name]
+        self.uniform_scales = np.ones(self.param_count, dtype=np.float32)
+
+        # Un único generador para todas las mutaciones de la población
+        self.rng = np.random.default_rng(seed)
+
+        self.capacity = 0
+        self.params = np.zeros((0, self.param_count), dtype=np.float32)
+        self.memory = np.zeros((0, self.hidden_size2), dtype=np.float32)
+        self.tensors = {}
+        self.brains: List[Optional[object]] = []  # fila -> red adjunta
+        self.reserve(capacity)
+
+    def reserve(self, capacity: int):
+        """Garantizar capacidad (crecimiento geométrico, reasigna vistas)"""
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, self.capacity * 2, 16)
+
+        grown = np.zeros((new_capacity, self.param_count), dtype=np.float32)
+        grown[:self.capacity] = self.params
+        self.params = grown
+        memory = np.zeros((new_capacity, self.hidden_size2), dtype=np.float32)
+        memory[:self.capacity] = self.memory
+        self.memory = memory
+        for name, (start, end) in self.columns.items():
+            self.tensors[name] = self.params[:, start:end].reshape((new_capacity,) + self.shapes[name])
+
+        self.brains.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+        # Las vistas antiguas apuntan a la memoria anterior: reasignarlas
+        for row, brain in enumerate(self.brains):
+            if brain is not None:
+                self._bind(row, brain)
+
+    def _bind(self, row: int, brain):
+        """Hacer que los pesos de la red sean vistas de su fila"""
+        for name in self.TENSORS:
+            setattr(brain, name, self.tensors[name][row])
+        brain.memory = self.memory[row]
+        brain.store = self
+        brain.row = row
+
+    def attach(self, row: int, brain):
+        """Copiar los pesos de una red a su fila y enlazarla"""
+        self.reserve(row + 1)
+        for name in self.TENSORS:
+            self.tensors[name][row] = getattr(brain, name)
+        self.memory[row] = brain.memory
+        self.brains[row] = brain
+        self._bind(row, brain)
+
+    def detach(self, row: int):
+        """Liberar fila (la red conserva una copia propia de sus pesos)"""
+        if row >= self.capacity:
+            return
+        brain = self.brains[row]
+        if brain is None:
+            return
+        for name in self.TENSORS:
+            setattr(brain, name, self.tensors[name][row].copy())
+        brain.memory = self.memory[row].copy()
+        brain.store = None
+        brain.row = None
+        self.brains[row] = None
+
+    def clear(self):
+        """Liberar todas las filas"""
+        for row, brain in enumerate(self.brains):
+            if brain is not None:
+                self.detach(row)
+
+    def mutate_rows(self, indices: Sequence[int], rate: float = 0.1, strength: float = 0.2,
+                    scales: Optional[np.ndarray] = None):
+        """Mutar los parámetros de varias filas con operaciones sobre el bloque completo
+
+        Cada parámetro muta con probabilidad ``rate`` sumando ruido normal de
+        desviación ``strength`` por la escala de su capa (1.2/1.0/0.8 en los
+        pesos, 0.5 en los bias, como NeuralNetwork.mutate).
+        """
+        if len(indices) == 0:
+            return
+        rows = np.asarray(indices, dtype=np.intp)
+        if scales is None:
+            scales = self.layer_scales
+
+        block = self.params[rows]
+        mask = self.rng.random(block.shape, dtype=np.float32) < rate
+        noise = self.rng.standard_normal(block.shape, dtype=np.float32)
+        noise *= scales * np.float32(strength)
+        block += noise * mask
+        self.params[rows] = block
+
+    def inherit_rows(self, child_rows: Sequence[int], children: Sequence, parents: Sequence,
+                     rate: float = 0.15, strength: float = 0.2):
+        """Heredar pesos de los padres con mutación, para todos los hijos a la vez
+
+        Copia los parámetros de cada padre en la fila de su hijo y muta el
+        bloque completo de hijos con ``mutate_rows`` (fuerza uniforme).
+        """
+        if not child_rows:
+            return
+        self.reserve(max(child_rows) + 1)
+        rows = np.asarray(child_rows, dtype=np.intp)
+
+        if all(p.store is self for p in parents):
+            # Padres en el almacén: copia directa fila a fila
+            self.params[rows] = self.params[np.asarray([p.row for p in parents], dtype=np.intp)]
+        else:
+            for row, parent in zip(child_rows, parents):
+                for name in self.TENSORS:
+                    self.tensors[name][row] = getattr(parent, name)
+
+        self.mutate_rows(rows, rate, strength, self.uniform_scales)
+        self.memory[rows] = 0  # Los hijos nacen sin memoria de corto plazo
+
+        for row, brain in zip(child_rows, children):
+            self.brains[row] = brain
+            self._bind(row, brain)
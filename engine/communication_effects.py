@@ -4,464 +4,425 @@ Las palabras tienen efectos reales en el comportamiento
 """
 
 import random
-import math
+from typing import List, NamedTuple
+import numpy as np
 import config
+from .vocal_system import WORDS
+
+
+class WordEvents(NamedTuple):
+    """Vocalizaciones de una misma palabra en el ciclo
+
+    Los índices son filas locales del lote (``EffectBatch``). Los pares
+    oyente-evento van ordenados por evento; ``rank`` es la posición del
+    oyente dentro de su evento.
+    """
+    speakers: np.ndarray  # Fila del hablante (por evento)
+    x: np.ndarray  # Posición del hablante al vocalizar (por evento)
+    y: np.ndarray
+    sizes: np.ndarray  # Oyentes por evento
+    starts: np.ndarray  # Primer par de cada evento
+    event: np.ndarray  # Evento de cada par
+    listeners: np.ndarray  # Fila del oyente (por par)
+    rank: np.ndarray  # Posición del oyente en su evento (por par)
+
+
+class EffectBatch:
+    """Estado de las criaturas implicadas en el ciclo y cambios acumulados
+
+    Las columnas se copian una vez al inicio; los efectos acumulan
+    impulsos, energía y fitness con ``np.add.at`` (y escalas de velocidad
+    con ``np.multiply.at``) y ``apply`` los suma al estado vivo al final,
+    así que lo que cambie entre medias (p. ej. una reproducción) se respeta.
+    """
+
+    def __init__(self, creatures: list):
+        self.creatures = creatures
+        n = len(creatures)
+        columns = np.array([(c.x, c.y, c.energy, c.max_energy, c.fitness, c.is_predator)
+                            for c in creatures], dtype=np.float64).reshape(n, 6)
+        self.x, self.y, self.energy, self.max_energy, self.fitness = columns[:, :5].T
+        self.predator = columns[:, 5] > 0
+
+        self.dvx = np.zeros(n)
+        self.dvy = np.zeros(n)
+        self.venergy = np.zeros(n)
+        self.vfitness = np.zeros(n)
+        self.vscale = np.ones(n)
+
+    def impulse(self, rows: np.ndarray, dx: np.ndarray, dy: np.ndarray,
+                distance: np.ndarray, force: float):
+        """Sumar un impulso de módulo ``force`` en la dirección (dx, dy)"""
+        np.add.at(self.dvx, rows, dx / distance * force)
+        np.add.at(self.dvy, rows, dy / distance * force)
+
+    def add_energy(self, rows: np.ndarray, amount):
+        np.add.at(self.venergy, rows, amount)
+
+    def add_fitness(self, rows: np.ndarray, amount):
+        np.add.at(self.vfitness, rows, amount)
+
+    def scale_velocity(self, rows: np.ndarray, factor: float):
+        np.multiply.at(self.vscale, rows, factor)
+
+    def apply(self):
+        """Escribir los cambios acumulados en las criaturas"""
+        for c, scale, dvx, dvy, energy, fitness in zip(
+                self.creatures, self.vscale.tolist(), self.dvx.tolist(), self.dvy.tolist(),
+                self.venergy.tolist(), self.vfitness.tolist()):
+            c.vx = c.vx * scale + dvx
+            c.vy = c.vy * scale + dvy
+            c.energy += energy
+            c.fitness += fitness
+
+
+def ranked(events: WordEvents, mask: np.ndarray) -> np.ndarray:
+    """Posición de cada par entre los que cumplen ``mask`` en su evento"""
+    count = np.cumsum(mask)
+    before = count[events.starts] - mask[events.starts]
+    return count - 1 - before[events.event]
+
+
+def first_per_event(events: WordEvents, mask: np.ndarray) -> np.ndarray:
+    """Índice del primer par de cada evento que cumple ``mask`` (-1 si ninguno)"""
+    first = np.full(len(events.speakers), len(mask), dtype=np.intp)
+    np.minimum.at(first, events.event[mask], np.nonzero(mask)[0])
+    first[first == len(mask)] = -1
+    return first
 
 
 class CommunicationEffects:
-    """Efectos de la comunicación avanzada entre criaturas"""
-    
-    @staticmethod
-    def apply_word_effect(speaker, listeners, word):
-        """Aplicar efecto de una palabra a las criaturas que la escuchan"""
-        
-        # === VOCABULARIO BÁSICO ===
-        if word == 'hambre':
-            # Efecto: Criaturas cercanas comparten ubicación de comida
-            CommunicationEffects._effect_hunger(speaker, listeners)
-        
-        elif word == 'datos':
-            # Efecto: Criaturas cercanas se mueven hacia la comida que ve el hablante
-            CommunicationEffects._effect_food_location(speaker, listeners)
-        
-        elif word == 'ayuda':
-            # Efecto: Criaturas cercanas se acercan para ayudar
-            CommunicationEffects._effect_help(speaker, listeners)
-        
-        elif word == 'hola':
-            # Efecto: Criaturas cercanas responden con pequeño bonus social
-            CommunicationEffects._effect_greeting(speaker, listeners)
-        
-        elif word == 'peligro':
-            # Efecto: Criaturas cercanas aumentan alerta y se alejan ligeramente
-            CommunicationEffects._effect_danger(speaker, listeners)
-        
-        elif word == 'bien':
-            # Efecto: Criaturas cercanas se relajan (reducen estrés)
-            CommunicationEffects._effect_good(speaker, listeners)
-        
-        elif word == 'malo':
-            # Efecto: Criaturas cercanas aumentan precaución
-            CommunicationEffects._effect_bad(speaker, listeners)
-        
-        # === VOCABULARIO AVANZADO ===
-        elif word == 'cohesion':
-            # Efecto: Criaturas cercanas se mueven hacia el hablante (cohesión de grupo)
-            CommunicationEffects._effect_cohesion(speaker, listeners)
-        
-        elif word == 'reproducir':
-            # Efecto: Estimula reproducción en criaturas cercanas con energía suficiente
-            CommunicationEffects._effect_reproduce(speaker, listeners)
-        
-        elif word == 'defender':
-            # Efecto: Criaturas cercanas aumentan fitness temporalmente (modo defensa)
-            CommunicationEffects._effect_defend(speaker, listeners)
-        
-        elif word == 'peligro_aqui':
-            # Efecto: Criaturas cercanas huyen de la ubicación del hablante
-            CommunicationEffects._effect_danger_here(speaker, listeners)
-        
-        elif word == 'seguir':
-            # Efecto: Criaturas cercanas siguen al hablante
-            CommunicationEffects._effect_follow(speaker, listeners)
-        
-        elif word == 'explorar':
-            # Efecto: Criaturas cercanas se dispersan para explorar
-            CommunicationEffects._effect_explore(speaker, listeners)
-        
-        elif word == 'descansar':
-            # Efecto: Criaturas cercanas reducen movimiento (conservar energía)
-            CommunicationEffects._effect_rest(speaker, listeners)
-        
-        elif word == 'atacar':
-            # Efecto: Criaturas depredadoras coordinan ataque
-            CommunicationEffects._effect_attack(speaker, listeners)
-        
-        elif word == 'huir':
-            # Efecto: Criaturas cercanas huyen en dirección opuesta a amenazas
-            CommunicationEffects._effect_flee(speaker, listeners)
-        
-        elif word == 'compartir':
-            # Efecto: Hablante comparte energía con criaturas débiles cercanas
-            CommunicationEffects._effect_share(speaker, listeners)
-    
-    # === EFECTOS DE VOCABULARIO BÁSICO ===
-    
-    @staticmethod
-    def _effect_hunger(speaker, listeners):
-        """Hambre: Criaturas cercanas comparten ubicación de comida (OPTIMIZADO)"""
-        # OPTIMIZACIÓN: Solo procesar primeras 5 criaturas
-        for creature in listeners[:5]:
-            if creature == speaker:
-                continue
-            
-            # OPTIMIZACIÓN: Solo bonus de fitness, sin búsqueda de comida
-            creature.fitness += 0.3
-        
-        speaker.fitness += 0.5
-    
-    @staticmethod
-    def _effect_food_location(speaker, listeners):
-        """Datos: Criaturas se mueven hacia la comida que ve el hablante (OPTIMIZADO)"""
-        # OPTIMIZACIÓN: Cachear búsqueda de comida una sola vez
-        nearby_food = speaker.world.get_data_near(speaker.x, speaker.y, 80)  # Radio reducido
-        if not nearby_food:
-            # Si no hay comida, solo dar bonus de fitness
-            speaker.fitness += 0.5
+    """Efectos de la comunicación avanzada entre criaturas
+
+    Las vocalizaciones del ciclo se encolan con ``emit`` (hablante, palabra
+    y posición, más sus oyentes) y ``flush`` las resuelve al final del
+    ciclo: una pasada por palabra con operaciones sobre arrays, despachada
+    por una tabla indexada por el id de la palabra.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self.rng = np.random.default_rng()
+        self._events: List[list] = [[] for _ in WORDS]  # id -> [(hablante, x, y, oyentes)]
+        self._pending = 0
+
+        effects = {
+            'hambre': self._effect_hunger,
+            'datos': self._effect_food_location,
+            'ayuda': self._effect_help,
+            'hola': self._effect_greeting,
+            'peligro': self._effect_danger,
+            'bien': self._effect_good,
+            'malo': self._effect_bad,
+            'cohesion': self._effect_cohesion,
+            'reproducir': self._effect_reproduce,
+            'defender': self._effect_defend,
+            'peligro_aqui': self._effect_danger_here,
+            'seguir': self._effect_follow,
+            'explorar': self._effect_explore,
+            'descansar': self._effect_rest,
+            'atacar': self._effect_attack,
+            'huir': self._effect_flee,
+            'compartir': self._effect_share,
+        }
+        self._handlers = [effects.get(word) for word in WORDS]
+
+    def __len__(self) -> int:
+        """Vocalizaciones pendientes"""
+        return self._pending
+
+    def emit(self, speaker, word_id: int, listeners: list):
+        """Encolar el efecto de una palabra (id del registro) para el final del ciclo"""
+        if self._handlers[word_id] is None:
             return
-        
-        food = nearby_food[0]  # Comida más cercana al hablante
-        
-        # OPTIMIZACIÓN: Solo procesar primeras 5 criaturas hambrientas
-        processed = 0
-        for creature in listeners:
-            if creature == speaker or processed >= 5:
-                continue
-            
-            # Criaturas hambrientas responden más
-            if creature.energy < creature.max_energy * 0.5:
-                dx = food['x'] - creature.x
-                dy = food['y'] - creature.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance > 0 and distance < 150:  # Radio reducido
-                    force = 0.2  # Fuerza reducida
-                    creature.vx += (dx / distance) * force
-                    creature.vy += (dy / distance) * force
-                    creature.fitness += 0.3
-                    processed += 1
-        
-        speaker.fitness += 1
-        
-        if processed > 0 and config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"🍽️  Criatura {speaker.id} señaló comida - {processed} criaturas responden")
-    
-    @staticmethod
-    def _effect_help(speaker, listeners):
-        """Ayuda: Criaturas cercanas se acercan para ayudar"""
-        helped = 0
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Solo criaturas con energía suficiente pueden ayudar
-            if creature.energy > creature.max_energy * 0.4:
-                # Moverse hacia el que pide ayuda
-                dx = speaker.x - creature.x
-                dy = speaker.y - creature.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance > 0 and distance < 150:
-                    force = 0.3
-                    creature.vx += (dx / distance) * force
-                    creature.vy += (dy / distance) * force
-                    
-                    # Transferir pequeña cantidad de energía
-                    if distance < 30:
-                        transfer = min(5, creature.energy * 0.05)
-                        creature.energy -= transfer
-                        speaker.energy += transfer
-                        creature.fitness += 1
-                        helped += 1
-        
-        if helped > 0:
-            speaker.fitness += 2
-            if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-                print(f"🆘 Criatura {speaker.id} pidió ayuda - {helped} criaturas respondieron")
-    
-    @staticmethod
-    def _effect_greeting(speaker, listeners):
-        """Hola: Bonus social por saludo"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Pequeño bonus de fitness por interacción social
-            creature.fitness += 0.2
-            speaker.fitness += 0.2
-            
-            # Si son similares genéticamente, bonus extra
-            if hasattr(speaker, 'calculate_genetic_similarity'):
-                similarity = speaker.calculate_genetic_similarity(creature)
-                if similarity > 0.7:
-                    creature.fitness += 0.3
-                    speaker.fitness += 0.3
-    
-    @staticmethod
-    def _effect_danger(speaker, listeners):
-        """Peligro: Criaturas aumentan alerta y se alejan"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Alejarse ligeramente del hablante (zona de peligro)
-            dx = creature.x - speaker.x
-            dy = creature.y - speaker.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance > 0 and distance < 100:
-                force = 0.2
-                creature.vx += (dx / distance) * force
-                creature.vy += (dy / distance) * force
-                creature.fitness += 0.3  # Bonus por reaccionar a alerta
-        
-        speaker.fitness += 1
-        
-        if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"⚡ Criatura {speaker.id} alertó peligro - {len(listeners)-1} criaturas en alerta")
-    
-    @staticmethod
-    def _effect_good(speaker, listeners):
-        """Bien: Criaturas se relajan (reducen estrés)"""
-        for creature in listeners:
-            if creature == speaker:
+        listeners = [c for c in listeners if c is not speaker]
+        if not listeners:
+            return
+        self._events[word_id].append((speaker, speaker.x, speaker.y, listeners))
+        self._pending += 1
+
+    def clear(self):
+        """Descartar vocalizaciones pendientes"""
+        for events in self._events:
+            events.clear()
+        self._pending = 0
+
+    def flush(self):
+        """Aplicar todos los efectos encolados en el ciclo"""
+        if not self._pending:
+            return
+
+        # Filas locales para todas las criaturas implicadas
+        creatures, rows = [], {}
+        for events in self._events:
+            for speaker, _, _, listeners in events:
+                for c in (speaker, *listeners):
+                    if id(c) not in rows:
+                        rows[id(c)] = len(creatures)
+                        creatures.append(c)
+        batch = EffectBatch(creatures)
+
+        for word_id, events in enumerate(self._events):
+            if not events:
                 continue
-            
-            # Reducir velocidad ligeramente (relajación)
-            creature.vx *= 0.9
-            creature.vy *= 0.9
-            
-            # Pequeño bonus de energía (estado positivo)
-            creature.energy += 0.5
-            creature.fitness += 0.2
-        
-        speaker.fitness += 0.5
-    
+            sizes = np.fromiter((len(e[3]) for e in events), dtype=np.intp, count=len(events))
+            starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            event = np.repeat(np.arange(len(events)), sizes)
+            group = WordEvents(
+                speakers=np.fromiter((rows[id(e[0])] for e in events), dtype=np.intp,
+                                     count=len(events)),
+                x=np.fromiter((e[1] for e in events), dtype=np.float64, count=len(events)),
+                y=np.fromiter((e[2] for e in events), dtype=np.float64, count=len(events)),
+                sizes=sizes,
+                starts=starts,
+                event=event,
+                listeners=np.fromiter((rows[id(c)] for e in events for c in e[3]),
+                                      dtype=np.intp, count=int(sizes.sum())),
+                rank=np.arange(len(event)) - starts[event]
+            )
+            self._handlers[word_id](batch, group)
+
+        self.clear()
+        batch.apply()
+
+    def _log(self, batch: EffectBatch, events: WordEvents, message: str, counts=None):
+        """Mensaje por evento (solo los que afectaron a alguien si hay ``counts``)"""
+        if not config.DEBUG.get('LOG_VOCALIZATIONS', False):
+            return
+        counts = events.sizes if counts is None else counts
+        for speaker, count in zip(events.speakers.tolist(), counts.tolist()):
+            if count > 0:
+                print(message.format(id=batch.creatures[speaker].id, count=count))
+
     @staticmethod
-    def _effect_bad(speaker, listeners):
-        """Malo: Criaturas aumentan precaución"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Aumentar alerta (pequeño boost de velocidad)
-            if creature.energy > creature.max_energy * 0.3:
-                creature.vx *= 1.1
-                creature.vy *= 1.1
-                creature.fitness += 0.2
-        
-        speaker.fitness += 0.3
-    
+    def _to_speaker(batch: EffectBatch, events: WordEvents):
+        """Vector oyente -> hablante y distancia de cada par"""
+        dx = events.x[events.event] - batch.x[events.listeners]
+        dy = events.y[events.event] - batch.y[events.listeners]
+        return dx, dy, np.hypot(dx, dy)
+
+    # === EFECTOS DE VOCABULARIO BÁSICO ===
+
+    def _effect_hunger(self, batch, events):
+        """Hambre: Bonus de fitness a los primeros 5 oyentes (sin búsqueda de comida)"""
+        batch.add_fitness(events.listeners[events.rank < 5], 0.3)
+        batch.add_fitness(events.speakers, 0.5)
+
+    def _effect_food_location(self, batch, events):
+        """Datos: Oyentes hambrientos se mueven hacia la comida que ve el hablante"""
+        food = self.world.data_items
+        has_food = np.zeros(len(events.speakers), dtype=bool)
+        food_x = np.zeros(len(events.speakers))
+        food_y = np.zeros(len(events.speakers))
+        if len(food):
+            # Comida más cercana a cada hablante (radio 80)
+            dist_sq = ((food.xs[None, :] - events.x[:, None]) ** 2 +
+                       (food.ys[None, :] - events.y[:, None]) ** 2)
+            nearest = np.argmin(dist_sq, axis=1)
+            has_food = dist_sq[np.arange(len(nearest)), nearest] < 80 * 80
+            food_x = food.xs[nearest]
+            food_y = food.ys[nearest]
+
+        # Sin comida a la vista solo hay bonus de fitness
+        batch.add_fitness(events.speakers, np.where(has_food, 1.0, 0.5))
+
+        listeners = events.listeners
+        dx = food_x[events.event] - batch.x[listeners]
+        dy = food_y[events.event] - batch.y[listeners]
+        distance = np.hypot(dx, dy)
+        hungry = batch.energy[listeners] < batch.max_energy[listeners] * 0.5
+        respond = has_food[events.event] & hungry & (distance > 0) & (distance < 150)
+        respond &= ranked(events, respond) < 5  # Solo las primeras 5
+
+        batch.impulse(listeners[respond], dx[respond], dy[respond], distance[respond], 0.2)
+        batch.add_fitness(listeners[respond], 0.3)
+        self._log(batch, events, "🍽️  Criatura {id} señaló comida - {count} criaturas responden",
+                  np.bincount(events.event[respond], minlength=len(events.speakers)))
+
+    def _effect_help(self, batch, events):
+        """Ayuda: Oyentes con energía se acercan y transfieren energía"""
+        listeners = events.listeners
+        dx, dy, distance = self._to_speaker(batch, events)
+        respond = ((batch.energy[listeners] > batch.max_energy[listeners] * 0.4) &
+                   (distance > 0) & (distance < 150))
+        batch.impulse(listeners[respond], dx[respond], dy[respond], distance[respond], 0.3)
+
+        # Transferir pequeña cantidad de energía a los que están cerca
+        close = respond & (distance < 30)
+        transfer = np.minimum(5, batch.energy[listeners[close]] * 0.05)
+        batch.add_energy(listeners[close], -transfer)
+        batch.add_energy(events.speakers[events.event[close]], transfer)
+        batch.add_fitness(listeners[close], 1)
+
+        helped = np.bincount(events.event[close], minlength=len(events.speakers))
+        batch.add_fitness(events.speakers[helped > 0], 2)
+        self._log(batch, events, "🆘 Criatura {id} pidió ayuda - {count} criaturas respondieron",
+                  helped)
+
+    def _effect_greeting(self, batch, events):
+        """Hola: Bonus social por saludo (extra entre genéticamente similares)"""
+        speakers = events.speakers[events.event]
+        similarity = np.fromiter(
+            (batch.creatures[s].calculate_genetic_similarity(batch.creatures[l])
+             for s, l in zip(speakers.tolist(), events.listeners.tolist())),
+            dtype=np.float64, count=len(speakers))
+        bonus = np.where(similarity > 0.7, 0.5, 0.2)
+        batch.add_fitness(events.listeners, bonus)
+        batch.add_fitness(speakers, bonus)
+
+    def _effect_danger(self, batch, events):
+        """Peligro: Oyentes cercanos se alejan del hablante"""
+        dx, dy, distance = self._to_speaker(batch, events)
+        respond = (distance > 0) & (distance < 100)
+        listeners = events.listeners[respond]
+        batch.impulse(listeners, -dx[respond], -dy[respond], distance[respond], 0.2)
+        batch.add_fitness(listeners, 0.3)  # Bonus por reaccionar a alerta
+        batch.add_fitness(events.speakers, 1)
+        self._log(batch, events, "⚡ Criatura {id} alertó peligro - {count} criaturas en alerta")
+
+    def _effect_good(self, batch, events):
+        """Bien: Oyentes se relajan (menos velocidad, algo de energía)"""
+        batch.scale_velocity(events.listeners, 0.9)
+        batch.add_energy(events.listeners, 0.5)
+        batch.add_fitness(events.listeners, 0.2)
+        batch.add_fitness(events.speakers, 0.5)
+
+    def _effect_bad(self, batch, events):
+        """Malo: Oyentes con energía aumentan la alerta"""
+        listeners = events.listeners
+        alert = listeners[batch.energy[listeners] > batch.max_energy[listeners] * 0.3]
+        batch.scale_velocity(alert, 1.1)
+        batch.add_fitness(alert, 0.2)
+        batch.add_fitness(events.speakers, 0.3)
+
     # === EFECTOS DE VOCABULARIO AVANZADO ===
-    
-    @staticmethod
-    def _effect_cohesion(speaker, listeners):
-        """Cohesión: Criaturas se mueven hacia el hablante (OPTIMIZADO)"""
-        # OPTIMIZACIÓN: Solo procesar primeras 8 criaturas
-        processed = 0
-        for creature in listeners:
-            if creature == speaker or processed >= 8:
-                continue
-            
-            # Calcular dirección hacia el hablante
-            dx = speaker.x - creature.x
-            dy = speaker.y - creature.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance > 0 and distance < 120:  # Radio reducido
-                # Aplicar fuerza de atracción
-                force = 0.25  # Fuerza reducida
-                creature.vx += (dx / distance) * force
-                creature.vy += (dy / distance) * force
-                
-                # Bonus de fitness por cohesión
-                creature.fitness += 0.4
-                processed += 1
-        
-        speaker.fitness += 2
-        
-        if processed > 0 and config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"🤝 Criatura {speaker.id} llamó a cohesión - {processed} criaturas responden")
-    
-    @staticmethod
-    def _effect_reproduce(speaker, listeners):
-        """Reproducir: Estimula reproducción en grupo"""
-        reproduced = 0
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            if creature.can_reproduce() and random.random() < 0.3:  # 30% de reproducirse
+
+    def _effect_cohesion(self, batch, events):
+        """Cohesión: Hasta 8 oyentes se mueven hacia el hablante"""
+        dx, dy, distance = self._to_speaker(batch, events)
+        respond = (distance > 0) & (distance < 120)
+        respond &= ranked(events, respond) < 8
+        listeners = events.listeners[respond]
+        batch.impulse(listeners, dx[respond], dy[respond], distance[respond], 0.25)
+        batch.add_fitness(listeners, 0.4)
+        batch.add_fitness(events.speakers, 2)
+        self._log(batch, events, "🤝 Criatura {id} llamó a cohesión - {count} criaturas responden",
+                  np.bincount(events.event[respond], minlength=len(events.speakers)))
+
+    def _effect_reproduce(self, batch, events):
+        """Reproducir: Estimula reproducción en grupo (30% de los que pueden)"""
+        reproduced = np.zeros(len(events.speakers), dtype=np.intp)
+        for event, row in zip(events.event.tolist(), events.listeners.tolist()):
+            creature = batch.creatures[row]
+            if creature.can_reproduce() and random.random() < 0.3:
                 creature.reproduce()
-                reproduced += 1
-        
-        if reproduced > 0 and config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"👶 Criatura {speaker.id} estimuló reproducción - {reproduced} criaturas se reprodujeron")
-    
-    @staticmethod
-    def _effect_defend(speaker, listeners):
-        """Defender: Modo defensa aumenta fitness temporalmente"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Bonus temporal de fitness (modo defensa)
-            creature.fitness += 5
-            creature.energy += 3  # Adrenalina
-        
-        speaker.fitness += 3
-        
-        if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"🛡️  Criatura {speaker.id} activó defensa - {len(listeners)-1} criaturas")
-    
-    @staticmethod
-    def _effect_danger_here(speaker, listeners):
-        """Peligro aquí: Criaturas huyen de esta ubicación"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Calcular dirección opuesta al hablante
-            dx = creature.x - speaker.x
-            dy = creature.y - speaker.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance > 0 and distance < 100:
-                # Aplicar fuerza de repulsión (huir)
-                force = 0.5
-                creature.vx += (dx / distance) * force
-                creature.vy += (dy / distance) * force
-        
-        if config.DEBUG.get('LOG_VOCALIZATIONS', False) and random.random() < 0.1:
-            print(f"⚠️  Criatura {speaker.id} alertó peligro - {len(listeners)-1} criaturas huyen")
-    
-    @staticmethod
-    def _effect_follow(speaker, listeners):
-        """Seguir: Criaturas siguen al líder"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Solo criaturas con menos fitness siguen al líder
-            if creature.fitness < speaker.fitness:
-                # Calcular dirección hacia el líder
-                dx = speaker.x - creature.x
-                dy = speaker.y - creature.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance > 30 and distance < 200:  # Mantener distancia
-                    force = 0.2
-                    creature.vx += (dx / distance) * force
-                    creature.vy += (dy / distance) * force
-                    creature.fitness += 0.3
-        
-        speaker.fitness += 3  # Bonus por liderazgo
-        
-        if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"👑 Criatura {speaker.id} lidera grupo")
-    
-    @staticmethod
-    def _effect_explore(speaker, listeners):
-        """Explorar: Criaturas se dispersan"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Aplicar velocidad aleatoria para dispersión
-            if random.random() < 0.5:
-                angle = random.uniform(0, 2 * math.pi)
-                force = 0.4
-                creature.vx += math.cos(angle) * force
-                creature.vy += math.sin(angle) * force
-                creature.fitness += 0.5
-        
-        if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"🔍 Criatura {speaker.id} inició exploración")
-    
-    @staticmethod
-    def _effect_rest(speaker, listeners):
+                reproduced[event] += 1
+        self._log(batch, events, "👶 Criatura {id} estimuló reproducción - {count} criaturas se reprodujeron",
+                  reproduced)
+
+    def _effect_defend(self, batch, events):
+        """Defender: Modo defensa (fitness y adrenalina)"""
+        batch.add_fitness(events.listeners, 5)
+        batch.add_energy(events.listeners, 3)
+        batch.add_fitness(events.speakers, 3)
+        self._log(batch, events, "🛡️  Criatura {id} activó defensa - {count} criaturas")
+
+    def _effect_danger_here(self, batch, events):
+        """Peligro aquí: Oyentes huyen de la ubicación del hablante"""
+        dx, dy, distance = self._to_speaker(batch, events)
+        respond = (distance > 0) & (distance < 100)
+        batch.impulse(events.listeners[respond], -dx[respond], -dy[respond], distance[respond], 0.5)
+
+    def _effect_follow(self, batch, events):
+        """Seguir: Oyentes con menos fitness siguen al líder"""
+        dx, dy, distance = self._to_speaker(batch, events)
+        listeners = events.listeners
+        respond = ((batch.fitness[listeners] < batch.fitness[events.speakers[events.event]]) &
+                   (distance > 30) & (distance < 200))
+        batch.impulse(listeners[respond], dx[respond], dy[respond], distance[respond], 0.2)
+        batch.add_fitness(listeners[respond], 0.3)
+        batch.add_fitness(events.speakers, 3)  # Bonus por liderazgo
+        self._log(batch, events, "👑 Criatura {id} lidera grupo")
+
+    def _effect_explore(self, batch, events):
+        """Explorar: La mitad de los oyentes se dispersa en direcciones aleatorias"""
+        respond = self.rng.random(len(events.listeners)) < 0.5
+        listeners = events.listeners[respond]
+        angle = self.rng.uniform(0, 2 * np.pi, len(listeners))
+        batch.impulse(listeners, np.cos(angle), np.sin(angle), np.ones(len(listeners)), 0.4)
+        batch.add_fitness(listeners, 0.5)
+        self._log(batch, events, "🔍 Criatura {id} inició exploración")
+
+    def _effect_rest(self, batch, events):
         """Descansar: Reducir movimiento para conservar energía"""
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Reducir velocidad
-            creature.vx *= 0.5
-            creature.vy *= 0.5
-            
-            # Pequeño bonus de energía por descansar
-            creature.energy += 1
-        
-        if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-            print(f"😴 Criatura {speaker.id} llamó a descansar")
-    
-    @staticmethod
-    def _effect_attack(speaker, listeners):
-        """Atacar: Coordinar ataque entre depredadores (OPTIMIZADO)"""
+        batch.scale_velocity(events.listeners, 0.5)
+        batch.add_energy(events.listeners, 1)
+        self._log(batch, events, "😴 Criatura {id} llamó a descansar")
+
+    def _effect_attack(self, batch, events):
+        """Atacar: Hasta 2 depredadores de los 5 primeros oyentes van a por una presa"""
         if not config.PREDATION_ENABLED:
             return
-        
-        # OPTIMIZACIÓN: Filtrar depredadores de listeners (ya limitados)
-        predators = [c for c in listeners[:5] if hasattr(c, 'is_predator') and c.is_predator]
-        
-        if len(predators) >= 2:
-            # OPTIMIZACIÓN: Buscar solo en listeners, no hacer búsqueda adicional
-            for prey in listeners[:8]:  # Solo primeras 8
-                if prey not in predators and prey != speaker:
-                    # Coordinar ataque (máximo 2 atacantes para reducir carga)
-                    for predator in predators[:2]:
-                        if predator.fitness > prey.fitness * 1.2:
-                            # Mover hacia la presa
-                            dx = prey.x - predator.x
-                            dy = prey.y - predator.y
-                            distance = math.sqrt(dx**2 + dy**2)
-                            
-                            if distance > 0:
-                                force = 0.3  # Fuerza reducida
-                                predator.vx += (dx / distance) * force
-                                predator.vy += (dy / distance) * force
-                    
-                    if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-                        print(f"🎯 Criatura {speaker.id} coordinó ataque contra #{prey.id}")
-                    break
-    
-    @staticmethod
-    def _effect_flee(speaker, listeners):
-        """Huir: Grupo huye de amenazas (OPTIMIZADO)"""
-        # OPTIMIZACIÓN: Buscar amenazas solo en listeners
-        threats = [c for c in listeners[:5] if hasattr(c, 'is_predator') and c.is_predator]
-        
-        if threats:
-            threat = threats[0]
-            
-            for creature in listeners:
-                if creature == speaker or creature in threats:
-                    continue
-                
-                # Huir de la amenaza
-                dx = creature.x - threat.x
-                dy = creature.y - threat.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance > 0 and distance < 150:
-                    force = 0.6
-                    creature.vx += (dx / distance) * force
-                    creature.vy += (dy / distance) * force
-            
-            if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-                print(f"🏃 Criatura {speaker.id} ordenó huida")
-    
-    @staticmethod
-    def _effect_share(speaker, listeners):
-        """Compartir: Transferir energía a criaturas débiles"""
-        if speaker.energy < speaker.max_energy * 0.5:
-            return  # No compartir si está débil
-        
-        shared = 0
-        for creature in listeners:
-            if creature == speaker:
-                continue
-            
-            # Compartir con criaturas débiles
-            if creature.energy < creature.max_energy * 0.3:
-                transfer = min(10, speaker.energy * 0.1)
-                speaker.energy -= transfer
-                creature.energy += transfer
-                creature.fitness += 2
-                shared += 1
-        
-        if shared > 0:
-            speaker.fitness += shared * 3  # Bonus por altruismo
-            
-            if config.DEBUG.get('LOG_VOCALIZATIONS', False):
-                print(f"💝 Criatura {speaker.id} compartió energía con {shared} criaturas débiles")
+        listeners = events.listeners
+        predators = batch.predator[listeners] & (events.rank < 5)
+        coordinated = np.bincount(events.event[predators], minlength=len(events.speakers)) >= 2
+
+        # Presa: primer oyente de los 8 primeros que no es depredador del grupo
+        prey = first_per_event(events, ~predators & (events.rank < 8) & coordinated[events.event])
+        has_prey = prey >= 0
+        prey_row = listeners[prey]
+
+        attack = predators & has_prey[events.event] & (ranked(events, predators) < 2)
+        attack &= batch.fitness[listeners] > batch.fitness[prey_row[events.event]] * 1.2
+        dx = batch.x[prey_row[events.event]] - batch.x[listeners]
+        dy = batch.y[prey_row[events.event]] - batch.y[listeners]
+        distance = np.hypot(dx, dy)
+        attack &= distance > 0
+        batch.impulse(listeners[attack], dx[attack], dy[attack], distance[attack], 0.3)
+
+        if config.DEBUG.get('LOG_VOCALIZATIONS', False):
+            for speaker, row in zip(events.speakers[has_prey].tolist(), prey_row[has_prey].tolist()):
+                print(f"🎯 Criatura {batch.creatures[speaker].id} coordinó ataque contra "
+                      f"#{batch.creatures[row].id}")
+
+    def _effect_flee(self, batch, events):
+        """Huir: Oyentes huyen del primer depredador entre los 5 primeros"""
+        listeners = events.listeners
+        threats = batch.predator[listeners] & (events.rank < 5)
+        threat = first_per_event(events, threats)
+        has_threat = threat >= 0
+        threat_row = listeners[threat][events.event]
+
+        dx = batch.x[listeners] - batch.x[threat_row]
+        dy = batch.y[listeners] - batch.y[threat_row]
+        distance = np.hypot(dx, dy)
+        flee = has_threat[events.event] & ~threats & (distance > 0) & (distance < 150)
+        batch.impulse(listeners[flee], dx[flee], dy[flee], distance[flee], 0.6)
+        self._log(batch, events, "🏃 Criatura {id} ordenó huida", has_threat.astype(np.intp))
+
+    def _effect_share(self, batch, events):
+        """Compartir: El hablante cede energía a los oyentes débiles
+
+        Cada transferencia es min(10, 10% de la energía que le queda al
+        hablante): se calcula en forma cerrada a partir de la posición del
+        oyente entre los débiles (10 fijos mientras le queden 100 o más,
+        luego decae un 10% por oyente).
+        """
+        listeners = events.listeners
+        speaker_energy = batch.energy[events.speakers]
+        strong = speaker_energy >= batch.max_energy[events.speakers] * 0.5
+        weak = strong[events.event] & (batch.energy[listeners] < batch.max_energy[listeners] * 0.3)
+
+        energy = speaker_energy[events.event[weak]]
+        k = ranked(events, weak)[weak]
+        capped = np.where(energy >= 100, np.floor((energy - 100) / 10) + 1, 0)
+        transfer = np.where(k < capped, 10.0,
+                            0.1 * (energy - 10 * capped) * 0.9 ** np.maximum(k - capped, 0))
+
+        batch.add_energy(listeners[weak], transfer)
+        batch.add_energy(events.speakers[events.event[weak]], -transfer)
+        batch.add_fitness(listeners[weak], 2)
+        shared = np.bincount(events.event[weak], minlength=len(events.speakers))
+        batch.add_fitness(events.speakers, shared * 3)  # Bonus por altruismo
+        self._log(batch, events, "💝 Criatura {id} compartió energía con {count} criaturas débiles",
+                  shared)
@@ -10,6 +10,7 @@ import config
 from .genome import Genome
 from .neural_net import NeuralNetwork
 from .vocal_system import VocalSystem
+from .knowledge_system import CreatureIntelligence
 
 
 # Contador global de IDs
@@ -24,9 +25,26 @@ def get_next_id():
 class Creature:
     """Ser digital que evoluciona y aprende"""
     
-    def __init__(self, x: float, y: float, world, parent=None):
+    # Todos los atributos declarados (sin __dict__): los opcionales valen None
+    __slots__ = (
+        'id', 'world', 'handle', 'species_id', 'custom_name',
+        # Posición y movimiento
+        'x', 'y', 'vx', 'vy', 'direction', 'last_x', 'last_y', 'distance_traveled',
+        # Genética y estado vital
+        'genome', 'generation', 'complexity', 'max_energy', 'vocal_development',
+        'age', 'energy', 'brain', 'fitness', 'food_eaten',
+        # Comportamientos y subsistemas
+        'is_predator', 'kills', 'infection', 'vocal_system', 'intelligence',
+        # Apariencia
+        'size', 'color',
+    )
+    
+    def __init__(self, x: float, y: float, world, parent=None, deferred_brain: bool = False):
         self.id = get_next_id()
         self.world = world
+        self.handle = None  # (slot, generación) asignado por el SlotMap del mundo
+        self.species_id = None  # Asignado por el SpeciesTracker del mundo
+        self.custom_name = None  # Nombre puesto por el usuario
         
         # Posición y movimiento
         self.x = x
@@ -62,12 +80,14 @@ class Creature:
         self.energy = config.INITIAL_ENERGY  # Siempre empezar con energía inicial
         
         # Red neuronal (heredar del padre si existe)
+        # Con deferred_brain los pesos los escribe World en lote (BrainStore.inherit_rows)
         parent_brain = parent.brain if parent else None
         self.brain = NeuralNetwork(
             config.NEURAL_INPUT_SIZE,
             config.NEURAL_HIDDEN_SIZE,
             config.NEURAL_OUTPUT_SIZE,
-            parent=parent_brain
+            parent=parent_brain,
+            initialize=not deferred_brain
         )
         
         # Sistema de fitness (recompensas/castigos)
@@ -88,25 +108,36 @@ class Creature:
         self.is_predator = False
         self.kills = 0  # Contador de presas cazadas
         
-        # Sistema vocal
-        self.vocal_system = VocalSystem(self)
+        # Enfermedad activa (la asigna el DiseaseSystem)
+        self.infection = None
+        
+        # Sistema vocal (se crea al cruzar COMPLEXITY_THRESHOLD_VOCAL)
+        self.vocal_system = None
+        if self.complexity >= config.COMPLEXITY_THRESHOLD_VOCAL:
+            self.vocal_system = VocalSystem(self)
         
         # Sistema de inteligencia (solo para criaturas muy avanzadas)
         self.intelligence = None
         if self.complexity >= 1500:
-            from .knowledge_system import CreatureIntelligence
             self.intelligence = CreatureIntelligence(self, self.world.knowledge_base)
         
-        # Memoria
-        self.memory = []
-        self.memory_size = 20
-        
         # Apariencia
         self.size = config.CREATURE_SIZE_BASE
         self.color = self.calculate_color()
     
     def update(self, dt: float):
         """Actualizar criatura (OPTIMIZADO)"""
+        # Consumir energía antes de pensar (la urgencia del instinto depende de ella)
+        self.consume_energy(dt)
+        
+        # Pensar (red neuronal) - SIEMPRE, es crítico
+        self.think(dt)
+        
+        # Resto del tick: idéntico en el camino escalar y en el de lotes
+        self.update_non_neural(dt)
+    
+    def consume_energy(self, dt: float):
+        """Envejecer y pagar el coste energético del tick"""
         self.age += dt
         
         # Consumir energía (BALANCEADO v2.8 - favorece criaturas avanzadas)
@@ -118,112 +149,40 @@ class Creature:
         energy_cost = (base_cost + complexity_cost) * efficiency
         
         self.energy -= energy_cost
-        
-        # Pensar (red neuronal) - SIEMPRE, es crítico
-        self.think(dt)
-        
-        # Mover - SIEMPRE, es crítico
-        self.move(dt)
-        
-        # Buscar alimento - SIEMPRE, es crítico
-        self.seek_food()
-        
-        # Intentar reproducirse - Solo cada 10 frames para optimizar
-        if self.age % 10 < dt:  # Aproximadamente cada 10 ciclos
-            if self.can_reproduce():
-                self.reproduce()
-        
-        # Vocalizar si es apropiado - OPTIMIZADO: Reducida frecuencia para mejor rendimiento
-        if self.can_vocalize() and random.random() < 0.01:  # 1% por frame (reducido de 2% para rendimiento)
-            self.vocal_system.vocalize()
-        
-        # Sistema de inteligencia avanzada (solo criaturas muy inteligentes)
+    
+    def update_intelligence(self, dt: float):
+        """Sistema de inteligencia avanzada (solo criaturas muy inteligentes)"""
         if self.intelligence:
             self.intelligence.analyze_environment(dt)
-        elif self.complexity >= 1500 and not self.intelligence:
+        elif self.complexity >= 1500:
             # Criatura alcanzó inteligencia suficiente, activar sistema
-            from .knowledge_system import CreatureIntelligence
             self.intelligence = CreatureIntelligence(self, self.world.knowledge_base)
             if config.DEBUG.get('LOG_INTELLIGENCE', False):
                 print(f"🧠 Criatura {self.id} alcanzó inteligencia avanzada (comp: {self.complexity:.0f})")
-        
-        # Actualizar apariencia - Solo cada 5 frames
-        if self.age % 5 < dt:
-            self.update_appearance()
-        
-        # NUEVOS COMPORTAMIENTOS v2.8
-        # Actualizar infección si existe
-        if not self.update_infection(dt):
-            return  # Criatura murió por enfermedad
-        
-        # Intentar depredación (solo criaturas avanzadas)
-        if self.age % 20 < dt:  # Cada 20 ciclos
-            self.try_predation(dt)
-        
-        # Intentar colaboración (solo criaturas desarrolladas)
-        if self.age % 15 < dt:  # Cada 15 ciclos
-            self.try_collaboration(dt)
-        
-        # Intentar comunicación (solo criaturas complejas)
-        if self.age % 10 < dt:  # Cada 10 ciclos
-            self.try_communication(dt)
+    
+    def is_due(self, behavior: str) -> bool:
+        """¿Toca ejecutar un comportamiento periódico en este tick?"""
+        if self.handle is None:
+            return False  # Aún no registrada en el mundo
+        return self.world.scheduler.due(behavior, self.handle[0])
     
     def think(self, dt: float):
         """Procesar información con INSTINTO BÁSICO + red neuronal"""
-        # INSTINTO BÁSICO: Siempre buscar alimento si hay hambre
-        # Esto garantiza comportamiento mínimo incluso con red neuronal débil
-        
-        # Balance instinto/IA según complejidad (EVOLUTIVO)
-        # Primitivas: 80% instinto, 20% IA
-        # Intermedias: 60% instinto, 40% IA
-        # Avanzadas: 40% instinto, 60% IA
-        # Complejas: 20% instinto, 80% IA
-        instinct_strength = max(0.2, 0.8 - (self.complexity / 1000))
-        
-        # Instinto: buscar alimento más cercano
-        nearest_food = self.find_nearest_food()
-        instinct_x = 0
-        instinct_y = 0
-        
-        if nearest_food:
-            dx = nearest_food['x'] - self.x
-            dy = nearest_food['y'] - self.y
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist > 0:
-                # Normalizar y aplicar urgencia
-                urgency = 1.0 - (self.energy / self.max_energy)
-                instinct_x = (dx / dist) * urgency
-                instinct_y = (dy / dist) * urgency
-        else:
-            # Sin alimento visible: exploración aleatoria
-            instinct_x = random.uniform(-0.5, 0.5)
-            instinct_y = random.uniform(-0.5, 0.5)
-        
         # Red neuronal (solo si la criatura es compleja)
-        neural_x = 0
-        neural_y = 0
-        
-        if self.complexity > 50:  # Solo usar red neuronal si hay algo de desarrollo
+        outputs = None
+        if self.uses_brain():
             try:
-                inputs = self.get_sensor_inputs()
-                outputs = self.brain.forward(inputs)
-                
-                # Verificar que outputs tenga al menos 4 elementos
-                if len(outputs) >= 4:
-                    # Outputs: [arriba, abajo, izquierda, derecha]
-                    neural_y = outputs[0] - outputs[1]
-                    neural_x = outputs[3] - outputs[2]
+                outputs = self.brain.forward(self.get_sensor_inputs())
             except Exception as e:
                 # Si hay error, usar solo instinto
                 pass
         
-        # Combinar instinto + red neuronal
-        move_x = instinct_x * instinct_strength + neural_x * (1 - instinct_strength)
-        move_y = instinct_y * instinct_strength + neural_y * (1 - instinct_strength)
-        
-        # Aplicar movimiento
-        self.apply_movement(move_x, move_y)
+        # Combinar con el instinto y mover
+        self.apply_neural_outputs(outputs)
+    
+    def uses_brain(self) -> bool:
+        """¿Ejecuta la red neuronal? (mismo umbral en el camino escalar y por lotes)"""
+        return self.complexity > config.COMPLEXITY_THRESHOLD_NEURAL
     
     def get_sensor_inputs(self) -> List[float]:
         """Obtener inputs de sensores para red neuronal (MEJORADOS)"""
@@ -314,8 +273,9 @@ class Creature:
     
     def move(self, dt: float):
         """Mover criatura"""
-        # Guardar posición anterior para calcular distancia
+        # Guardar posición anterior (distancia recorrida e interpolación al renderizar)
         old_x, old_y = self.x, self.y
+        self.last_x, self.last_y = old_x, old_y
         
         self.x += self.vx * dt
         self.y += self.vy * dt
@@ -362,6 +322,9 @@ class Creature:
         elif config.TOPOLOGY == 'toroidal':
             self.x = self.x % self.world.width
             self.y = self.y % self.world.height
+        
+        # Re-indexar en la rejilla espacial (solo si cambia de celda)
+        self.world.creature_grid.move(self, self.x, self.y)
     
     def seek_food(self):
         """Buscar y consumir alimento cercano"""
@@ -451,7 +414,7 @@ class Creature:
         
         return (self.energy >= config.REPRODUCTION_ENERGY_THRESHOLD and
                 self.age > min_age and
-                self.world.population < config.MAX_POPULATION)
+                self.world.projected_population < config.MAX_POPULATION)
     
     def reproduce(self):
         """Reproducirse (asexual)"""
@@ -460,15 +423,20 @@ class Creature:
         # Recompensa por reproducirse exitosamente
         self.fitness += 20
         
-        # Crear descendiente cerca
+        # Encolar descendiente cerca (el mundo lo materializa al final del ciclo)
         offset_x = random.uniform(-20, 20)
         offset_y = random.uniform(-20, 20)
-        child = Creature(self.x + offset_x, self.y + offset_y, self.world, parent=self)
-        
-        # El hijo hereda parte del fitness del padre
-        child.fitness = self.fitness * 0.1
+        self.world.queue_birth(self, self.x + offset_x, self.y + offset_y)
+    
+    def get_vocal_system(self) -> VocalSystem:
+        """Sistema vocal, creándolo la primera vez que se necesita
         
-        self.world.add_creature(child)
+        Si la criatura llega a vocal después de nacer no recibe las
+        palabras iniciales: esas solo las trae quien nace ya compleja.
+        """
+        if self.vocal_system is None:
+            self.vocal_system = VocalSystem(self, seed_words=False)
+        return self.vocal_system
     
     def can_vocalize(self) -> bool:
         """Verificar si puede vocalizar"""
@@ -551,7 +519,7 @@ class Creature:
         for creature in nearby:
             if creature != self:
                 # Detectar depredadores activos
-                if hasattr(creature, 'is_predator') and creature.is_predator:
+                if creature.is_predator:
                     return True
                 # Detectar criaturas mucho más fuertes
                 if creature.fitness > self.fitness * 2.0:
@@ -697,7 +665,7 @@ class Creature:
                 creature.fitness += 1
                 
                 # Compartir conocimiento si ambas son inteligentes
-                if self.intelligence and hasattr(creature, 'intelligence') and creature.intelligence:
+                if self.intelligence and creature.intelligence:
                     if random.random() < 0.2:  # 20% de compartir conocimiento
                         self.intelligence.share_knowledge(creature)
         
@@ -708,17 +676,11 @@ class Creature:
     
     def calculate_genetic_similarity(self, other: 'Creature') -> float:
         """Calcular similitud genética con otra criatura"""
-        # Comparar genomas
-        my_genome = set(self.genome.instructions)
-        other_genome = set(other.genome.instructions)
-        
-        if not my_genome or not other_genome:
+        # Comparar genomas (Jaccard sobre máscaras de presencia precalculadas)
+        if not self.genome.presence_mask or not other.genome.presence_mask:
             return 0.0
         
-        intersection = len(my_genome & other_genome)
-        union = len(my_genome | other_genome)
-        
-        genome_similarity = intersection / union if union > 0 else 0
+        genome_similarity = self.genome.similarity(other.genome)
         
         # Considerar también complejidad similar
         complexity_diff = abs(self.complexity - other.complexity)
@@ -729,15 +691,17 @@ class Creature:
     
     def get_species_id(self) -> int:
         """Obtener ID de especie basado en características genéticas"""
-        # Usar hash del genoma + rango de complejidad
-        genome_hash = hash(tuple(sorted(self.genome.instructions)))
+        if self.species_id is not None:
+            return self.species_id
+        
+        # Fuera del mundo: usar hash del genoma (cacheado al crearlo) + rango de complejidad
         complexity_bracket = int(self.complexity / 100)  # Grupos de 100 complejidad
         
-        return hash((genome_hash, complexity_bracket))
+        return hash((self.genome.species_hash, complexity_bracket))
     
     def update_infection(self, dt: float):
         """Actualizar estado de infección"""
-        if hasattr(self, 'infection') and self.infection:
+        if self.infection:
             if not self.infection.update(self, dt):
                 # La criatura murió por la enfermedad
                 return False
@@ -754,9 +718,19 @@ class Creature:
         """Preparar inputs para procesamiento por lotes (sin ejecutar red)"""
         return self.get_sensor_inputs()
     
-    def apply_neural_outputs(self, outputs: np.ndarray):
-        """Aplicar outputs de la red neuronal procesada en GPU"""
-        # Balance instinto/IA según complejidad
+    def apply_neural_outputs(self, outputs: Optional[np.ndarray]):
+        """Combinar instinto y outputs de la red y aplicar el movimiento
+        
+        ``outputs`` es None si la criatura no usa la red (ver ``uses_brain``).
+        """
+        # INSTINTO BÁSICO: Siempre buscar alimento si hay hambre
+        # Esto garantiza comportamiento mínimo incluso con red neuronal débil
+        
+        # Balance instinto/IA según complejidad (EVOLUTIVO)
+        # Primitivas: 80% instinto, 20% IA
+        # Intermedias: 60% instinto, 40% IA
+        # Avanzadas: 40% instinto, 60% IA
+        # Complejas: 20% instinto, 80% IA
         instinct_strength = max(0.2, 0.8 - (self.complexity / 1000))
         
         # Instinto: buscar alimento más cercano
@@ -777,11 +751,13 @@ class Creature:
             instinct_x = random.uniform(-0.5, 0.5)
             instinct_y = random.uniform(-0.5, 0.5)
         
-        # Red neuronal (outputs ya procesados en GPU)
+        # Red neuronal (outputs ya calculados, escalar o por lotes)
         neural_x = 0
         neural_y = 0
         
-        if self.complexity > 50 and len(outputs) >= 4:
+        # Verificar que outputs tenga al menos 4 elementos
+        if outputs is not None and len(outputs) >= 4:
+            # Outputs: [arriba, abajo, izquierda, derecha]
             neural_y = outputs[0] - outputs[1]
             neural_x = outputs[3] - outputs[2]
         
@@ -793,45 +769,47 @@ class Creature:
         self.apply_movement(move_x, move_y)
     
     def update_non_neural(self, dt: float):
-        """Actualizar todo excepto la red neuronal (para procesamiento por lotes)"""
-        self.age += dt
+        """Actualizar todo lo que va después de pensar
         
-        # Consumir energía
-        base_cost = config.ENERGY_COST_PER_CYCLE * dt
-        complexity_cost = (self.complexity / 100) * dt
-        efficiency = self.get_efficiency_bonus()
-        energy_cost = (base_cost + complexity_cost) * efficiency
-        self.energy -= energy_cost
-        
-        # Mover (ya aplicado en apply_neural_outputs)
+        Lo comparten ``update`` y el camino por lotes del mundo (que llama
+        antes a ``consume_energy`` y ``apply_neural_outputs``), así que ambos
+        caminos ejecutan la misma lógica por criatura.
+        """
+        # Mover - SIEMPRE, es crítico
         self.move(dt)
         
-        # Buscar alimento
+        # Buscar alimento - SIEMPRE, es crítico
         self.seek_food()
         
-        # Reproducción (cada 10 frames)
-        if self.age % 10 < dt:
+        # Intentar reproducirse - Escalonado por slot (ver BehaviorScheduler)
+        if self.is_due('reproduce'):
             if self.can_reproduce():
                 self.reproduce()
         
-        # Vocalización (OPTIMIZADO: frecuencia reducida)
-        if self.can_vocalize() and random.random() < 0.01:  # 1% por frame (optimizado)
-            self.vocal_system.vocalize()
+        # Vocalizar si es apropiado - OPTIMIZADO: Reducida frecuencia para mejor rendimiento
+        if self.can_vocalize() and random.random() < 0.01:  # 1% por frame (reducido de 2% para rendimiento)
+            self.get_vocal_system().vocalize()
+        
+        # Sistema de inteligencia avanzada (solo criaturas muy inteligentes)
+        self.update_intelligence(dt)
         
-        # Apariencia (cada 5 frames)
-        if self.age % 5 < dt:
+        # Actualizar apariencia - Escalonado por slot
+        if self.is_due('appearance'):
             self.update_appearance()
         
-        # Infección
+        # NUEVOS COMPORTAMIENTOS v2.8
+        # Actualizar infección si existe
         if not self.update_infection(dt):
-            return
+            return  # Criatura murió por enfermedad
         
-        # Comportamientos sociales (reducidos)
-        if self.age % 20 < dt:
+        # Intentar depredación (solo criaturas avanzadas)
+        if self.is_due('predation'):
             self.try_predation(dt)
         
-        if self.age % 15 < dt:
+        # Intentar colaboración (solo criaturas desarrolladas)
+        if self.is_due('collaboration'):
             self.try_collaboration(dt)
         
-        if self.age % 10 < dt:
+        # Intentar comunicación (solo criaturas complejas)
+        if self.is_due('communication'):
             self.try_communication(dt)
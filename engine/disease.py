@@ -9,6 +9,9 @@ from typing import Dict, List, Optional
 class Disease:
     """Enfermedad que puede afectar a las criaturas"""
     
+    __slots__ = ('name', 'symptoms', 'contagion_rate', 'duration', 'lethality', 'active',
+                 'infected_count', 'deaths_caused', 'patient_zero_id')
+    
     # Nombres de enfermedades
     DISEASE_NAMES = [
         "Virus Digital", "Corrupción de Datos", "Fragmentación Genética",
@@ -54,6 +57,8 @@ class Disease:
 class Infection:
     """Infección activa en una criatura"""
     
+    __slots__ = ('disease', 'duration_left', 'severity')
+    
     def __init__(self, disease: Disease):
         self.disease = disease
         self.duration_left = disease.duration
@@ -132,13 +137,13 @@ class DiseaseSystem:
     
     def infect_creature(self, creature, disease: Disease):
         """Infectar una criatura"""
-        if not hasattr(creature, 'infection') or creature.infection is None:
+        if creature.infection is None:
             creature.infection = Infection(disease)
             disease.infected_count += 1
     
     def try_spread(self, infected_creature, nearby_creatures: List):
         """Intentar propagar enfermedad a criaturas cercanas"""
-        if not hasattr(infected_creature, 'infection') or infected_creature.infection is None:
+        if infected_creature.infection is None:
             return
         
         disease = infected_creature.infection.disease
@@ -146,23 +151,28 @@ class DiseaseSystem:
         for creature in nearby_creatures:
             if creature != infected_creature:
                 # Verificar si ya está infectada
-                if not hasattr(creature, 'infection') or creature.infection is None:
+                if creature.infection is None:
                     # Intentar contagio
                     if random.random() < disease.contagion_rate:
                         self.infect_creature(creature, disease)
     
-    def get_active_epidemics(self) -> List[Dict]:
-        """Obtener información de epidemias activas"""
+    def get_active_epidemics(self, infected_counts: Dict = None) -> List[Dict]:
+        """Obtener información de epidemias activas
+        
+        ``infected_counts`` (enfermedad -> infectados) evita recorrer la
+        población una vez por enfermedad si el llamador ya los contó.
+        """
         epidemics = []
         for disease in self.active_diseases:
             if disease.active:
                 # Contar infectados actuales
-                current_infected = sum(
-                    1 for c in self.world.creatures 
-                    if hasattr(c, 'infection') and 
-                    c.infection and 
-                    c.infection.disease == disease
-                )
+                if infected_counts is not None:
+                    current_infected = infected_counts.get(disease, 0)
+                else:
+                    current_infected = sum(
+                        1 for c in self.world.creatures 
+                        if c.infection and c.infection.disease == disease
+                    )
                 
                 epidemics.append({
                     'name': disease.name,
@@ -0,0 +1,181 @@
+"""
+Autoajuste del despacho neuronal - Escalar, lotes en CPU o lotes en OpenCL
+"""
+
+import math
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import config
+
+
+PATH_LABELS = {'scalar': 'escalar', 'cpu': 'lotes CPU', 'opencl': 'lotes OpenCL'}
+
+
+class DispatchDecision(NamedTuple):
+    """Camino elegido para actualizar las criaturas en cada tick"""
+    path: str         # 'scalar', 'cpu' u 'opencl'
+    batch_size: int   # 0 en el camino escalar
+    cost_us: float    # Coste medido por criatura en µs (nan si no se ha medido)
+
+    @property
+    def label(self) -> str:
+        if self.path == 'scalar':
+            return PATH_LABELS['scalar']
+        return f"{PATH_LABELS[self.path]} x{self.batch_size}"
+
+
+class DispatchTuner:
+    """Cronometra cada camino de actualización y elige el más rápido
+
+    Los caminos ejecutan la misma lógica por criatura (``Creature.update``
+    frente a ``consume_energy`` + lote + ``update_non_neural``), así que
+    cambiar de camino no altera la simulación y se puede medir sobre ticks
+    reales: el mundo cronometra la pasada de criaturas que ya hace y se la
+    pasa a ``record``. No hay pasadas extra.
+
+    Una ronda de medición empieza al arrancar, cada DISPATCH_RETUNE_CYCLES
+    ciclos y cuando la población crece o decrece más de
+    DISPATCH_RETUNE_GROWTH veces. Durante la ronda, uno de cada
+    DISPATCH_PROBE_INTERVAL ticks usa un candidato distinto (escalar, lotes
+    en CPU y lotes en OpenCL si hay dispositivo, con cada tamaño de
+    DISPATCH_BATCH_SIZES) hasta medir cada uno DISPATCH_SAMPLES veces; el
+    resto de ticks sigue con la decisión vigente. Se compara el mejor coste
+    por criatura de cada candidato.
+
+    Con DISPATCH_AUTOTUNE desactivado aplica la regla fija: lotes de
+    GPU_BATCH_SIZE a partir de GPU_THRESHOLD_CREATURES criaturas.
+    """
+
+    def __init__(self, processor):
+        self.processor = processor
+        self.decision = DispatchDecision('scalar', 0, math.nan)
+        self.timings: Dict[Tuple[str, int], float] = {}  # (camino, lote) -> segundos por criatura
+        self.calibrations = 0
+        self.calibrated_cycle = None
+        self.calibrated_population = 0
+        self._next_cycle = 0
+        self._probes: List[Tuple[str, int]] = []  # Candidatos pendientes de la ronda en curso
+        self._probe_count = 0  # Mediciones totales de la ronda en curso
+        self._samples: Dict[Tuple[str, int], float] = {}
+        self._wait = 0  # Ticks hasta la próxima medición
+        self._probing: Optional[Tuple[str, int]] = None  # Candidato que usa este tick
+        self._overlay = None  # Texto del overlay (se rehace al cambiar la decisión)
+
+    @property
+    def calibrating(self) -> bool:
+        """¿Hay una ronda de medición en curso?"""
+        return bool(self._probes)
+
+    def candidates(self) -> List[Tuple[str, int]]:
+        """Caminos disponibles con cada tamaño de lote"""
+        paths = ['cpu']
+        if config.USE_GPU and self.processor.initialized:
+            paths.append('opencl')
+        return [('scalar', 0)] + [(path, size) for path in paths for size in config.DISPATCH_BATCH_SIZES]
+
+    def needs_tuning(self, cycle: int, population: int) -> bool:
+        if population == 0 or self.calibrating:
+            return False
+        if self.calibrated_cycle is None or cycle >= self._next_cycle:
+            return True
+        growth = config.DISPATCH_RETUNE_GROWTH
+        return (population > self.calibrated_population * growth or
+                population * growth < self.calibrated_population)
+
+    def invalidate(self):
+        """Empezar una ronda nueva en el próximo tick (mundo reiniciado o cargado)"""
+        self.calibrated_cycle = None
+        self._probes = []
+        self._probing = None
+
+    def decide(self, world) -> DispatchDecision:
+        """Camino para este tick (la decisión vigente o el candidato a medir)"""
+        population = len(world.creatures)
+        self._probing = None
+        if not config.DISPATCH_AUTOTUNE:
+            decision = self._fixed_decision(population)
+            if decision[:2] != self.decision[:2]:
+                self.decision = decision
+                self._overlay = None
+            return self.decision
+
+        if self.needs_tuning(world.cycle, population):
+            self._start_round(world.cycle, population)
+        if not self._probes:
+            return self.decision
+        if self._wait > 0:
+            self._wait -= 1
+            return self.decision
+        self._wait = config.DISPATCH_PROBE_INTERVAL
+        self._probing = self._probes[-1]
+        return DispatchDecision(*self._probing, math.nan)
+
+    def record(self, seconds: float, population: int):
+        """Registrar lo que tardó la pasada de criaturas del tick"""
+        candidate, self._probing = self._probing, None
+        if candidate is None or population == 0:
+            return  # Tick sin medición (decisión vigente o regla fija)
+        cost = seconds / population
+        self._samples[candidate] = min(self._samples.get(candidate, cost), cost)
+        self._probes.pop()
+        if not self._probes:
+            self._finish_round()
+        else:
+            self._overlay = None
+
+    def _start_round(self, cycle: int, population: int):
+        # Candidatos intercalados para repartir el ruido entre todos; se sacan del final
+        self._probes = self.candidates() * config.DISPATCH_SAMPLES
+        self._probes.reverse()
+        self._probe_count = len(self._probes)
+        self._samples = {}
+        self._wait = 0
+        self.calibrated_cycle = cycle
+        self.calibrated_population = population
+        self._next_cycle = cycle + config.DISPATCH_RETUNE_CYCLES
+        self._overlay = None
+
+    def _finish_round(self):
+        self.timings = self._samples
+        self._samples = {}
+        self.calibrations += 1
+        path, batch_size = self.choose(self.timings)
+        self.decision = DispatchDecision(path, batch_size, self.timings[(path, batch_size)] * 1e6)
+        self._overlay = None
+
+    def _fixed_decision(self, population: int) -> DispatchDecision:
+        if config.USE_GPU and population >= config.GPU_THRESHOLD_CREATURES:
+            path = 'opencl' if self.processor.initialized else 'cpu'
+            return DispatchDecision(path, config.GPU_BATCH_SIZE, math.nan)
+        return DispatchDecision('scalar', 0, math.nan)
+
+    @staticmethod
+    def choose(timings: Dict[Tuple[str, int], float]) -> Tuple[str, int]:
+        """Candidato más rápido (en empate, el primero: escalar antes que lotes)"""
+        return min(timings, key=timings.get)
+
+    def overlay_lines(self) -> Tuple[str, ...]:
+        """Texto para el overlay junto a los FPS"""
+        if self._overlay is None:
+            self._overlay = self._build_overlay()
+        return self._overlay
+
+    def _build_overlay(self) -> Tuple[str, ...]:
+        decision = self.decision
+        if self.calibrating:
+            done = self._probe_count - len(self._probes)
+            status = f"midiendo {done}/{self._probe_count}"
+        elif math.isnan(decision.cost_us):
+            status = "fijo" if not config.DISPATCH_AUTOTUNE else "sin calibrar"
+        else:
+            status = f"{decision.cost_us:.1f} µs/criatura, {self.calibrated_population} criaturas"
+        if not self.timings:
+            return (f"Red: {decision.label} ({status})",)
+
+        best = {}
+        for (path, _), seconds in self.timings.items():
+            best[path] = min(best.get(path, seconds), seconds)
+        costs = " | ".join(f"{PATH_LABELS[path]} {seconds * 1e6:.1f}" for path, seconds in best.items())
+        return (
+            f"Red: {decision.label} ({status})",
+            f"  mejor por camino (µs/criatura): {costs}",
+        )
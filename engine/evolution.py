@@ -26,22 +26,16 @@ class Evolution:
         if len(sorted_creatures) > config.MAX_POPULATION * 0.8:
             to_remove = int(len(sorted_creatures) * 0.1)
             for creature in sorted_creatures[:to_remove]:
-                if creature in self.world.creatures:
-                    self.world.creatures.remove(creature)
+                if self.world.remove_creature(creature):
                     self.world.total_deaths += 1
     
     def identify_species(self):
         """Identificar especies por similitud genética"""
-        # Simplificado: agrupar por complejidad similar
+        # Las especies ya se asignan en cada nacimiento (SpeciesTracker)
         self.species.clear()
         
         for creature in self.world.creatures:
-            complexity_group = int(creature.complexity / 200)
-            if complexity_group not in self.species:
-                self.species[complexity_group] = []
-            self.species[complexity_group].append(creature)
-        
-        self.world.species_count = len(self.species)
+            self.species.setdefault(creature.species_id, []).append(creature)
     
     def get_fitness_stats(self) -> dict:
         """Obtener estadísticas de fitness"""
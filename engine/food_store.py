@@ -0,0 +1,119 @@
+"""
+Almacén de alimento - Arrays paralelos de posición y tipo
+"""
+
+from collections.abc import Sequence
+import numpy as np
+import config
+
+
+# Tipos de dato y paleta de colores (el índice es el código de tipo)
+DATA_TYPES = tuple(config.DATA_COLORS)
+DATA_TYPE_CODES = {name: code for code, name in enumerate(DATA_TYPES)}
+DATA_PALETTE = np.array([config.DATA_COLORS[name] for name in DATA_TYPES], dtype=np.uint8)
+
+
+class FoodStore(Sequence):
+    """Colección de alimento con posiciones, tamaños y tipos en arrays numpy
+
+    Se comporta como una lista de dicts (el formato de siempre) pero guarda
+    además x, y, tamaño y código de tipo en arrays paralelos densos, para
+    que el renderizado y los análisis trabajen sobre todo el alimento con
+    operaciones vectorizadas. La baja es O(1) por swap-remove, así que el
+    orden de iteración no es el de inserción.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._items = []
+        self._index = {}  # id(dict) -> posición densa
+        self._x = np.zeros(capacity, dtype=np.float64)
+        self._y = np.zeros(capacity, dtype=np.float64)
+        self._size = np.zeros(capacity, dtype=np.float64)
+        self._type = np.zeros(capacity, dtype=np.uint8)
+
+    # ==================== Protocolo de secuencia ====================
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item) -> bool:
+        """Pertenencia O(1) por identidad"""
+        return id(item) in self._index
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    # ==================== Altas y bajas ====================
+
+    def append(self, item: dict):
+        """Añadir alimento"""
+        n = len(self._items)
+        if n == len(self._x):
+            self._grow()
+        self._x[n] = item['x']
+        self._y[n] = item['y']
+        self._size[n] = item['size']
+        self._type[n] = DATA_TYPE_CODES[item['type']]
+        self._index[id(item)] = n
+        self._items.append(item)
+
+    def remove(self, item: dict) -> bool:
+        """Eliminar alimento en O(1) (swap-remove). Retorna False si no estaba"""
+        index = self._index.pop(id(item), None)
+        if index is None:
+            return False
+
+        last = len(self._items) - 1
+        if index != last:
+            moved = self._items[last]
+            self._items[index] = moved
+            self._index[id(moved)] = index
+            self._x[index] = self._x[last]
+            self._y[index] = self._y[last]
+            self._size[index] = self._size[last]
+            self._type[index] = self._type[last]
+        self._items.pop()
+        return True
+
+    def clear(self):
+        """Eliminar todo el alimento"""
+        self._items.clear()
+        self._index.clear()
+
+    def _grow(self):
+        """Duplicar capacidad de los arrays"""
+        capacity = max(16, len(self._x) * 2)
+        for name in ('_x', '_y', '_size', '_type'):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
+
+    # ==================== Vistas de arrays ====================
+
+    @property
+    def xs(self) -> np.ndarray:
+        return self._x[:len(self._items)]
+
+    @property
+    def ys(self) -> np.ndarray:
+        return self._y[:len(self._items)]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self._size[:len(self._items)]
+
+    @property
+    def type_codes(self) -> np.ndarray:
+        return self._type[:len(self._items)]
+
+    @property
+    def colors(self) -> np.ndarray:
+        """Color RGB de cada alimento (búsqueda en la paleta por tipo)"""
+        return DATA_PALETTE[self.type_codes]
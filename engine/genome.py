@@ -3,48 +3,76 @@ Sistema genético - Genoma digital
 """
 
 import random
-from typing import List
+import numpy as np
+from typing import List, Sequence
 import config
 
 
+# Conjunto de instrucciones (el índice es el opcode)
+INSTRUCTION_TYPES = (
+    'MOVE_FORWARD',
+    'TURN_LEFT',
+    'TURN_RIGHT',
+    'SEEK_FOOD',
+    'SEEK_CREATURE',
+    'FLEE',
+    'REST',
+    'REPRODUCE'
+)
+OPCODES = {name: code for code, name in enumerate(INSTRUCTION_TYPES)}
+NUM_OPCODES = len(INSTRUCTION_TYPES)
+
+# Bits activos de cada máscara de 8 bits (popcount por tabla)
+_POPCOUNT8 = tuple(bin(i).count('1') for i in range(256))
+
+
 class Genome:
-    """Genoma que define comportamiento base de la criatura"""
+    """Genoma que define comportamiento base de la criatura
+
+    Las instrucciones se guardan como opcodes uint8. El genoma es inmutable
+    (``mutate`` crea uno nuevo), así que la máscara de presencia, el
+    histograma de opcodes y el hash de especie se calculan una sola vez.
+    """
     
-    def __init__(self, instructions: List[str] = None):
+    def __init__(self, instructions: Sequence = None):
         if instructions is None:
             # Genoma aleatorio inicial
-            self.instructions = self.generate_random()
+            opcodes = self.generate_random()
+        elif isinstance(instructions, np.ndarray):
+            opcodes = instructions.astype(np.uint8)
         else:
-            self.instructions = instructions
+            # Lista de opcodes o de nombres de instrucción (saves antiguos)
+            opcodes = np.array([OPCODES[i] if isinstance(i, str) else i for i in instructions],
+                               dtype=np.uint8)
+        opcodes.flags.writeable = False
+        self.opcodes = opcodes
+        
+        # Resúmenes precalculados (el genoma no cambia después de crearse)
+        self.histogram = np.bincount(opcodes, minlength=NUM_OPCODES)
+        self.histogram.flags.writeable = False
+        self.presence_mask = 0
+        for code in np.flatnonzero(self.histogram):
+            self.presence_mask |= 1 << int(code)
+        self.species_hash = hash(self.histogram.tobytes())
     
-    def generate_random(self, length: int = 20) -> List[str]:
+    @property
+    def instructions(self) -> List[str]:
+        """Instrucciones como nombres (vista decodificada de los opcodes)"""
+        return [INSTRUCTION_TYPES[code] for code in self.opcodes]
+    
+    def generate_random(self, length: int = 20) -> np.ndarray:
         """Generar genoma aleatorio"""
-        instruction_types = [
-            'MOVE_FORWARD',
-            'TURN_LEFT',
-            'TURN_RIGHT',
-            'SEEK_FOOD',
-            'SEEK_CREATURE',
-            'FLEE',
-            'REST',
-            'REPRODUCE'
-        ]
-        return [random.choice(instruction_types) for _ in range(length)]
+        return np.array([random.randrange(NUM_OPCODES) for _ in range(length)], dtype=np.uint8)
     
     def mutate(self, complexity: float = 0) -> 'Genome':
         """Crear copia mutada del genoma (EVOLUTIVO - CORREGIDO)"""
-        new_instructions = self.instructions.copy()
+        new_instructions = self.opcodes.tolist()
         mutation_rate = config.MUTATION_RATE_BASE
         
         # Criaturas más complejas tienen genomas más largos
         target_length = 20 + int(complexity / 50)  # +1 instrucción cada 50 complejidad
         target_length = min(target_length, 50)  # Máximo 50 instrucciones
         
-        instruction_types = [
-            'MOVE_FORWARD', 'TURN_LEFT', 'TURN_RIGHT',
-            'SEEK_FOOD', 'SEEK_CREATURE', 'FLEE', 'REST', 'REPRODUCE'
-        ]
-        
         # Iterar sobre índices de forma segura
         i = 0
         while i < len(new_instructions):
@@ -52,11 +80,11 @@ class Genome:
                 mutation_type = random.random()
                 
                 if mutation_type < 0.6:  # Mutación puntual
-                    new_instructions[i] = random.choice(instruction_types)
+                    new_instructions[i] = random.randrange(NUM_OPCODES)
                     i += 1
                 elif mutation_type < 0.85:  # Inserción
                     if len(new_instructions) < target_length:
-                        new_instructions.insert(i, random.choice(instruction_types))
+                        new_instructions.insert(i, random.randrange(NUM_OPCODES))
                         i += 1  # Saltar la instrucción insertada
                     i += 1
                 elif mutation_type < 0.92:  # Deleción
@@ -75,15 +103,28 @@ class Genome:
         
         # Asegurar crecimiento gradual
         while len(new_instructions) < target_length and random.random() < 0.3:
-            new_instructions.append(random.choice(instruction_types))
+            new_instructions.append(random.randrange(NUM_OPCODES))
         
-        return Genome(new_instructions)
+        return Genome(np.array(new_instructions, dtype=np.uint8))
     
     def crossover(self, other: 'Genome') -> 'Genome':
         """Cruzamiento genético con otro genoma"""
-        point = random.randint(1, min(len(self.instructions), len(other.instructions)) - 1)
-        new_instructions = self.instructions[:point] + other.instructions[point:]
-        return Genome(new_instructions)
+        point = random.randint(1, min(len(self.opcodes), len(other.opcodes)) - 1)
+        return Genome(np.concatenate((self.opcodes[:point], other.opcodes[point:])))
+    
+    def similarity(self, other: 'Genome') -> float:
+        """Similitud de Jaccard entre los conjuntos de instrucciones (popcount)"""
+        union = _POPCOUNT8[self.presence_mask | other.presence_mask]
+        if union == 0:
+            return 0.0
+        return _POPCOUNT8[self.presence_mask & other.presence_mask] / union
+    
+    def histogram_similarity(self, other: 'Genome') -> float:
+        """Similitud de Jaccard ponderada entre los histogramas de opcodes"""
+        union = np.maximum(self.histogram, other.histogram).sum()
+        if union == 0:
+            return 0.0
+        return float(np.minimum(self.histogram, other.histogram).sum() / union)
     
     def to_dict(self) -> dict:
         """Serializar"""
@@ -95,4 +136,4 @@ class Genome:
         return cls(data['instructions'])
     
     def __len__(self):
-        return len(self.instructions)
+        return len(self.opcodes)
@@ -3,7 +3,9 @@ Sistema de conocimiento e insights - Criaturas inteligentes aprenden del entorno
 """
 
 import random
+from collections import deque
 from typing import List, Dict, Optional, Tuple
+import numpy as np
 import config
 
 
@@ -41,122 +43,337 @@ class KnowledgeBase:
             'optimizar_movimiento'
         ]
         
+        # Patrones que las criaturas detectan en sus observaciones
+        self.pattern_insights = [
+            'energia_critica_frecuente'
+        ]
+        
+        # Vocabulario completo: cada conocimiento o patrón es un bit
+        self.vocabulary = tuple(self.survival_knowledge + self.social_knowledge +
+                                self.strategic_knowledge + self.pattern_insights)
+        assert len(self.vocabulary) <= 64, "El vocabulario debe caber en 64 bits"
+        self.bit = {name: 1 << i for i, name in enumerate(self.vocabulary)}
+        self.store = KnowledgeStore(len(self.vocabulary))
+        self.category_masks = [
+            self.mask_of(self.survival_knowledge),
+            self.mask_of(self.social_knowledge),
+            self.mask_of(self.strategic_knowledge)
+        ]
+        
         # Patrones descubiertos por criaturas
         self.discovered_patterns = {}
         
         # Estadísticas del mundo para análisis
         self.world_stats = {
-            'food_hotspots': [],  # Zonas con más comida
-            'danger_zones': [],   # Zonas peligrosas
-            'safe_zones': [],     # Zonas seguras
+            'food_hotspots': [],  # Celdas con más comida (x, y, cantidad)
+            'danger_zones': [],   # Celdas con depredadores
+            'safe_zones': [],     # Celdas con comida y sin depredadores
             'successful_strategies': []  # Estrategias exitosas
         }
+        
+        # Mapas de densidad (columnas x filas de KNOWLEDGE_GRID)
+        self.food_density = np.zeros(config.KNOWLEDGE_GRID)
+        self.danger_density = np.zeros(config.KNOWLEDGE_GRID)
+    
+    def mask_of(self, names) -> int:
+        """Bitset de un conjunto de nombres del vocabulario"""
+        mask = 0
+        for name in names:
+            mask |= self.bit[name]
+        return mask
+    
+    def names_of(self, mask: int) -> List[str]:
+        """Nombres del vocabulario presentes en un bitset"""
+        return [name for i, name in enumerate(self.vocabulary) if mask >> i & 1]
+    
+    def describe(self, bit: int) -> str:
+        """Texto de un descubrimiento para el panel"""
+        name = self.vocabulary[bit.bit_length() - 1]
+        if name in self.pattern_insights:
+            return name
+        return f"Descubrió: {name.replace('_', ' ')}"
     
     def update_world_stats(self, world):
         """Actualizar estadísticas del mundo para análisis"""
         # Analizar zonas de comida (cada 100 ciclos)
         if world.cycle % 100 == 0:
-            self._analyze_food_distribution(world)
-            self._analyze_danger_zones(world)
-            self._analyze_successful_creatures(world)
+            self.apply_analysis(analyze_world(*self.gather(world)))
     
-    def _analyze_food_distribution(self, world):
-        """Analizar dónde aparece más comida"""
-        if not world.data_items:
-            return
-        
-        # Dividir mundo en cuadrantes
-        quadrants = {
-            'center': 0,
-            'north': 0,
-            'south': 0,
-            'east': 0,
-            'west': 0
-        }
-        
-        center_x = world.width / 2
-        center_y = world.height / 2
-        
-        for data in world.data_items:
-            dx = abs(data['x'] - center_x)
-            dy = abs(data['y'] - center_y)
-            
-            if dx < world.width * 0.2 and dy < world.height * 0.2:
-                quadrants['center'] += 1
-            elif data['y'] < center_y:
-                quadrants['north'] += 1
-            else:
-                quadrants['south'] += 1
-            
-            if data['x'] < center_x:
-                quadrants['west'] += 1
-            else:
-                quadrants['east'] += 1
-        
-        # Guardar zona con más comida
-        self.world_stats['food_hotspots'] = sorted(
-            quadrants.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:2]
-    
-    def _analyze_danger_zones(self, world):
-        """Analizar zonas peligrosas (con depredadores)"""
-        if not config.PREDATION_ENABLED:
-            return
-        
-        danger_zones = []
-        for creature in world.creatures:
-            if hasattr(creature, 'is_predator') and creature.is_predator:
-                danger_zones.append((creature.x, creature.y))
-        
-        self.world_stats['danger_zones'] = danger_zones
+    @staticmethod
+    def gather(world) -> tuple:
+        """Copiar del mundo los arrays que necesita ``analyze_world``
+        
+        Es la única parte que toca objetos vivos; el análisis trabaja solo
+        con estas copias y puede ejecutarse en otro hilo.
+        """
+        food = world.data_items
+        creatures = world.creatures
+        rows = np.array([(c.x, c.y, c.fitness, c.is_predator) for c in creatures],
+                        dtype=np.float64).reshape(len(creatures), 4)
+        predators = rows[rows[:, 3] > 0] if config.PREDATION_ENABLED else rows[:0]
+        
+        # Solo se copian los atributos del top 10% por fitness
+        top = []
+        if len(creatures):
+            count = max(1, len(creatures) // 10)
+            fitness = rows[:, 2]
+            top_index = np.argpartition(fitness, len(fitness) - count)[-count:]
+            top_index = top_index[np.argsort(fitness[top_index])[::-1]]
+            top = [creatures[i] for i in top_index]
+        strategies = [{
+            'complexity': c.complexity,
+            'energy_ratio': c.energy / c.max_energy,
+            'age': c.age,
+            'is_predator': c.is_predator,
+            'genome_size': len(c.genome)
+        } for c in top]
+        
+        return (food.xs.copy(), food.ys.copy(), predators[:, 0], predators[:, 1],
+                strategies, world.width, world.height)
     
-    def _analyze_successful_creatures(self, world):
-        """Analizar estrategias de criaturas exitosas"""
-        if not world.creatures:
+    def apply_analysis(self, analysis: Dict):
+        """Publicar el resultado de ``analyze_world``"""
+        self.food_density = analysis['food_density']
+        self.danger_density = analysis['danger_density']
+        for key in self.world_stats:
+            self.world_stats[key] = analysis[key]
+
+
+def analyze_world(food_x: np.ndarray, food_y: np.ndarray,
+                  predator_x: np.ndarray, predator_y: np.ndarray,
+                  strategies: List[Dict], width: float, height: float,
+                  bins: Tuple[int, int] = None) -> Dict:
+    """Mapas de densidad de alimento y depredadores sobre una rejilla
+    
+    Las rejillas tienen forma (columnas, filas) de ``KNOWLEDGE_GRID``; las
+    zonas se devuelven como (x, y, cantidad) en el centro de cada celda,
+    ordenadas de mayor a menor.
+    """
+    cols, rows = bins or config.KNOWLEDGE_GRID
+    edges = (np.linspace(0, width, cols + 1), np.linspace(0, height, rows + 1))
+    food_density, _, _ = np.histogram2d(food_x, food_y, bins=edges)
+    danger_density, _, _ = np.histogram2d(predator_x, predator_y, bins=edges)
+    
+    center_x = (edges[0][:-1] + edges[0][1:]) / 2
+    center_y = (edges[1][:-1] + edges[1][1:]) / 2
+    
+    def zones(mask: np.ndarray, weights: np.ndarray, limit: int = None) -> list:
+        col, row = np.nonzero(mask)
+        order = np.argsort(weights[col, row], kind='stable')[::-1][:limit]
+        return [(float(center_x[c]), float(center_y[r]), int(weights[c, r]))
+                for c, r in zip(col[order], row[order])]
+    
+    return {
+        'food_density': food_density,
+        'danger_density': danger_density,
+        'food_hotspots': zones(food_density > 0, food_density, config.KNOWLEDGE_HOTSPOTS),
+        'danger_zones': zones(danger_density > 0, danger_density),
+        'safe_zones': zones((food_density > 0) & (danger_density == 0), food_density),
+        'successful_strategies': strategies
+    }
+
+
+def popcount(mask: int) -> int:
+    """Número de bits activos de un bitset"""
+    return bin(mask).count('1')
+
+
+def random_bit(mask: int) -> int:
+    """Un bit activo al azar de un bitset no vacío"""
+    for _ in range(random.randrange(popcount(mask))):
+        mask &= mask - 1  # Quitar el bit más bajo
+    return mask & -mask
+
+
+# Bits activos de cada byte (popcount vectorizado sobre uint64)
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount_array(masks: np.ndarray) -> np.ndarray:
+    """Bits activos de cada elemento de un array uint64"""
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    return _POPCOUNT8[masks.view(np.uint8)].reshape(-1, 8).sum(axis=1, dtype=np.int64)
+
+
+class KnowledgeStore:
+    """Conocimiento y sabiduría de toda la población en arrays por slot
+
+    Igual que ``BrainStore``: cada criatura inteligente registrada ocupa la
+    fila de su slot en el SlotMap del mundo, y su ``CreatureIntelligence``
+    lee y escribe esa fila. Los intercambios de conocimiento del ciclo se
+    encolan como pares (emisor, receptor) y ``propagate`` los aplica todos
+    a la vez con ORs enmascarados.
+    """
+
+    SHARE_CHANCE = 0.3  # Probabilidad de transmitir cada pieza que el otro no tiene
+
+    def __init__(self, bits: int, capacity: int = 64, seed: Optional[int] = None):
+        self.bits = bits
+        self.bit_values = np.left_shift(np.uint64(1), np.arange(bits, dtype=np.uint64))
+        self.rng = np.random.default_rng(seed)
+        self.capacity = 0
+        self.learned = np.zeros(0, dtype=np.uint64)
+        self.wisdom = np.zeros(0, dtype=np.int64)
+        self.owners: List[Optional[object]] = []  # fila -> inteligencia adjunta
+        self.senders: List[int] = []
+        self.receivers: List[int] = []
+        self.reserve(capacity)
+
+    def reserve(self, capacity: int):
+        """Garantizar capacidad (crecimiento geométrico)"""
+        if capacity <= self.capacity:
             return
-        
-        # Top 10% de criaturas por fitness
-        sorted_creatures = sorted(world.creatures, key=lambda c: c.fitness, reverse=True)
-        top_creatures = sorted_creatures[:max(1, len(sorted_creatures) // 10)]
-        
-        strategies = []
-        for creature in top_creatures:
-            strategy = {
-                'complexity': creature.complexity,
-                'energy_ratio': creature.energy / creature.max_energy,
-                'age': creature.age,
-                'is_predator': getattr(creature, 'is_predator', False),
-                'genome_size': len(creature.genome)
-            }
-            strategies.append(strategy)
-        
-        self.world_stats['successful_strategies'] = strategies
+        new_capacity = max(capacity, self.capacity * 2, 16)
+        for name in ('learned', 'wisdom'):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:self.capacity] = old
+            setattr(self, name, grown)
+        self.owners.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+    def attach(self, row: int, intelligence):
+        """Copiar el conocimiento a su fila y enlazarlo"""
+        learned, wisdom = intelligence.learned, intelligence.wisdom
+        self.reserve(row + 1)
+        self.learned[row] = learned
+        self.wisdom[row] = wisdom
+        self.owners[row] = intelligence
+        intelligence.row = row
+
+    def detach(self, row: int):
+        """Liberar fila (la inteligencia conserva una copia de sus valores)"""
+        if row >= self.capacity or self.owners[row] is None:
+            return
+        intelligence = self.owners[row]
+        intelligence.row = None
+        intelligence.learned = int(self.learned[row])
+        intelligence.wisdom = int(self.wisdom[row])
+        self.owners[row] = None
+        self.learned[row] = 0
+        self.wisdom[row] = 0
+
+    def clear(self):
+        """Liberar todas las filas y los intercambios pendientes"""
+        for row, owner in enumerate(self.owners):
+            if owner is not None:
+                self.detach(row)
+        self.senders.clear()
+        self.receivers.clear()
+
+    def queue_share(self, sender_row: int, receiver_row: int):
+        """Encolar un intercambio para el próximo ``propagate``"""
+        self.senders.append(sender_row)
+        self.receivers.append(receiver_row)
+
+    def propagate(self) -> int:
+        """Aplicar en lote los intercambios encolados. Retorna piezas transmitidas
+
+        Cada pieza que el emisor sabe y el receptor no se transmite con
+        ``SHARE_CHANCE``. Todos los pares leen el conocimiento del inicio
+        del lote, así que una pieza no viaja dos saltos en el mismo ciclo.
+        """
+        if not self.senders:
+            return 0
+        senders = np.asarray(self.senders, dtype=np.intp)
+        receivers = np.asarray(self.receivers, dtype=np.intp)
+        self.senders.clear()
+        self.receivers.clear()
+
+        missing = self.learned[senders] & ~self.learned[receivers]
+        chance = self.rng.random((len(senders), self.bits)) < self.SHARE_CHANCE
+        transfer = missing & np.bitwise_or.reduce(
+            np.where(chance, self.bit_values, np.uint64(0)), axis=1)
+
+        # Varios emisores pueden enseñar al mismo receptor: OR acumulado
+        rows = np.unique(receivers)
+        before = self.learned[rows]
+        np.bitwise_or.at(self.learned, receivers, transfer)
+        gained = popcount_array(self.learned[rows] & ~before)
+        self.wisdom[rows] += gained
+        return int(gained.sum())
 
 
 class CreatureIntelligence:
-    """Sistema de inteligencia avanzada para criaturas"""
+    """Sistema de inteligencia avanzada para criaturas
+    
+    El conocimiento aprendido y los descubrimientos propios son bitsets
+    sobre ``KnowledgeBase.vocabulary``, y las observaciones se guardan en
+    un búfer circular de tamaño fijo con sumas móviles de la ventana de
+    análisis, así que registrar y analizar no reserva memoria.
+    """
+    
+    __slots__ = ('creature', 'knowledge_base', 'row', '_learned', '_wisdom', 'insight_mask',
+                 'recent_insights', 'strategies', 'observations', 'observation_count',
+                 'window_sums')
+    
+    MAX_OBSERVATIONS = 50
+    PATTERN_WINDOW = 10  # Observaciones recientes que se promedian
+    RECENT_INSIGHTS = 3  # Descubrimientos que se muestran en el panel
+    
+    # Columnas del búfer de observaciones
+    ENERGY, NEIGHBORS, FOOD = range(3)
     
     def __init__(self, creature, knowledge_base: KnowledgeBase):
         self.creature = creature
         self.knowledge_base = knowledge_base
         
-        # Conocimiento adquirido por esta criatura
-        self.learned_knowledge = set()
+        # Conocimiento adquirido y sabiduría: en la fila del KnowledgeStore
+        # mientras la criatura está registrada en el mundo
+        self.row = None
+        self._learned = 0
+        self._wisdom = 0
         
-        # Insights descubiertos
-        self.insights = []
+        # Descubrimientos propios (bitset)
+        self.insight_mask = 0
+        self.recent_insights = deque(maxlen=self.RECENT_INSIGHTS)  # Bits en orden
         
         # Estrategias aprendidas
         self.strategies = []
         
-        # Memoria de observaciones
-        self.observations = []
-        self.max_observations = 50
+        # Memoria de observaciones (búfer circular)
+        self.observations = np.zeros((self.MAX_OBSERVATIONS, 3), dtype=np.float64)
+        self.observation_count = 0  # Total registradas (no se reinicia al dar la vuelta)
+        self.window_sums = np.zeros(3, dtype=np.float64)
         
-        # Nivel de sabiduría (aumenta con descubrimientos)
-        self.wisdom = 0
+        if creature.handle is not None:
+            knowledge_base.store.attach(creature.handle[0], self)
+    
+    @property
+    def learned(self) -> int:
+        """Bitset del conocimiento adquirido"""
+        if self.row is None:
+            return self._learned
+        return int(self.knowledge_base.store.learned[self.row])
+    
+    @learned.setter
+    def learned(self, mask: int):
+        if self.row is None:
+            self._learned = mask
+        else:
+            self.knowledge_base.store.learned[self.row] = mask
+    
+    @property
+    def wisdom(self) -> int:
+        """Nivel de sabiduría (aumenta con descubrimientos)"""
+        if self.row is None:
+            return self._wisdom
+        return int(self.knowledge_base.store.wisdom[self.row])
+    
+    @wisdom.setter
+    def wisdom(self, value: int):
+        if self.row is None:
+            self._wisdom = value
+        else:
+            self.knowledge_base.store.wisdom[self.row] = value
+    
+    @property
+    def learned_knowledge(self) -> frozenset:
+        """Nombres del conocimiento aprendido"""
+        return frozenset(self.knowledge_base.names_of(self.learned))
+    
+    def knows(self, name: str) -> bool:
+        return bool(self.learned & self.knowledge_base.bit[name])
     
     def can_learn(self) -> bool:
         """Verificar si la criatura puede aprender (muy inteligente)"""
@@ -181,64 +398,70 @@ class CreatureIntelligence:
         if random.random() < 0.005:  # 0.5% por frame
             self._learn_from_successful()
     
+    def _add_insight(self, bit: int):
+        """Registrar un descubrimiento propio"""
+        self.insight_mask |= bit
+        self.recent_insights.append(bit)
+        self.wisdom += 1
+    
     def _try_discover_knowledge(self):
         """Intentar descubrir nuevo conocimiento"""
         # Elegir categoría aleatoria
-        categories = [
-            self.knowledge_base.survival_knowledge,
-            self.knowledge_base.social_knowledge,
-            self.knowledge_base.strategic_knowledge
-        ]
-        
-        category = random.choice(categories)
+        category = random.choice(self.knowledge_base.category_masks)
         
         # Intentar aprender algo nuevo
-        available = [k for k in category if k not in self.learned_knowledge]
+        available = category & ~self.learned
         if available:
-            new_knowledge = random.choice(available)
-            self.learned_knowledge.add(new_knowledge)
-            self.wisdom += 1
-            
-            # Registrar descubrimiento
-            insight = f"Descubrió: {new_knowledge.replace('_', ' ')}"
-            self.insights.append(insight)
+            bit = random_bit(available)
+            self.learned |= bit
+            self._add_insight(bit)
             
             if config.DEBUG.get('LOG_INTELLIGENCE', False):
+                insight = self.knowledge_base.describe(bit)
                 print(f"🧠 Criatura {self.creature.id} {insight} (sabiduría: {self.wisdom})")
     
+    def record_observation(self, energy: float, neighbors: float, food: float):
+        """Añadir observación al búfer circular y actualizar las sumas móviles"""
+        count = self.observation_count
+        if count >= self.PATTERN_WINDOW:
+            # Sale de la ventana la observación de hace PATTERN_WINDOW
+            self.window_sums -= self.observations[(count - self.PATTERN_WINDOW) % self.MAX_OBSERVATIONS]
+        row = self.observations[count % self.MAX_OBSERVATIONS]
+        row[self.ENERGY] = energy
+        row[self.NEIGHBORS] = neighbors
+        row[self.FOOD] = food
+        self.window_sums += row
+        self.observation_count = count + 1
+    
+    def recent_average(self, column: int) -> float:
+        """Media de una columna en la ventana de análisis"""
+        samples = min(self.observation_count, self.PATTERN_WINDOW)
+        return self.window_sums[column] / samples if samples else 0.0
+    
     def _analyze_current_situation(self):
         """Analizar situación actual y tomar decisiones inteligentes"""
-        # Registrar observación
-        observation = {
-            'energy': self.creature.energy / self.creature.max_energy,
-            'nearby_creatures': len(self.creature.world.get_creatures_near(
-                self.creature.x, self.creature.y, 100
-            )),
-            'nearby_food': len(self.creature.world.get_data_near(
-                self.creature.x, self.creature.y, 100
-            )),
-            'cycle': self.creature.world.cycle
-        }
-        
-        self.observations.append(observation)
-        if len(self.observations) > self.max_observations:
-            self.observations.pop(0)
+        creature = self.creature
+        world = creature.world
+        self.record_observation(
+            creature.energy / creature.max_energy,
+            world.count_creatures_near(creature.x, creature.y, 100),
+            world.count_data_near(creature.x, creature.y, 100)
+        )
         
         # Analizar patrones en observaciones
-        if len(self.observations) >= 10:
+        if self.observation_count >= self.PATTERN_WINDOW:
             self._detect_patterns()
     
     def _detect_patterns(self):
         """Detectar patrones en observaciones"""
         # Analizar tendencias de energía
-        recent_energy = [obs['energy'] for obs in self.observations[-10:]]
-        avg_energy = sum(recent_energy) / len(recent_energy)
+        avg_energy = self.recent_average(self.ENERGY)
         
         # Descubrir insight basado en datos
-        if avg_energy < 0.3 and 'conservar_energia_baja' in self.learned_knowledge:
-            if 'energia_critica_frecuente' not in [i for i in self.insights]:
-                self.insights.append('energia_critica_frecuente')
-                self.wisdom += 1
+        bit = self.knowledge_base.bit
+        if avg_energy < 0.3 and self.learned & bit['conservar_energia_baja']:
+            if not self.insight_mask & bit['energia_critica_frecuente']:
+                self._add_insight(bit['energia_critica_frecuente'])
     
     def _learn_from_successful(self):
         """Aprender observando criaturas exitosas"""
@@ -252,30 +475,44 @@ class CreatureIntelligence:
         # Si la estrategia es muy diferente a la nuestra, aprender
         if strategy['complexity'] > self.creature.complexity * 0.8:
             # Aprender algo de la estrategia
-            if strategy['is_predator'] and 'emboscar_presas' not in self.learned_knowledge:
-                if 'emboscar_presas' in self.knowledge_base.strategic_knowledge:
-                    self.learned_knowledge.add('emboscar_presas')
-                    self.wisdom += 1
-                    
-                    if config.DEBUG.get('LOG_INTELLIGENCE', False):
-                        print(f"🎓 Criatura {self.creature.id} aprendió de criaturas exitosas")
+            if strategy['is_predator'] and not self.knows('emboscar_presas'):
+                self.learned |= self.knowledge_base.bit['emboscar_presas']
+                self.wisdom += 1
+                
+                if config.DEBUG.get('LOG_INTELLIGENCE', False):
+                    print(f"🎓 Criatura {self.creature.id} aprendió de criaturas exitosas")
+    
+    def merge(self, mask: int) -> int:
+        """Incorporar conocimiento ajeno (OR). Retorna cuántas piezas son nuevas"""
+        new = mask & ~self.learned
+        self.learned |= new
+        gained = popcount(new)
+        self.wisdom += gained
+        return gained
     
     def share_knowledge(self, other_creature):
-        """Compartir conocimiento con otra criatura inteligente"""
-        if not hasattr(other_creature, 'intelligence'):
+        """Compartir conocimiento con otra criatura inteligente
+        
+        Con ambas registradas en el mundo el intercambio se encola y se
+        aplica en lote con ``KnowledgeStore.propagate`` al final del ciclo.
+        """
+        other = other_creature.intelligence
+        if other is None or not other.can_learn():
             return
         
-        if not other_creature.intelligence.can_learn():
+        if self.row is not None and other.row is not None:
+            self.knowledge_base.store.queue_share(self.row, other.row)
             return
         
-        # Compartir conocimiento que el otro no tiene
-        shared = 0
-        for knowledge in self.learned_knowledge:
-            if knowledge not in other_creature.intelligence.learned_knowledge:
-                if random.random() < 0.3:  # 30% de compartir cada pieza
-                    other_creature.intelligence.learned_knowledge.add(knowledge)
-                    other_creature.intelligence.wisdom += 1
-                    shared += 1
+        # Cada pieza que el otro no tiene se comparte con un 30%
+        missing = self.learned & ~other.learned
+        transfer = 0
+        while missing:
+            bit = missing & -missing
+            missing ^= bit
+            if random.random() < KnowledgeStore.SHARE_CHANCE:
+                transfer |= bit
+        shared = other.merge(transfer)
         
         if shared > 0 and config.DEBUG.get('LOG_INTELLIGENCE', False):
             print(f"📚 Criatura {self.creature.id} compartió {shared} conocimientos con Criatura {other_creature.id}")
@@ -284,7 +521,7 @@ class CreatureIntelligence:
         """Obtener resumen del conocimiento de la criatura"""
         return {
             'wisdom': self.wisdom,
-            'knowledge_count': len(self.learned_knowledge),
-            'insights_count': len(self.insights),
-            'recent_insights': self.insights[-3:] if self.insights else []
+            'knowledge_count': popcount(self.learned),
+            'insights_count': popcount(self.insight_mask),
+            'recent_insights': [self.knowledge_base.describe(bit) for bit in self.recent_insights]
         }
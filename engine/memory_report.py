@@ -0,0 +1,273 @@
+"""
+Informe de memoria - Bytes por subsistema y diferencias de tracemalloc
+"""
+
+import sys
+import types
+import tracemalloc
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import config
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Subsistemas del mundo que se miden (atributo, etiqueta)
+SUBSYSTEMS = (
+    ('brain_store', 'Pesos neuronales (BrainStore)'),
+    ('knowledge_base', 'Conocimiento colectivo'),
+    ('data_items', 'Alimento (FoodStore)'),
+    ('creature_grid', 'Índice espacial de criaturas'),
+    ('data_grid', 'Índice espacial de alimento'),
+    ('metrics', 'Historial de métricas'),
+    ('disease_system', 'Enfermedades'),
+    ('species_tracker', 'Especies'),
+    ('communication', 'Efectos de palabras'),
+    ('stats', 'Estadísticas'),
+    ('pending_births', 'Nacimientos pendientes'),
+)
+
+# Componentes de cada criatura (atributo, etiqueta); None = el propio objeto
+COMPONENTS = (
+    (None, 'Objeto criatura'),
+    ('genome', 'Genoma'),
+    ('brain', 'Red neuronal'),
+    ('vocal_system', 'Sistema vocal'),
+    ('intelligence', 'Inteligencia'),
+    ('infection', 'Infección'),
+)
+
+# Objetos compartidos que nunca se atribuyen a un subsistema
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+               types.MethodType, types.CodeType)
+
+
+def _root_base(array: np.ndarray) -> np.ndarray:
+    """Array que posee realmente la memoria de una vista"""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def array_bytes(array: np.ndarray, seen: set) -> int:
+    """Bytes de un array contando una sola vez el búfer al que apunta
+
+    Una vista pequeña de un búfer grande mantiene vivo el búfer entero, así
+    que se le atribuye el búfer completo la primera vez que aparece.
+    """
+    total = sys.getsizeof(array)  # Incluye los datos solo si el array es su dueño
+    if array.base is not None:
+        root = _root_base(array)
+        if id(root) not in seen:
+            seen.add(id(root))
+            total += root.nbytes
+    return total
+
+
+def deep_sizeof(obj, seen: set) -> int:
+    """Bytes alcanzables desde ``obj`` que no estén ya en ``seen``"""
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if item is None or id(item) in seen or isinstance(item, _SKIP_TYPES):
+            continue
+        seen.add(id(item))
+        if isinstance(item, np.ndarray):
+            total += array_bytes(item, seen)
+            continue
+        total += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, complex, bool)):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        else:
+            attrs = getattr(item, '__dict__', None)
+            if attrs is not None:
+                stack.append(attrs)
+            for cls in type(item).__mro__:
+                for name in cls.__dict__.get('__slots__', ()):
+                    stack.append(getattr(item, name, None))
+    return total
+
+
+def subsystem_bytes(world, seen: set) -> Dict[str, int]:
+    """Bytes de cada subsistema del mundo (sin contar las criaturas)"""
+    return {label: deep_sizeof(getattr(world, attr, None), seen) for attr, label in SUBSYSTEMS}
+
+
+def component_bytes(world, seen: set) -> Tuple[Dict[str, int], dict]:
+    """Bytes por componente sumados sobre toda la población
+
+    Devuelve también cuántas memorias de red son vistas de un búfer que no
+    es la memoria del BrainStore y cuántos bytes retienen (resultados de lotes).
+    """
+    totals = dict.fromkeys((label for _, label in COMPONENTS), 0)
+    views = {'memory_views': 0, 'retained_bytes': 0}
+    store_memory = world.brain_store.memory
+    for creature in world.creatures:
+        memory = creature.brain.memory
+        root = _root_base(memory)
+        if root is not memory and root is not store_memory:
+            views['memory_views'] += 1
+            if id(root) not in seen:
+                views['retained_bytes'] += root.nbytes
+        for attr, label in COMPONENTS:
+            if attr is None:
+                totals[label] += sys.getsizeof(creature)
+            else:
+                totals[label] += deep_sizeof(getattr(creature, attr), seen)
+    return totals, views
+
+
+def peak_rss() -> Optional[int]:
+    """Pico de memoria residente del proceso en bytes (None si no se sabe)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux da KiB
+
+
+class MemoryTracker:
+    """Instantáneas de tracemalloc y diferencias entre informes
+
+    tracemalloc solo ve lo que se reserva después de arrancarlo y ralentiza
+    la simulación mientras está activo, así que se arranca con el primer
+    informe: ese informe marca la línea base y los siguientes muestran qué
+    líneas de código han crecido desde el anterior.
+    """
+
+    # Reservas del propio informe y del intérprete que no interesan al buscar fugas
+    IGNORED_FILES = frozenset((tracemalloc.__file__, __file__))
+
+    def __init__(self, frames: int = 1):
+        self.frames = frames
+        self._previous = None
+        self._previous_cycle = None
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self):
+        tracemalloc.stop()
+        self._previous = None
+        self._previous_cycle = None
+
+    def take(self, cycle: int, limit: int = None) -> Tuple[Optional[int], List[tuple]]:
+        """Tomar instantánea y compararla con la anterior
+
+        Devuelve el ciclo de la instantánea anterior (None en la primera) y
+        las líneas que más han crecido: (fichero:línea, bytes, bloques).
+        """
+        self.start()
+        snapshot = tracemalloc.take_snapshot()
+        previous, previous_cycle = self._previous, self._previous_cycle
+        self._previous, self._previous_cycle = snapshot, cycle
+        if previous is None:
+            return None, []
+
+        growth = []
+        for stat in snapshot.compare_to(previous, 'lineno'):
+            frame = stat.traceback[0]
+            if stat.size_diff <= 0 or frame.filename in self.IGNORED_FILES or frame.filename.startswith('<'):
+                continue
+            growth.append((f"{frame.filename}:{frame.lineno}", stat.size_diff, stat.count_diff))
+            if len(growth) >= (limit or config.MEMORY_REPORT_TOP):
+                break
+        return previous_cycle, growth
+
+
+def build_report(world, tracker: MemoryTracker = None) -> dict:
+    """Medir la memoria del mundo (y diferencias de tracemalloc si hay tracker)"""
+    # Instantánea antes de medir para que la propia medición no aparezca como crecimiento
+    since_cycle, growth = tracker.take(world.cycle) if tracker is not None else (None, [])
+
+    # Las criaturas y sus componentes se atribuyen a la población, no a los
+    # subsistemas que las apuntan (índices espaciales, BrainStore, especies...)
+    components = {id(getattr(creature, attr)) for creature in world.creatures
+                  for attr, _ in COMPONENTS if attr is not None}
+    seen = {id(world)}
+    seen.update(id(creature) for creature in world.creatures)
+    seen.update(components)
+    subsystems = subsystem_bytes(world, seen)
+    seen -= components
+    components, views = component_bytes(world, seen)
+
+    report = {
+        'cycle': world.cycle,
+        'population': world.population,
+        'subsystems': subsystems,
+        'components': components,
+        'memory_views': views['memory_views'],
+        'retained_bytes': views['retained_bytes'],
+        'peak_rss': peak_rss(),
+        'traced': tracemalloc.get_traced_memory()[0] if tracker is not None else None,
+        'since_cycle': since_cycle,
+        'growth': growth,
+    }
+    return report
+
+
+def _size(value: float) -> str:
+    """Bytes en unidades legibles"""
+    for unit in ('B', 'KB', 'MB'):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def format_report(report: dict) -> str:
+    """Texto del informe para la consola"""
+    population = report['population']
+    lines = [f"🧮 Memoria - ciclo {report['cycle']} ({population} criaturas)"]
+    if report['peak_rss'] is not None:
+        lines.append(f"   RSS máximo del proceso: {_size(report['peak_rss'])}")
+    if report['traced'] is not None:
+        lines.append(f"   Reservado desde que se activó tracemalloc: {_size(report['traced'])}")
+
+    lines.append("   Subsistemas:")
+    for label, size in sorted(report['subsystems'].items(), key=lambda item: -item[1]):
+        lines.append(f"     {label:<32}{_size(size):>12}")
+
+    lines.append("   Criaturas (total / por criatura):")
+    for label, size in report['components'].items():
+        per_creature = size / population if population else 0
+        lines.append(f"     {label:<32}{_size(size):>12}{_size(per_creature):>12}")
+    if report['memory_views']:
+        lines.append(f"     Memorias de red que son vistas de un lote: {report['memory_views']} "
+                     f"(retienen {_size(report['retained_bytes'])})")
+
+    if report['since_cycle'] is None:
+        if report['traced'] is not None:
+            lines.append("   tracemalloc activo: el próximo informe mostrará el crecimiento")
+    elif report['growth']:
+        lines.append(f"   Crecimiento desde el ciclo {report['since_cycle']}:")
+        for location, size, count in report['growth']:
+            lines.append(f"     {_size(size):>10}  {count:+7d} bloques  {location}")
+    else:
+        lines.append(f"   Sin crecimiento desde el ciclo {report['since_cycle']}")
+    return "\n".join(lines)
+
+
+# Instancia global (tracemalloc es único por proceso)
+_memory_tracker = None
+
+def get_memory_tracker() -> MemoryTracker:
+    """Obtener instancia global del rastreador de memoria"""
+    global _memory_tracker
+    if _memory_tracker is None:
+        _memory_tracker = MemoryTracker(config.MEMORY_TRACE_FRAMES)
+    return _memory_tracker
@@ -0,0 +1,193 @@
+"""
+Historial de métricas - Buffers circulares con submuestreo jerárquico
+"""
+
+import csv
+from typing import Dict, Tuple
+import numpy as np
+import config
+
+
+# Métricas registradas por ciclo y cómo se agregan al submuestrear
+METRICS = (
+    ('population', 'mean'),
+    ('births', 'sum'),
+    ('deaths', 'sum'),
+    ('max_complexity', 'max'),
+    ('avg_complexity', 'mean'),
+    ('species', 'mean'),
+    ('predation_kills', 'sum'),
+    ('infections', 'mean'),
+    ('food', 'mean'),
+)
+METRIC_NAMES = tuple(name for name, _ in METRICS)
+METRIC_INDEX = {name: i for i, name in enumerate(METRIC_NAMES)}
+
+
+class MetricsTier:
+    """Buffer circular de tamaño fijo para un nivel de resolución"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.cycles = np.zeros(capacity, dtype=np.int64)  # Último ciclo de cada muestra
+        self.values = np.zeros((capacity, len(METRICS)), dtype=np.float64)
+        self.head = 0  # Próxima posición de escritura
+        self.count = 0
+
+    def push(self, cycle: int, row: np.ndarray):
+        """Añadir muestra (sobrescribe la más antigua si está lleno)"""
+        self.cycles[self.head] = cycle
+        self.values[self.head] = row
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Ciclos y valores de la más antigua a la más reciente (copias)"""
+        if self.count < self.capacity:
+            return self.cycles[:self.count].copy(), self.values[:self.count].copy()
+        order = np.roll(np.arange(self.capacity), -self.head)
+        return self.cycles[order], self.values[order]
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.capacity
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+
+class MetricsRecorder:
+    """Serie temporal de métricas del ecosistema con memoria acotada
+
+    Cada ciclo se añade una fila al nivel 0 (resolución completa). Cada
+    ``factor`` filas de un nivel se agregan en una fila del siguiente
+    (media, suma o máximo según la métrica), de modo que con 3 niveles y
+    factor 10 se conserva el historial reciente ciclo a ciclo y el antiguo
+    a 1/10 y 1/100 de resolución, sin crecer nunca más allá de
+    ``levels * capacity`` filas.
+    """
+
+    def __init__(self, capacity: int = None, factor: int = None, levels: int = None):
+        self.capacity = capacity or config.METRICS_CAPACITY
+        self.factor = factor or config.METRICS_DOWNSAMPLE
+        levels = levels or config.METRICS_LEVELS
+        self.tiers = [MetricsTier(self.capacity) for _ in range(levels)]
+
+        # Acumuladores de las filas pendientes de agregar en cada nivel superior
+        self._pending = [np.zeros((self.factor, len(METRICS))) for _ in range(levels - 1)]
+        self._pending_count = [0] * (levels - 1)
+        self._agg_sum = np.array([mode == 'sum' for _, mode in METRICS])
+        self._agg_max = np.array([mode == 'max' for _, mode in METRICS])
+
+        # Totales acumulados del mundo en el ciclo anterior (para obtener deltas)
+        self._last_totals = None
+
+    # ==================== Registro ====================
+
+    def record(self, world):
+        """Registrar las métricas del ciclo actual del mundo"""
+        creatures = world.creatures
+        population = len(creatures)
+        complexities = np.fromiter((c.complexity for c in creatures), dtype=np.float64,
+                                   count=population)
+        infections = sum(1 for c in creatures if c.infection)
+
+        totals = (world.total_births, world.total_deaths, world.predation_kills)
+        last = self._last_totals or totals
+        self._last_totals = totals
+
+        row = np.array([
+            population,
+            totals[0] - last[0],
+            totals[1] - last[1],
+            complexities.max() if population else 0.0,
+            complexities.mean() if population else 0.0,
+            world.species_count,
+            totals[2] - last[2],
+            infections,
+            len(world.data_items),
+        ], dtype=np.float64)
+        self.push(world.cycle, row)
+
+    def push(self, cycle: int, row):
+        """Añadir una fila al nivel 0 y propagar agregados a los superiores"""
+        row = np.asarray(row, dtype=np.float64)
+        self.tiers[0].push(cycle, row)
+
+        for level, pending in enumerate(self._pending):
+            pending[self._pending_count[level]] = row
+            self._pending_count[level] += 1
+            if self._pending_count[level] < self.factor:
+                return
+            self._pending_count[level] = 0
+            row = np.where(self._agg_sum, pending.sum(axis=0),
+                           np.where(self._agg_max, pending.max(axis=0), pending.mean(axis=0)))
+            self.tiers[level + 1].push(cycle, row)
+
+    # ==================== Consulta ====================
+
+    def __len__(self) -> int:
+        return self.tiers[0].count
+
+    def series(self, name: str, level: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """Ciclos y valores de una métrica en un nivel"""
+        cycles, values = self.tiers[level].ordered()
+        return cycles, values[:, METRIC_INDEX[name]]
+
+    def history_level(self) -> int:
+        """Nivel más fino que aún conserva el historial completo"""
+        for level, tier in enumerate(self.tiers):
+            if not tier.full:
+                return level
+        return len(self.tiers) - 1
+
+    def history(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Historial completo de una métrica a la mejor resolución disponible"""
+        return self.series(name, self.history_level())
+
+    def history_span(self) -> int:
+        """Ciclos cubiertos por el historial de ``history()``"""
+        tier = self.tiers[self.history_level()]
+        if not tier.count:
+            return 0
+        cycles, _ = tier.ordered()
+        return int(cycles[-1] - cycles[0]) + 1
+
+    def latest(self) -> Dict[str, float]:
+        """Última fila registrada"""
+        tier = self.tiers[0]
+        if not tier.count:
+            return {}
+        row = tier.values[(tier.head - 1) % tier.capacity]
+        return dict(zip(METRIC_NAMES, row.tolist()))
+
+    # ==================== Exportación ====================
+
+    def export_csv(self, filename: str, level: int = None):
+        """Exportar un nivel a CSV (por defecto el que cubre todo el historial)"""
+        if level is None:
+            level = self.history_level()
+        cycles, values = self.tiers[level].ordered()
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('cycle',) + METRIC_NAMES)
+            for cycle, row in zip(cycles.tolist(), values.tolist()):
+                writer.writerow([cycle] + row)
+
+    def export_columns(self, filename: str):
+        """Exportar todos los niveles en formato columnar (.npz, una columna por array)"""
+        columns = {}
+        for level, tier in enumerate(self.tiers):
+            cycles, values = tier.ordered()
+            columns[f'level{level}/cycle'] = cycles
+            for i, name in enumerate(METRIC_NAMES):
+                columns[f'level{level}/{name}'] = values[:, i]
+        np.savez_compressed(filename, **columns)
+
+    def clear(self):
+        """Vaciar el historial"""
+        for tier in self.tiers:
+            tier.clear()
+        self._pending_count = [0] * len(self._pending)
+        self._last_totals = None
@@ -17,7 +17,7 @@ except ImportError:
 
 
 class NeuralBatchProcessor:
-    """Procesador por lotes de redes neuronales en GPU"""
+    """Procesador por lotes de redes neuronales (GPU con OpenCL o CPU con numpy)"""
     
     def __init__(self):
         self.cl_context = None
@@ -30,6 +30,11 @@ class NeuralBatchProcessor:
         self.kernel_layer2 = None
         self.kernel_output = None
         
+        # Búferes persistentes del lote (ver _reserve)
+        self._layout = None  # BrainStore para el que están dimensionados
+        self._capacity = 0
+        self._device = {}
+        
         if config.USE_GPU and OPENCL_AVAILABLE:
             self._init_opencl()
     
@@ -173,101 +178,159 @@ class NeuralBatchProcessor:
             print(f"⚠️  No se pudo inicializar procesador por lotes: {e}")
             self.initialized = False
     
-    def process_batch(self, creatures: List, inputs_batch: List[np.ndarray]) -> List[np.ndarray]:
-        """Procesar un lote de criaturas en paralelo"""
-        if not self.initialized or len(creatures) == 0:
-            # Fallback a procesamiento secuencial
-            return [c.brain._forward_cpu(inp) for c, inp in zip(creatures, inputs_batch)]
+    def _reserve(self, store, count: int):
+        """Búferes persistentes del lote (solo crecen: sin reservas por frame)"""
+        if store is self._layout and count <= self._capacity:
+            return
+        capacity = max(count, self._capacity * 2 if store is self._layout else 0, config.GPU_BATCH_SIZE)
+        self._layout = store
+        self._capacity = capacity
         
-        try:
-            batch_size = len(creatures)
-            
-            # Obtener dimensiones de la primera red
-            first_brain = creatures[0].brain
-            input_size = first_brain.input_size
-            hidden_size = first_brain.hidden_size
-            hidden2_size = first_brain.hidden_size2
-            output_size = first_brain.output_size
-            
-            # Preparar datos en formato de lote
-            inputs_flat = np.concatenate([inp.flatten() for inp in inputs_batch]).astype(np.float32)
-            
-            # Recopilar pesos y biases de todas las redes
-            weights_ih1 = np.concatenate([c.brain.weights_ih1.flatten() for c in creatures]).astype(np.float32)
-            weights_h1h2 = np.concatenate([c.brain.weights_h1h2.flatten() for c in creatures]).astype(np.float32)
-            weights_h2o = np.concatenate([c.brain.weights_h2o.flatten() for c in creatures]).astype(np.float32)
-            
-            biases_h1 = np.concatenate([c.brain.bias_h1 for c in creatures]).astype(np.float32)
-            biases_h2 = np.concatenate([c.brain.bias_h2 for c in creatures]).astype(np.float32)
-            biases_o = np.concatenate([c.brain.bias_o for c in creatures]).astype(np.float32)
-            
-            memory = np.concatenate([c.brain.memory for c in creatures]).astype(np.float32)
-            
-            # Crear buffers en GPU
-            inputs_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=inputs_flat)
-            weights_ih1_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=weights_ih1)
-            weights_h1h2_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=weights_h1h2)
-            weights_h2o_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=weights_h2o)
-            biases_h1_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=biases_h1)
-            biases_h2_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=biases_h2)
-            biases_o_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=biases_o)
-            memory_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_ONLY | cl.mem_flags.COPY_HOST_PTR, hostbuf=memory)
-            
-            # Buffers de salida
-            hidden1_out = np.zeros(batch_size * hidden_size, dtype=np.float32)
-            hidden2_out = np.zeros(batch_size * hidden2_size, dtype=np.float32)
-            output_out = np.zeros(batch_size * output_size, dtype=np.float32)
-            
-            hidden1_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_WRITE, hidden1_out.nbytes)
-            hidden2_buf = cl.Buffer(self.cl_context, cl.mem_flags.READ_WRITE, hidden2_out.nbytes)
-            output_buf = cl.Buffer(self.cl_context, cl.mem_flags.WRITE_ONLY, output_out.nbytes)
-            
-            # Ejecutar kernels en secuencia (usando kernels cacheados)
-            # Capa 1
-            self.kernel_layer1(
-                self.cl_queue, (batch_size, hidden_size), None,
-                inputs_buf, weights_ih1_buf, biases_h1_buf, hidden1_buf,
-                np.int32(batch_size), np.int32(input_size), np.int32(hidden_size)
-            )
-            
-            # Capa 2
-            self.kernel_layer2(
-                self.cl_queue, (batch_size, hidden2_size), None,
-                hidden1_buf, weights_h1h2_buf, biases_h2_buf, memory_buf, hidden2_buf,
-                np.int32(batch_size), np.int32(hidden_size), np.int32(hidden2_size),
-                np.float32(first_brain.memory_decay)
-            )
-            
-            # Capa de salida
-            self.kernel_output(
-                self.cl_queue, (batch_size, output_size), None,
-                hidden2_buf, weights_h2o_buf, biases_o_buf, output_buf,
-                np.int32(batch_size), np.int32(hidden2_size), np.int32(output_size)
-            )
-            
-            # Leer resultados
-            cl.enqueue_copy(self.cl_queue, hidden2_out, hidden2_buf)
-            cl.enqueue_copy(self.cl_queue, output_out, output_buf)
-            
-            # Actualizar memoria de cada criatura
-            for i, creature in enumerate(creatures):
-                start_idx = i * hidden2_size
-                end_idx = start_idx + hidden2_size
-                creature.brain.memory = hidden2_out[start_idx:end_idx]
-            
-            # Dividir resultados por criatura
-            results = []
-            for i in range(batch_size):
-                start_idx = i * output_size
-                end_idx = start_idx + output_size
-                results.append(output_out[start_idx:end_idx])
-            
-            return results
-            
-        except Exception as e:
-            # Fallback a CPU si falla
-            print(f"⚠️  Error en procesamiento por lotes, usando CPU: {e}")
-            return [c.brain._forward_cpu(inp) for c, inp in zip(creatures, inputs_batch)]
+        self._rows = np.zeros(capacity, dtype=np.intp)
+        self._inputs = np.zeros((capacity, store.input_size), dtype=np.float32)
+        self._hidden1 = np.zeros((capacity, store.hidden_size), dtype=np.float32)
+        self._hidden2 = np.zeros((capacity, store.hidden_size2), dtype=np.float32)
+        self._memory = np.zeros((capacity, store.hidden_size2), dtype=np.float32)
+        self._outputs = np.zeros((capacity, store.output_size), dtype=np.float32)
+        
+        # Filas de parámetros del lote y una copia contigua de cada tensor: operar
+        # sobre vistas con saltos obliga a numpy a reservar búferes intermedios
+        self._block = np.zeros((capacity, store.param_count), dtype=np.float32)
+        self._block_views = {
+            name: self._block[:, start:end].reshape((capacity,) + store.shapes[name])
+            for name, (start, end) in store.columns.items()
+        }
+        self._params = {
+            name: np.zeros((capacity,) + store.shapes[name], dtype=np.float32)
+            for name in store.TENSORS
+        }
+        
+        self._device = {}
+        if self.initialized:
+            host = dict(self._params, inputs=self._inputs, hidden1=self._hidden1,
+                        hidden2=self._hidden2, memory=self._memory, outputs=self._outputs)
+            for name, array in host.items():
+                self._device[name] = cl.Buffer(self.cl_context, cl.mem_flags.READ_WRITE, array.nbytes)
+    
+    def _gather(self, store, creatures: List, inputs_batch) -> int:
+        """Copiar entradas, pesos y memoria del lote a los búferes persistentes"""
+        count = len(creatures)
+        self._reserve(store, count)
+        rows = self._rows[:count]
+        for i, creature in enumerate(creatures):
+            rows[i] = creature.brain.row
+            self._inputs[i] = inputs_batch[i]
+        
+        # mode='clip' evita el búfer intermedio de np.take (filas siempre válidas)
+        np.take(store.params, rows, axis=0, out=self._block[:count], mode='clip')
+        for name, view in self._block_views.items():
+            np.copyto(self._params[name][:count], view[:count])
+        np.take(store.memory, rows, axis=0, out=self._memory[:count], mode='clip')
+        return count
+    
+    def process_batch(self, creatures: List, inputs_batch, use_gpu: bool = True) -> List[np.ndarray]:
+        """Procesar un lote de criaturas en paralelo
+        
+        Con todas las redes en el mismo BrainStore el lote trabaja sobre
+        búferes persistentes del procesador y escribe la memoria de corto
+        plazo en la fila de cada red del almacén. Las salidas son filas del
+        búfer de salida: válidas hasta la siguiente llamada. ``use_gpu=False``
+        fuerza el camino numpy aunque haya OpenCL.
+        """
+        if len(creatures) == 0:
+            return []
+        store = creatures[0].brain.store
+        if store is None or any(c.brain.store is not store for c in creatures):
+            # Redes sueltas (fuera del almacén): procesamiento secuencial
+            return [c.brain.forward(inp) for c, inp in zip(creatures, inputs_batch)]
+        
+        count = self._gather(store, creatures, inputs_batch)
+        decay = creatures[0].brain.memory_decay
+        
+        if self.initialized and use_gpu:
+            try:
+                self._forward_gpu(count, decay)
+            except Exception as e:
+                # Fallback a CPU si falla
+                print(f"⚠️  Error en procesamiento por lotes, usando CPU: {e}")
+                self.initialized = False
+                self._layout = None  # Recrear búferes sin los de la GPU
+                count = self._gather(store, creatures, inputs_batch)
+                self._forward_cpu(count, decay)
+        else:
+            self._forward_cpu(count, decay)
+        
+        # Memoria de vuelta a la fila de cada red, en su sitio
+        store.memory[self._rows[:count]] = self._hidden2[:count]
+        return self._outputs[:count]
+    
+    def _forward_cpu(self, count: int, decay: float):
+        """Las tres capas del lote con numpy, escribiendo en los búferes persistentes"""
+        params = self._params
+        hidden1 = self._hidden1[:count]
+        hidden2 = self._hidden2[:count]
+        memory = self._memory[:count]
+        output = self._outputs[:count]
+        
+        # Capa 1: input -> hidden1 (ReLU)
+        np.matmul(self._inputs[:count, None, :], params['weights_ih1'][:count], out=hidden1[:, None, :])
+        hidden1 += params['bias_h1'][:count]
+        np.maximum(hidden1, 0, out=hidden1)
+        
+        # Capa 2: hidden1 -> hidden2 (con memoria, tanh)
+        np.matmul(hidden1[:, None, :], params['weights_h1h2'][:count], out=hidden2[:, None, :])
+        hidden2 += params['bias_h2'][:count]
+        memory *= np.float32(decay)
+        hidden2 += memory
+        np.tanh(hidden2, out=hidden2)
+        
+        # Capa 3: hidden2 -> output (sigmoide)
+        np.matmul(hidden2[:, None, :], params['weights_h2o'][:count], out=output[:, None, :])
+        output += params['bias_o'][:count]
+        np.clip(output, -500, 500, out=output)
+        np.negative(output, out=output)
+        np.exp(output, out=output)
+        output += 1
+        np.reciprocal(output, out=output)
+    
+    def _forward_gpu(self, count: int, decay: float):
+        """Las tres capas del lote en OpenCL (búferes de dispositivo persistentes)"""
+        store = self._layout
+        device = self._device
+        queue = self.cl_queue
+        
+        # Subir solo las filas del lote
+        cl.enqueue_copy(queue, device['inputs'], self._inputs[:count])
+        cl.enqueue_copy(queue, device['memory'], self._memory[:count])
+        for name, params in self._params.items():
+            cl.enqueue_copy(queue, device[name], params[:count])
+        
+        # Ejecutar kernels en secuencia (usando kernels cacheados)
+        # Capa 1
+        self.kernel_layer1(
+            queue, (count, store.hidden_size), None,
+            device['inputs'], device['weights_ih1'], device['bias_h1'], device['hidden1'],
+            np.int32(count), np.int32(store.input_size), np.int32(store.hidden_size)
+        )
+        
+        # Capa 2
+        self.kernel_layer2(
+            queue, (count, store.hidden_size2), None,
+            device['hidden1'], device['weights_h1h2'], device['bias_h2'], device['memory'], device['hidden2'],
+            np.int32(count), np.int32(store.hidden_size), np.int32(store.hidden_size2),
+            np.float32(decay)
+        )
+        
+        # Capa de salida
+        self.kernel_output(
+            queue, (count, store.output_size), None,
+            device['hidden2'], device['weights_h2o'], device['bias_o'], device['outputs'],
+            np.int32(count), np.int32(store.hidden_size2), np.int32(store.output_size)
+        )
+        
+        # Leer resultados en los búferes persistentes del host
+        cl.enqueue_copy(queue, self._hidden2[:count], device['hidden2'])
+        cl.enqueue_copy(queue, self._outputs[:count], device['outputs'])
 
 
 # Instancia global del procesador
@@ -25,14 +25,23 @@ class NeuralNetwork:
     _cl_queue = None
     _cl_program = None
     
-    def __init__(self, input_size: int, hidden_size: int, output_size: int, parent: Optional['NeuralNetwork'] = None):
+    def __init__(self, input_size: int, hidden_size: int, output_size: int,
+                 parent: Optional['NeuralNetwork'] = None, initialize: bool = True):
         self.input_size = input_size
         self.hidden_size = hidden_size
         self.hidden_size2 = hidden_size // 2  # Segunda capa más pequeña
         self.output_size = output_size
         
-        # Si hay padre, heredar pesos con mutación
-        if parent:
+        # Almacén apilado al que pertenecen los pesos (ver BrainStore)
+        self.store = None
+        self.row = None
+        
+        if not initialize:
+            # Pesos escritos después por BrainStore.inherit_rows (nacimientos en lote)
+            self.weights_ih1 = self.weights_h1h2 = self.weights_h2o = None
+            self.bias_h1 = self.bias_h2 = self.bias_o = None
+        elif parent:
+            # Si hay padre, heredar pesos con mutación
             self._inherit_from_parent(parent)
         else:
             # Inicializar pesos aleatoriamente (Xavier initialization)
@@ -186,8 +195,8 @@ class NeuralNetwork:
         hidden2 = hidden2 + self.memory * self.memory_decay
         hidden2 = self.tanh(hidden2)
         
-        # Actualizar memoria
-        self.memory = hidden2.copy()
+        # Actualizar memoria (en su sitio: puede ser la fila del BrainStore)
+        self.memory[:] = hidden2
         
         # Capa 3: hidden2 -> output
         output = np.dot(hidden2, self.weights_h2o) + self.bias_o
@@ -226,7 +235,7 @@ class NeuralNetwork:
             # Leer resultados
             cl.enqueue_copy(self._cl_queue, output, output_buf)
             cl.enqueue_copy(self._cl_queue, new_memory, new_memory_buf)
-            self.memory = new_memory
+            self.memory[:] = new_memory
             
             return output.tolist()
         except Exception as e:
@@ -250,6 +259,11 @@ class NeuralNetwork:
     
     def mutate(self, rate: float = 0.1, strength: float = 0.2):
         """Mutar pesos de la red con estrategia adaptativa"""
+        # Red en el almacén de la población: mutación vectorizada de su fila
+        if self.store is not None:
+            self.store.mutate_rows([self.row], rate, strength)
+            return
+        
         # Mutación más agresiva en capas tempranas
         for weights, layer_strength in [
             (self.weights_ih1, strength * 1.2),
@@ -266,7 +280,7 @@ class NeuralNetwork:
     
     def reset_memory(self):
         """Resetear memoria de corto plazo"""
-        self.memory = np.zeros(self.hidden_size2, dtype=np.float32)
+        self.memory.fill(0)
 
 
 class NeuralNetworkBatch:
@@ -0,0 +1,53 @@
+"""
+Planificador escalonado de comportamientos periódicos
+"""
+
+from typing import Dict
+import config
+
+
+class BehaviorScheduler:
+    """Reparte cada comportamiento periódico entre los ticks de su periodo
+
+    Un comportamiento con periodo de P ticks divide las criaturas en P
+    cubetas por slot del SlotMap; en cada tick solo actúa la cubeta que
+    toca. Así cada tick procesa una fracción fija de la población en vez
+    de que toda una cohorte nacida a la vez escanee su entorno en el mismo
+    frame (lo que ocurría con ``age % N < dt``). Cada comportamiento usa un
+    desfase distinto para que una misma criatura no acumule todos sus
+    comportamientos en el mismo tick.
+    """
+
+    def __init__(self, periods: Dict[str, float] = None, step_dt: float = None):
+        self.periods = dict(periods or config.BEHAVIOR_PERIODS)  # Segundos simulados
+        # Desfase por comportamiento repartido a lo largo del periodo
+        count = len(self.periods)
+        self._offset_fraction = {name: i / count for i, name in enumerate(self.periods)}
+        self._ticks: Dict[str, int] = {}
+        self._offset: Dict[str, int] = {}
+        self._phase: Dict[str, int] = dict.fromkeys(self.periods, 0)
+        self._dt = None
+        self._set_dt(step_dt or 1.0 / (config.SIM_TICK_RATE * max(1, config.PHYSICS_SUBSTEPS)))
+
+    def _set_dt(self, dt: float):
+        """Convertir los periodos de segundos a ticks para este paso"""
+        self._dt = dt
+        for name, seconds in self.periods.items():
+            ticks = max(1, int(round(seconds / dt)))
+            self._ticks[name] = ticks
+            self._offset[name] = int(self._offset_fraction[name] * ticks)
+
+    def begin_tick(self, tick: int, dt: float):
+        """Fijar la cubeta activa de cada comportamiento para este tick"""
+        if dt != self._dt:
+            self._set_dt(dt)
+        for name, ticks in self._ticks.items():
+            self._phase[name] = tick % ticks
+
+    def due(self, behavior: str, slot: int) -> bool:
+        """¿Le toca al slot ejecutar el comportamiento en este tick?"""
+        return (slot + self._offset[behavior]) % self._ticks[behavior] == self._phase[behavior]
+
+    def period_ticks(self, behavior: str) -> int:
+        """Periodo del comportamiento en ticks"""
+        return self._ticks[behavior]
@@ -0,0 +1,50 @@
+"""
+Reloj de simulación - Paso fijo independiente de la tasa de frames
+"""
+
+import config
+
+
+class SimulationClock:
+    """Acumulador de tiempo de paso fijo
+
+    Cada frame aporta su tiempo real (escalado por la velocidad) al
+    acumulador y se ejecutan tantos pasos de ``step_dt`` como quepan. La
+    velocidad cambia el número de pasos, nunca su duración, de modo que a
+    10x las colisiones y la comida se evalúan igual que a 1x. Si la CPU no
+    da abasto bajan los FPS; solo cuando se superaría ``max_steps`` por
+    frame se descarta el tiempo sobrante (la simulación se ralentiza en
+    lugar de dar pasos más largos). ``alpha`` es la fracción de paso
+    pendiente, para interpolar el renderizado entre los dos últimos estados.
+    """
+
+    MAX_FRAME_TIME = 0.25  # Límite por frame (p. ej. tras arrastrar la ventana)
+
+    def __init__(self, tick_rate: float = None, substeps: int = None, max_steps: int = None):
+        tick_rate = tick_rate or config.SIM_TICK_RATE
+        substeps = max(1, substeps or config.PHYSICS_SUBSTEPS)
+        self.step_dt = 1.0 / (tick_rate * substeps)
+        self.max_steps = max_steps or config.MAX_SIM_STEPS_PER_FRAME
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_time = 0.0  # Tiempo simulado descartado por falta de CPU
+
+    def advance(self, frame_dt: float, speed: float = 1.0) -> int:
+        """Añadir el tiempo del frame y retornar cuántos pasos fijos ejecutar"""
+        self.accumulator += min(frame_dt, self.MAX_FRAME_TIME) * speed
+        steps = int(self.accumulator / self.step_dt)
+
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.step_dt
+            steps = self.max_steps
+            self.accumulator %= self.step_dt
+        else:
+            self.accumulator -= steps * self.step_dt
+
+        self.alpha = self.accumulator / self.step_dt
+        return steps
+
+    def reset(self):
+        """Descartar el tiempo acumulado"""
+        self.accumulator = 0.0
+        self.alpha = 0.0
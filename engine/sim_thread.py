@@ -0,0 +1,284 @@
+"""
+Ejecución de la simulación - En el hilo de la UI o en un hilo propio
+"""
+
+import queue
+import threading
+from abc import ABC, abstractmethod
+import time
+import traceback
+import config
+from .sim_clock import SimulationClock
+from .memory_report import build_report, format_report, get_memory_tracker
+from .world_snapshot import SnapshotBuilder, WorldSnapshot
+
+
+class SimulationHost(ABC):
+    """Dueño del mundo: aplica comandos, avanza el reloj y publica instantáneas
+
+    La UI nunca modifica el mundo directamente: envía comandos con
+    ``submit`` y dibuja la última ``WorldSnapshot`` publicada. Las
+    subclases deciden si eso ocurre en el mismo hilo o en otro
+    (``submit``, ``latest`` y ``_publish`` son abstractos).
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self.clock = SimulationClock()
+        self.builder = SnapshotBuilder(world)
+        self.paused = False
+        self.requested_speed = world.speed_multiplier
+        self.error = None
+        self._handlers = {
+            'pause': self._cmd_pause,
+            'speed': self._cmd_speed,
+            'select': self._cmd_select,
+            'rename': self._cmd_rename,
+            'reset': self._cmd_reset,
+            'save': self._cmd_save,
+            'load': self._cmd_load,
+            'export_metrics': self._cmd_export_metrics,
+            'memory_report': self._cmd_memory_report,
+            'call': self._cmd_call,
+        }
+
+    # ==================== API para la UI ====================
+
+    def start(self):
+        """Publicar la instantánea inicial"""
+        self._publish(self.build_snapshot(force_stats=True))
+
+    def stop(self):
+        pass
+
+    @abstractmethod
+    def submit(self, command: str, *args):
+        """Enviar un comando a la simulación"""
+
+    def set_speed(self, speed: float) -> float:
+        """Cambiar velocidad (el valor pedido se conoce al instante en la UI)"""
+        self.requested_speed = speed
+        self.submit('speed', speed)
+        return speed
+
+    def advance(self, frame_dt: float):
+        """Llamado una vez por frame desde la UI"""
+
+    @abstractmethod
+    def latest(self) -> WorldSnapshot:
+        """Última instantánea publicada"""
+
+    def interpolation(self, snapshot: WorldSnapshot) -> float:
+        """Fracción del paso en curso para interpolar posiciones (0..1)"""
+        return 1.0
+
+    # ==================== Lado de la simulación ====================
+
+    def build_snapshot(self, force_stats: bool = False) -> WorldSnapshot:
+        return self.builder.build(self.clock.step_dt, self.paused, force_stats)
+
+    @abstractmethod
+    def _publish(self, snapshot: WorldSnapshot):
+        """Hacer visible una instantánea para la UI"""
+
+    def execute(self, command: str, args: tuple):
+        """Aplicar un comando sobre el mundo (en el hilo de la simulación)"""
+        handler = self._handlers.get(command)
+        if handler is None:
+            raise ValueError(f"Comando de simulación desconocido: {command}")
+        handler(*args)
+
+    def _step(self, steps: int):
+        step_dt = self.clock.step_dt
+        for _ in range(steps):
+            self.world.update(step_dt)
+
+    def _cmd_pause(self, paused: bool):
+        self.paused = paused
+        self.clock.reset()
+
+    def _cmd_speed(self, speed: float):
+        self.world.speed_multiplier = speed
+
+    def _cmd_select(self, pos):
+        self.world.select_creature_at(pos)
+
+    def _cmd_rename(self, creature_id: int, name: str):
+        creature = self.world.get_creature(creature_id)
+        if creature is not None:
+            creature.custom_name = name
+            self.world.stats.invalidate()
+
+    def _cmd_reset(self):
+        self.world.reset()
+        self.world.populate(config.INITIAL_POPULATION)
+        self.clock.reset()
+        self.builder.invalidate()
+
+    def _cmd_save(self, filename: str):
+        try:
+            self.world.save(filename)
+            print(f"✅ Simulación guardada: {filename}")
+        except Exception as e:
+            print(f"❌ Error al guardar: {e}")
+
+    def _cmd_load(self, filename: str):
+        try:
+            self.world.load(filename)
+            self.clock.reset()
+            self.builder.invalidate()
+            print(f"✅ Simulación cargada: {filename}")
+        except Exception as e:
+            print(f"❌ Error al cargar: {e}")
+
+    def _cmd_export_metrics(self, basename: str):
+        try:
+            self.world.metrics.export_csv(f"{basename}.csv")
+            self.world.metrics.export_columns(f"{basename}.npz")
+            print(f"📈 Métricas exportadas: {basename}.csv / {basename}.npz")
+        except Exception as e:
+            print(f"❌ Error al exportar métricas: {e}")
+
+    def _cmd_memory_report(self):
+        print(format_report(build_report(self.world, get_memory_tracker())))
+
+    def _cmd_call(self, function):
+        function(self.world)
+
+
+class LocalSimulation(SimulationHost):
+    """Simulación en el hilo de la UI (comandos inmediatos, pasos por frame)"""
+
+    def __init__(self, world):
+        super().__init__(world)
+        self._snapshot = None
+        self._dirty = False
+
+    def submit(self, command: str, *args):
+        self.execute(command, args)
+        self._dirty = True
+
+    def advance(self, frame_dt: float):
+        steps = 0
+        if not self.paused:
+            steps = self.clock.advance(frame_dt, self.world.speed_multiplier)
+            self._step(steps)
+
+        # Sin pasos ni comandos la instantánea anterior sigue siendo válida
+        if steps or self._dirty or self._snapshot is None:
+            self._publish(self.build_snapshot(force_stats=self._dirty))
+            self._dirty = False
+
+    def latest(self) -> WorldSnapshot:
+        return self._snapshot
+
+    def interpolation(self, snapshot: WorldSnapshot) -> float:
+        return 1.0 if self.paused else self.clock.alpha
+
+    def _publish(self, snapshot: WorldSnapshot):
+        self._snapshot = snapshot
+
+
+class SimulationThread(SimulationHost):
+    """Simulación en un hilo propio con instantáneas de doble búfer
+
+    El hilo avanza con su propio reloj de paso fijo, aplica los comandos
+    de la cola entre pasos y publica cada instantánea en el búfer trasero
+    antes de intercambiarlo con el delantero, de modo que la UI siempre lee
+    una instantánea completa sin bloquear la simulación. numpy y SDL
+    liberan el GIL en sus operaciones pesadas, así que simulación y
+    renderizado se solapan en máquinas con varios núcleos.
+    """
+
+    IDLE_WAIT = 0.05  # Espera máxima en pausa (s)
+
+    def __init__(self, world):
+        super().__init__(world)
+        self.commands = queue.Queue()
+        self._buffers = [None, None]
+        self._front = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='digilife-sim', daemon=True)
+
+    def start(self):
+        super().start()
+        self._thread.start()
+
+    def stop(self):
+        """Detener el hilo y esperar a que termine el paso en curso"""
+        self._stop.set()
+        self.commands.put(None)  # Despertar si está esperando comandos
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def submit(self, command: str, *args):
+        self.commands.put((command, args))
+
+    def advance(self, frame_dt: float):
+        if self.error is not None:
+            raise RuntimeError("La simulación se detuvo por un error") from self.error
+
+    def latest(self) -> WorldSnapshot:
+        return self._buffers[self._front]
+
+    def interpolation(self, snapshot: WorldSnapshot) -> float:
+        if snapshot.paused or snapshot.step_dt <= 0:
+            return 1.0
+        elapsed = time.perf_counter() - snapshot.published_at
+        return min(1.0, elapsed * snapshot.speed / snapshot.step_dt)
+
+    def _publish(self, snapshot: WorldSnapshot):
+        back = 1 - self._front
+        self._buffers[back] = snapshot
+        self._front = back  # Intercambio atómico de referencia
+
+    def _drain(self, timeout: float = 0.0) -> bool:
+        """Aplicar comandos pendientes (esperando hasta ``timeout`` por el primero)"""
+        executed = False
+        try:
+            item = self.commands.get(timeout=timeout) if timeout > 0 else self.commands.get_nowait()
+            while True:
+                if item is not None:
+                    self.execute(*item)
+                    executed = True
+                item = self.commands.get_nowait()
+        except queue.Empty:
+            pass
+        return executed
+
+    def _run(self):
+        try:
+            last = time.perf_counter()
+            wait = 0.0
+            while not self._stop.is_set():
+                executed = self._drain(wait)
+
+                now = time.perf_counter()
+                frame_dt, last = now - last, now
+                steps = 0
+                if not self.paused:
+                    steps = self.clock.advance(frame_dt, self.world.speed_multiplier)
+                    self._step(steps)
+
+                if steps or executed:
+                    self._publish(self.build_snapshot(force_stats=executed))
+
+                # Dormir hasta el próximo paso (o hasta el próximo comando)
+                if self.paused:
+                    wait = self.IDLE_WAIT
+                elif steps:
+                    wait = 0.0
+                else:
+                    remaining = (self.clock.step_dt - self.clock.accumulator) / max(
+                        self.world.speed_multiplier, 1e-6)
+                    wait = min(self.IDLE_WAIT, max(0.0, remaining))
+        except Exception as e:
+            self.error = e
+            traceback.print_exc()
+
+
+def create_simulation(world, threaded: bool = None) -> SimulationHost:
+    """Crear el anfitrión de la simulación según la configuración"""
+    if threaded is None:
+        threaded = config.SIM_THREADED
+    return SimulationThread(world) if threaded else LocalSimulation(world)
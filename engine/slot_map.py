@@ -0,0 +1,138 @@
+"""
+Contenedor slot map - Almacenamiento de entidades con handles estables
+"""
+
+from collections.abc import Sequence
+from typing import Iterator, List, Optional, Tuple
+
+
+class SlotMap(Sequence):
+    """Colección densa con handles (slot, generación)
+
+    Cada objeto insertado recibe un slot estable durante toda su vida y un
+    handle ``(slot, generación)``. Al eliminarlo, la generación del slot se
+    incrementa, de modo que los handles antiguos quedan invalidados aunque
+    el slot se reutilice. Los objetos vivos se guardan en una lista densa
+    (iteración contigua) y la baja se resuelve con swap-remove.
+
+    Inserción, eliminación, pertenencia y búsqueda por id son O(1).
+    """
+
+    def __init__(self):
+        self._dense: List = []         # Objetos vivos (orden de iteración)
+        self._dense_slots: List[int] = []  # Slot de cada posición densa
+        self._slot_to_dense: List[int] = []  # Slot -> posición densa (-1 si libre)
+        self._generations: List[int] = []  # Slot -> generación actual
+        self._free_slots: List[int] = []
+        self._id_to_slot = {}          # id de la entidad -> slot
+
+    # ==================== Protocolo de secuencia ====================
+
+    def __len__(self) -> int:
+        return len(self._dense)
+
+    def __getitem__(self, index):
+        return self._dense[index]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._dense)
+
+    def __contains__(self, obj) -> bool:
+        """Pertenencia O(1) usando el handle del objeto"""
+        handle = getattr(obj, 'handle', None)
+        if handle is None:
+            return False
+        return self.is_alive(handle) and self._dense[self._slot_to_dense[handle[0]]] is obj
+
+    def __bool__(self) -> bool:
+        return bool(self._dense)
+
+    # ==================== Altas y bajas ====================
+
+    def add(self, obj) -> Tuple[int, int]:
+        """Insertar objeto y asignarle un handle (slot, generación)"""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._generations)
+            self._generations.append(0)
+            self._slot_to_dense.append(-1)
+
+        self._slot_to_dense[slot] = len(self._dense)
+        self._dense.append(obj)
+        self._dense_slots.append(slot)
+
+        handle = (slot, self._generations[slot])
+        obj.handle = handle
+        self._id_to_slot[obj.id] = slot
+        return handle
+
+    def remove(self, obj) -> bool:
+        """Eliminar objeto en O(1) (swap-remove). Retorna False si no estaba"""
+        if obj not in self:
+            return False
+
+        slot = obj.handle[0]
+        index = self._slot_to_dense[slot]
+        last_index = len(self._dense) - 1
+
+        # Mover el último elemento al hueco
+        if index != last_index:
+            moved = self._dense[last_index]
+            moved_slot = self._dense_slots[last_index]
+            self._dense[index] = moved
+            self._dense_slots[index] = moved_slot
+            self._slot_to_dense[moved_slot] = index
+
+        self._dense.pop()
+        self._dense_slots.pop()
+
+        # Liberar slot e invalidar handles anteriores
+        self._slot_to_dense[slot] = -1
+        self._generations[slot] += 1
+        self._free_slots.append(slot)
+        if self._id_to_slot.get(obj.id) == slot:
+            del self._id_to_slot[obj.id]
+        obj.handle = None
+        return True
+
+    def clear(self):
+        """Eliminar todos los objetos (invalida todos los handles)"""
+        for obj in self._dense:
+            obj.handle = None
+        for slot in self._dense_slots:
+            self._slot_to_dense[slot] = -1
+            self._generations[slot] += 1
+            self._free_slots.append(slot)
+        self._dense.clear()
+        self._dense_slots.clear()
+        self._id_to_slot.clear()
+
+    # ==================== Consultas ====================
+
+    def is_alive(self, handle: Optional[Tuple[int, int]]) -> bool:
+        """Verificar si un handle sigue apuntando a un objeto vivo"""
+        if handle is None:
+            return False
+        slot, generation = handle
+        return (0 <= slot < len(self._generations) and
+                self._generations[slot] == generation and
+                self._slot_to_dense[slot] >= 0)
+
+    def get(self, handle: Optional[Tuple[int, int]]):
+        """Obtener objeto por handle (None si ya no existe)"""
+        if not self.is_alive(handle):
+            return None
+        return self._dense[self._slot_to_dense[handle[0]]]
+
+    def get_by_id(self, obj_id: int):
+        """Obtener objeto por id en O(1)"""
+        slot = self._id_to_slot.get(obj_id)
+        if slot is None:
+            return None
+        return self._dense[self._slot_to_dense[slot]]
+
+    @property
+    def capacity(self) -> int:
+        """Número de slots reservados (vivos + libres)"""
+        return len(self._generations)
@@ -0,0 +1,97 @@
+"""
+Índice espacial - Rejilla uniforme para consultas por radio y rectángulo
+"""
+
+from typing import Dict, Iterator, Tuple
+
+
+class SpatialGrid:
+    """Rejilla uniforme de celdas mantenida incrementalmente
+
+    Cada objeto se guarda en la celda de su posición. Insertar, eliminar y
+    mover son O(1); mover solo toca la rejilla cuando el objeto cambia de
+    celda. Las consultas devuelven candidatos de las celdas que solapan el
+    área pedida (el llamador filtra por distancia exacta si lo necesita).
+    Los objetos se identifican por ``id()``, así que sirven también dicts.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], dict] = {}  # celda -> {id(obj): obj}
+        self._cell_of: Dict[int, Tuple[int, int]] = {}  # id(obj) -> celda
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._cell_of
+
+    def insert(self, obj, x: float, y: float):
+        """Añadir objeto en su celda"""
+        key = id(obj)
+        if key in self._cell_of:
+            self.move(obj, x, y)
+            return
+        cell = self._cell(x, y)
+        self._cell_of[key] = cell
+        self.cells.setdefault(cell, {})[key] = obj
+
+    def remove(self, obj) -> bool:
+        """Quitar objeto. Retorna False si no estaba"""
+        key = id(obj)
+        cell = self._cell_of.pop(key, None)
+        if cell is None:
+            return False
+        bucket = self.cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self.cells[cell]
+        return True
+
+    def move(self, obj, x: float, y: float):
+        """Actualizar posición (solo re-indexa si cambia de celda)"""
+        key = id(obj)
+        old_cell = self._cell_of.get(key)
+        if old_cell is None:
+            return  # No indexado (p. ej. criatura fuera del mundo)
+        cell = self._cell(x, y)
+        if cell == old_cell:
+            return
+
+        bucket = self.cells[old_cell]
+        del bucket[key]
+        if not bucket:
+            del self.cells[old_cell]
+        self._cell_of[key] = cell
+        self.cells.setdefault(cell, {})[key] = obj
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> Iterator:
+        """Candidatos en las celdas que solapan el rectángulo [x0, x1] x [y0, y1]"""
+        cx0, cy0 = self._cell(x0, y0)
+        cx1, cy1 = self._cell(x1, y1)
+
+        # Rectángulo más grande que la población indexada: recorrer celdas ocupadas
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+            for (cx, cy), bucket in self.cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    yield from bucket.values()
+            return
+
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket.values()
+
+    def query_radius(self, x: float, y: float, radius: float) -> Iterator:
+        """Candidatos en las celdas que solapan el círculo"""
+        return self.query_rect(x - radius, y - radius, x + radius, y + radius)
+
+    def clear(self):
+        """Vaciar la rejilla"""
+        self.cells.clear()
+        self._cell_of.clear()
@@ -0,0 +1,151 @@
+"""
+Seguimiento incremental de especies y filogenia
+"""
+
+from typing import Dict, List, Optional
+import config
+
+
+class Species:
+    """Especie: representante fundador y contadores incrementales"""
+
+    def __init__(self, species_id: int, founder, parent_id: Optional[int], cycle: int):
+        self.id = species_id
+        self.parent_id = parent_id  # Especie de la que se separó (None = fundadora)
+        self.founder_id = founder.id
+
+        # Representante: genoma y complejidad del fundador al nacer
+        self.representative_genome = founder.genome
+        self.representative_complexity = founder.complexity
+
+        self.founded_cycle = cycle
+        self.extinct_cycle: Optional[int] = None
+
+        self.members = 0        # Miembros vivos
+        self.total_members = 0  # Miembros que han existido
+        self.peak_members = 0
+        self.deaths = 0
+
+    @property
+    def is_extinct(self) -> bool:
+        return self.extinct_cycle is not None
+
+    def to_dict(self) -> dict:
+        """Registro para salida filogenética"""
+        return {
+            'id': self.id,
+            'parent_id': self.parent_id,
+            'founder_id': self.founder_id,
+            'founded_cycle': self.founded_cycle,
+            'extinct_cycle': self.extinct_cycle,
+            'members': self.members,
+            'total_members': self.total_members,
+            'peak_members': self.peak_members,
+            'deaths': self.deaths,
+            'genome_size': len(self.representative_genome)
+        }
+
+
+class SpeciesTracker:
+    """Asigna cada nacimiento a una especie sin reagrupar la población
+
+    Un hijo hereda la especie del padre mientras su similitud con el
+    representante de esa especie sea al menos SPECIES_SIMILARITY_THRESHOLD;
+    si no, funda una especie nueva descendiente de la del padre. Altas,
+    bajas y consultas son O(1).
+    """
+
+    def __init__(self, threshold: float = None, complexity_factor: float = None):
+        self.threshold = (config.SPECIES_SIMILARITY_THRESHOLD
+                          if threshold is None else threshold)
+        self.complexity_factor = (config.SPECIES_COMPLEXITY_FACTOR
+                                  if complexity_factor is None else complexity_factor)
+        self.species: Dict[int, Species] = {}  # Historial completo (vivas y extintas)
+        self.living: Dict[int, Species] = {}
+        self._next_id = 1
+
+    def similarity(self, creature, species: Species) -> float:
+        """Similitud de una criatura con el representante de una especie"""
+        genome_similarity = creature.genome.histogram_similarity(species.representative_genome)
+        complexity_diff = abs(creature.complexity - species.representative_complexity)
+        complexity_similarity = 1.0 - min(1.0, complexity_diff / 500)
+        return (genome_similarity * (1 - self.complexity_factor) +
+                complexity_similarity * self.complexity_factor)
+
+    def register(self, creature, parent=None, cycle: int = 0) -> int:
+        """Asignar especie a una criatura que entra al mundo"""
+        species = None
+        parent_species = self.species.get(parent.species_id) if parent is not None else None
+
+        if parent_species is not None:
+            if self.similarity(creature, parent_species) >= self.threshold:
+                species = parent_species
+        else:
+            # Fundadora (población inicial o carga): buscar especie viva compatible
+            best = self.threshold
+            for candidate in self.living.values():
+                score = self.similarity(creature, candidate)
+                if score >= best:
+                    best = score
+                    species = candidate
+
+        if species is None:
+            parent_id = parent_species.id if parent_species is not None else None
+            species = self._found(creature, parent_id, cycle)
+        elif species.is_extinct:
+            # Revivida por un hijo de un padre que sobrevivió a su especie
+            species.extinct_cycle = None
+            self.living[species.id] = species
+
+        species.members += 1
+        species.total_members += 1
+        species.peak_members = max(species.peak_members, species.members)
+        creature.species_id = species.id
+        return species.id
+
+    def unregister(self, creature, cycle: int = 0):
+        """Dar de baja a una criatura (muerte)"""
+        species = self.species.get(creature.species_id)
+        if species is None or species.members <= 0:
+            return
+        species.members -= 1
+        species.deaths += 1
+        if species.members == 0:
+            species.extinct_cycle = cycle
+            del self.living[species.id]
+
+    def _found(self, creature, parent_id: Optional[int], cycle: int) -> Species:
+        """Crear una especie nueva con la criatura como representante"""
+        species = Species(self._next_id, creature, parent_id, cycle)
+        self._next_id += 1
+        self.species[species.id] = species
+        self.living[species.id] = species
+        return species
+
+    @property
+    def living_count(self) -> int:
+        """Número de especies vivas"""
+        return len(self.living)
+
+    def get(self, species_id: int) -> Optional[Species]:
+        """Obtener especie (viva o extinta) por id"""
+        return self.species.get(species_id)
+
+    def get_stats(self, species_id: int) -> Optional[dict]:
+        """Estadísticas de una especie"""
+        species = self.species.get(species_id)
+        return species.to_dict() if species is not None else None
+
+    def get_largest(self, limit: int = 5) -> List[Species]:
+        """Especies vivas con más miembros"""
+        return sorted(self.living.values(), key=lambda s: s.members, reverse=True)[:limit]
+
+    def get_phylogeny(self) -> List[dict]:
+        """Historial completo de especies (para árboles filogenéticos)"""
+        return [species.to_dict() for species in self.species.values()]
+
+    def clear(self):
+        """Olvidar todas las especies"""
+        self.species.clear()
+        self.living.clear()
+        self._next_id = 1
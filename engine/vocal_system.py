@@ -4,7 +4,8 @@ Sistema de vocalización - Comunicación emergente con beeps
 
 import random
 import sys
-from typing import Dict, Optional
+from typing import List, Optional, Tuple
+import numpy as np
 import config
 
 # Intentar importar winsound (Windows) o usar beep del sistema (Linux/Mac)
@@ -21,6 +22,21 @@ except ImportError:
     BEEP_METHOD = None
 
 
+# Registro global de palabras: cada palabra tiene un id pequeño y fijo
+WORDS = tuple(config.VOCABULARY_CONTEXTS) + tuple(config.ADVANCED_VOCABULARY_CONTEXTS)
+WORD_IDS = {word: i for i, word in enumerate(WORDS)}
+
+# Contextos por id (en el orden de prioridad de config)
+BASIC_CONTEXTS = [(WORD_IDS[w], f) for w, f in config.VOCABULARY_CONTEXTS.items()]
+ADVANCED_CONTEXTS = [(WORD_IDS[w], f) for w, f in config.ADVANCED_VOCABULARY_CONTEXTS.items()]
+
+# Palabras que se conocen de entrada
+STARTER_WORDS = [WORD_IDS[w] for w in ('hola', 'bien', 'datos')]
+ADVANCED_STARTER_WORDS = [WORD_IDS[w] for w in ('cohesion', 'defender', 'seguir')]
+
+COUNT_MAX = np.iinfo(np.uint16).max  # Los contadores se saturan en uint16
+
+
 def play_beep(frequency: int, duration: int):
     """Reproducir beep del sistema con volumen máximo"""
     if not config.AUDIO_ENABLED:
@@ -57,30 +73,42 @@ def play_beep(frequency: int, duration: int):
 
 
 class VocalSystem:
-    """Sistema de vocalización de una criatura"""
+    """Sistema de vocalización de una criatura
+    
+    Asociaciones y usos son arrays uint16 indexados por el id de la
+    palabra en el registro global (``WORD_IDS``). El bitset ``learned`` se
+    actualiza cuando una asociación alcanza ASSOCIATION_THRESHOLD, así
+    que consultar lo aprendido no recorre el vocabulario.
+    """
     
-    def __init__(self, creature):
+    __slots__ = ('creature', 'usage', 'associations', 'learned', 'learned_count',
+                 'base_frequency', 'frequency_variation')
+    
+    def __init__(self, creature, seed_words: bool = True):
         self.creature = creature
-        self.vocabulary: Dict[str, int] = {}  # palabra -> veces usada
-        self.associations: Dict[str, int] = {}  # palabra -> veces asociada con contexto
+        self.usage = np.zeros(len(WORDS), dtype=np.uint16)  # id -> veces usada
+        self.associations = np.zeros(len(WORDS), dtype=np.uint16)  # id -> veces asociada con contexto
+        self.learned = 0  # Bitset de palabras aprendidas
+        self.learned_count = 0
         
         # Características vocales únicas (frecuencias de beep)
         # Cada criatura tiene su propia "voz" basada en frecuencia
         self.base_frequency = random.randint(400, 1200)  # Hz
         self.frequency_variation = random.randint(50, 200)  # Variación por palabra
         
+        if not seed_words:
+            return
+        
         # Si la criatura es suficientemente compleja, darle algunas palabras básicas ya aprendidas
         if creature.complexity >= config.COMPLEXITY_THRESHOLD_VOCAL:
-            basic_words = ['hola', 'bien', 'datos']
-            for word in basic_words:
+            for word_id in STARTER_WORDS:
                 # Darles suficientes asociaciones para que ya las conozcan
-                self.associations[word] = config.ASSOCIATION_THRESHOLD
+                self._set_association(word_id, config.ASSOCIATION_THRESHOLD)
         
         # Si la criatura es inteligente, darle acceso a vocabulario avanzado
         if creature.complexity >= 1500:
-            advanced_words = ['cohesion', 'defender', 'seguir']
-            for word in advanced_words:
-                self.associations[word] = config.ASSOCIATION_THRESHOLD
+            for word_id in ADVANCED_STARTER_WORDS:
+                self._set_association(word_id, config.ASSOCIATION_THRESHOLD)
     
     def vocalize(self):
         """Emitir vocalización según contexto (OPTIMIZADO v2.9.3)"""
@@ -92,19 +120,17 @@ class VocalSystem:
             return
         
         # Determinar qué decir según contexto (sin audio real, solo log)
-        word = self.choose_word()
+        word_id = self.choose_word()
         
-        if word:
-            self.speak(word)
+        if word_id is not None:
+            self.speak(word_id)
             
             # Registrar uso
-            if word not in self.vocabulary:
-                self.vocabulary[word] = 0
-            self.vocabulary[word] += 1
+            if self.usage[word_id] < COUNT_MAX:
+                self.usage[word_id] += 1
             
             # OPTIMIZACIÓN: Solo aplicar efectos el 30% de las veces (reduce carga)
             if random.random() < 0.3:
-                from .communication_effects import CommunicationEffects
                 # Obtener criaturas cercanas que pueden escuchar (OPTIMIZADO: radio reducido)
                 listeners = self.creature.world.get_creatures_near(
                     self.creature.x, self.creature.y, 80  # Reducido de 120 a 80
@@ -114,84 +140,84 @@ class VocalSystem:
                     listeners = random.sample(listeners, 10)
                 
                 if len(listeners) > 1:  # Hay alguien escuchando
-                    CommunicationEffects.apply_word_effect(self.creature, listeners, word)
+                    # El efecto se resuelve en lote al final del ciclo
+                    self.creature.world.communication.emit(self.creature, word_id, listeners)
             
             # Logs de vocalización (TODAS las vocalizaciones)
             if config.DEBUG['LOG_VOCALIZATIONS']:
-                print(f"🗣️  Criatura {self.creature.id} dice: '{word}'")
+                print(f"🗣️  Criatura {self.creature.id} dice: '{WORDS[word_id]}'")
     
-    def choose_word(self) -> Optional[str]:
-        """Elegir palabra apropiada según contexto"""
+    def choose_word(self) -> Optional[int]:
+        """Elegir palabra apropiada según contexto (id en el registro)"""
         # Criaturas inteligentes tienen acceso a vocabulario avanzado
-        is_intelligent = (hasattr(self.creature, 'intelligence') and 
-                         self.creature.intelligence is not None)
-        
-        # Priorizar vocabulario avanzado si es inteligente
-        if is_intelligent and hasattr(config, 'ADVANCED_VOCABULARY_CONTEXTS'):
-            for word, context_func in config.ADVANCED_VOCABULARY_CONTEXTS.items():
-                try:
-                    if context_func(self.creature):
-                        if self.has_learned(word):
-                            return word
-                        else:
-                            self.try_learn(word)
-                except:
-                    pass
+        if self.creature.intelligence is not None:
+            word_id = self._match_context(ADVANCED_CONTEXTS)
+            if word_id is not None:
+                return word_id
         
         # Evaluar contextos básicos
-        for word, context_func in config.VOCABULARY_CONTEXTS.items():
-            try:
-                if context_func(self.creature):
-                    # Verificar si ha aprendido esta palabra
-                    if self.has_learned(word):
-                        return word
-                    else:
-                        # Intentar aprender
-                        self.try_learn(word)
-            except:
-                pass
+        word_id = self._match_context(BASIC_CONTEXTS)
+        if word_id is not None:
+            return word_id
         
         # Si no hay palabra apropiada según contexto, elegir una palabra aprendida al azar
-        learned_words = [w for w, count in self.associations.items() 
-                        if count >= config.ASSOCIATION_THRESHOLD]
-        
-        if learned_words:
-            return random.choice(learned_words)
+        if self.learned_count:
+            mask = self.learned
+            for _ in range(random.randrange(self.learned_count)):
+                mask &= mask - 1  # Quitar el bit más bajo
+            return (mask & -mask).bit_length() - 1
         
         # Si aún no ha aprendido ninguna palabra, intentar aprender una básica
         if self.creature.complexity >= 600:
-            basic_words = ['hola', 'bien', 'datos']
-            word = random.choice(basic_words)
-            self.try_learn(word)
+            word_id = random.choice(STARTER_WORDS)
+            self.try_learn(word_id)
             # Dar un boost inicial para que aprenda más rápido
-            if word in self.associations:
-                self.associations[word] = min(config.ASSOCIATION_THRESHOLD, 
-                                             self.associations[word] + 2)
-            return word
+            self._set_association(word_id, min(config.ASSOCIATION_THRESHOLD,
+                                               int(self.associations[word_id]) + 2))
+            return word_id
         
         return None
     
-    def has_learned(self, word: str) -> bool:
-        """Verificar si ha aprendido una palabra"""
-        if word not in self.associations:
-            return False
-        return self.associations[word] >= config.ASSOCIATION_THRESHOLD
+    def _match_context(self, contexts) -> Optional[int]:
+        """Primera palabra aprendida cuyo contexto se cumple (intenta aprender las demás)"""
+        for word_id, context_func in contexts:
+            try:
+                if context_func(self.creature):
+                    # Verificar si ha aprendido esta palabra
+                    if self.learned >> word_id & 1:
+                        return word_id
+                    # Intentar aprender
+                    self.try_learn(word_id)
+            except Exception:
+                pass
+        return None
+    
+    def _set_association(self, word_id: int, value: int):
+        """Fijar asociación y actualizar el bitset de aprendidas"""
+        self.associations[word_id] = min(value, COUNT_MAX)
+        bit = 1 << word_id
+        learned = value >= config.ASSOCIATION_THRESHOLD
+        if learned != bool(self.learned & bit):
+            self.learned ^= bit
+            self.learned_count += 1 if learned else -1
     
-    def try_learn(self, word: str):
+    def has_learned(self, word) -> bool:
+        """Verificar si ha aprendido una palabra (id o texto)"""
+        word_id = WORD_IDS.get(word) if isinstance(word, str) else word
+        return word_id is not None and bool(self.learned >> word_id & 1)
+    
+    def try_learn(self, word_id: int):
         """Intentar aprender una palabra por asociación"""
-        if word not in self.associations:
-            self.associations[word] = 0
-        self.associations[word] += 1
+        self._set_association(word_id, int(self.associations[word_id]) + 1)
     
-    def speak(self, word: str):
+    def speak(self, word_id: int):
         """Emitir beep característico de la criatura"""
         if not config.AUDIO_ENABLED:
             return
         
         # Cada palabra tiene una secuencia de beeps única
-        # Basada en el hash de la palabra + características de la criatura
-        word_hash = hash(word) % 5  # 0-4 patrones diferentes
-        
+        # Basada en el id de la palabra + características de la criatura
+        word_hash = word_id % 5  # 0-4 patrones diferentes
         # Patrones de beeps según la palabra
         patterns = [
             [(0, 100)],                    # Beep corto
@@ -222,5 +248,9 @@ class VocalSystem:
     
     def get_vocabulary_size(self) -> int:
         """Obtener tamaño del vocabulario aprendido"""
-        return len([w for w, count in self.associations.items() 
-                   if count >= config.ASSOCIATION_THRESHOLD])
+        return self.learned_count
+    
+    def used_words(self, limit: int = None) -> List[Tuple[str, int]]:
+        """Palabras usadas alguna vez con sus usos (orden del registro)"""
+        used = np.flatnonzero(self.usage)[:limit]
+        return [(WORDS[i], int(self.usage[i])) for i in used]
@@ -4,13 +4,23 @@ Gestión del mundo y ecosistema digital
 
 import random
 import pickle
-import numpy as np
+import time
 from typing import List, Optional, Tuple
 import config
 from .creature import Creature
 from .disease import DiseaseSystem
 from .neural_batch import get_batch_processor
+from .dispatch_tuner import DispatchTuner
 from .knowledge_system import KnowledgeBase
+from .communication_effects import CommunicationEffects
+from .slot_map import SlotMap
+from .brain_store import BrainStore
+from .species import SpeciesTracker
+from .spatial_grid import SpatialGrid
+from .food_store import FoodStore
+from .world_stats import WorldStats, StatsSnapshot
+from .metrics import MetricsRecorder
+from .scheduler import BehaviorScheduler
 from utils.data_generator import DataGenerator
 
 
@@ -20,15 +30,36 @@ class World:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.creatures: List[Creature] = []
-        self.data_items: List[dict] = []  # Alimento
-        self.selected_creature: Optional[Creature] = None
+        self.creatures = SlotMap()  # Criaturas vivas (bajas y búsquedas O(1))
+        self.data_items = FoodStore()  # Alimento (dicts + arrays de posición y tipo)
+        self.data_version = 0  # Se incrementa con cada cambio del alimento
+        self.selected_handle: Optional[Tuple[int, int]] = None
+        
+        # Pesos neuronales apilados (fila = slot de la criatura)
+        self.brain_store = BrainStore(
+            config.NEURAL_INPUT_SIZE,
+            config.NEURAL_HIDDEN_SIZE,
+            config.NEURAL_OUTPUT_SIZE
+        )
+        
+        # Nacimientos encolados durante el ciclo (padre, x, y, fitness inicial)
+        self.pending_births: List[Tuple[Creature, float, float, float]] = []
+        self._in_tick = False
+        
+        # Especies asignadas incrementalmente en cada nacimiento y muerte
+        self.species_tracker = SpeciesTracker()
+        
+        # Comportamientos periódicos repartidos entre ticks por slot
+        self.scheduler = BehaviorScheduler()
+        
+        # Índices espaciales (criaturas se re-indexan al moverse)
+        self.creature_grid = SpatialGrid(config.SPATIAL_CELL_SIZE)
+        self.data_grid = SpatialGrid(config.SPATIAL_CELL_SIZE)
         
         # Estadísticas
         self.cycle = 0
         self.total_births = 0
         self.total_deaths = 0
-        self.species_count = 0
         
         # Estadísticas de depredación
         self.predation_kills = 0
@@ -47,9 +78,18 @@ class World:
         # Sistema de conocimiento e inteligencia
         self.knowledge_base = KnowledgeBase()
         
-        # Procesador por lotes para GPU
+        # Efectos de las vocalizaciones del ciclo (se aplican en lote)
+        self.communication = CommunicationEffects(self)
+        
+        # Estadísticas agregadas para la UI (una pasada por ciclo)
+        self.stats = WorldStats(self)
+        
+        # Historial de métricas por ciclo (gráficos de evolución)
+        self.metrics = MetricsRecorder()
+        
+        # Procesador por lotes (OpenCL o numpy) y elección medida del camino
         self.batch_processor = get_batch_processor()
-        self.batch_size = 32  # Procesar 32 criaturas a la vez
+        self.dispatch = DispatchTuner(self.batch_processor)
     
     def populate(self, count: int):
         """Poblar mundo con criaturas iniciales"""
@@ -57,13 +97,18 @@ class World:
             x = random.uniform(50, self.width - 50)
             y = random.uniform(50, self.height - 50)
             creature = Creature(x, y, self)
-            self.creatures.append(creature)
+            self._register(creature)
             self.total_births += 1
     
     def update(self, dt: float):
-        """Actualizar mundo (OPTIMIZADO + NUEVOS SISTEMAS v2.8)"""
-        dt *= self.speed_multiplier
+        """Actualizar mundo un paso de ``dt`` segundos (OPTIMIZADO + NUEVOS SISTEMAS v2.8)
+        
+        ``speed_multiplier`` no escala ``dt``: lo aplica el ``SimulationClock``
+        ejecutando más pasos fijos por frame.
+        """
         self.cycle += 1
+        self._in_tick = True
+        self.scheduler.begin_tick(self.cycle, dt)
         
         # Generar datos/alimento
         self.data_spawn_timer += dt
@@ -79,90 +124,70 @@ class World:
         # Actualizar sistema de conocimiento
         self.knowledge_base.update_world_stats(self)
         
-        # Actualizar criaturas (OPTIMIZADO v2.9.1: prioridad para complejas)
+        # Actualizar criaturas por el camino neuronal más rápido medido
         dead_creatures = []
+        decision = self.dispatch.decide(self)
+        population = len(self.creatures)
+        started = time.perf_counter()
         
-        # Separar criaturas por complejidad
-        if config.USE_GPU and config.GPU_PRIORITY_COMPLEX:
-            complex_creatures = [c for c in self.creatures if c.complexity >= config.COMPLEX_THRESHOLD]
-            simple_creatures = [c for c in self.creatures if c.complexity < config.COMPLEX_THRESHOLD]
-            
-            # Procesar complejas SIEMPRE en GPU (son las más costosas)
-            if complex_creatures:
-                self._update_creatures_batched(dt, dead_creatures, complex_creatures)
-            
-            # Procesar simples en GPU solo si hay muchas
-            if len(simple_creatures) >= config.GPU_THRESHOLD_CREATURES:
-                self._update_creatures_batched(dt, dead_creatures, simple_creatures)
-            else:
-                # Pocas simples: CPU es más eficiente
-                for creature in simple_creatures:
-                    creature.update(dt)
-                    if creature.is_dead():
-                        dead_creatures.append(creature)
-                    if config.DISEASES_ENABLED and hasattr(creature, 'infection') and creature.infection:
-                        nearby = self.get_creatures_near(creature.x, creature.y, 30)
-                        self.disease_system.try_spread(creature, nearby)
-        elif config.USE_GPU and len(self.creatures) >= config.GPU_THRESHOLD_CREATURES:
-            # Procesamiento por lotes estándar
-            self._update_creatures_batched(dt, dead_creatures, self.creatures)
-        else:
-            # Procesamiento secuencial para poblaciones pequeñas
+        if decision.path == 'scalar':
             for creature in self.creatures:
                 creature.update(dt)
                 if creature.is_dead():
                     dead_creatures.append(creature)
-                if config.DISEASES_ENABLED and hasattr(creature, 'infection') and creature.infection:
+                if config.DISEASES_ENABLED and creature.infection:
                     nearby = self.get_creatures_near(creature.x, creature.y, 30)
                     self.disease_system.try_spread(creature, nearby)
+        else:
+            self._update_creatures_batched(dt, dead_creatures, decision.batch_size,
+                                           use_gpu=decision.path == 'opencl')
+        # El autoajuste mide la propia pasada del tick (sin pasadas extra)
+        self.dispatch.record(time.perf_counter() - started, population)
         
-        # Eliminar criaturas muertas (una sola operación)
+        # Efectos de las vocalizaciones del ciclo en lote
+        self.communication.flush()
+        
+        # Transmisión cultural del ciclo en lote (antes de liberar slots)
+        self.knowledge_base.store.propagate()
+        
+        # Materializar nacimientos del ciclo (antes de liberar slots de los muertos)
+        self._in_tick = False
+        self._flush_births()
+        
+        # Eliminar criaturas muertas (swap-remove O(1) por criatura)
         if dead_creatures:
             for creature in dead_creatures:
-                self.creatures.remove(creature)
+                if not self.remove_creature(creature):
+                    continue  # Ya eliminada (p. ej. listada dos veces)
                 self.total_deaths += 1
                 if config.DEBUG['LOG_DEATHS']:
                     print(f"💀 Criatura {creature.id} murió (edad: {creature.age:.1f})")
         
-        # Actualizar conteo de especies (cada 50 ciclos para optimizar)
+        # Actualizar conteo de depredadores (cada 50 ciclos para optimizar)
         if self.cycle % 50 == 0:
-            self.update_species_count()
             self.update_predator_count()
         
         # Control de población (OPTIMIZADO: solo si excede significativamente)
         excess = len(self.creatures) - config.MAX_POPULATION
         if excess > 10:  # Solo si hay exceso significativo
-            try:
-                # Eliminar las más débiles (por fitness, no energía)
-                self.creatures.sort(key=lambda c: c.fitness)
-                to_remove = self.creatures[:excess]
-                for creature in to_remove:
-                    if creature in self.creatures:  # Verificar que aún existe
-                        self.creatures.remove(creature)
-                        self.total_deaths += 1
-            except Exception as e:
-                # Si hay error, simplemente truncar la lista
-                self.creatures = self.creatures[-config.MAX_POPULATION:]
-    
-    def update_species_count(self):
-        """Actualizar conteo de especies únicas"""
-        if not self.creatures:
-            self.species_count = 0
-            return
-        
-        # Agrupar criaturas por ID de especie
-        species_ids = set()
-        for creature in self.creatures:
-            species_ids.add(creature.get_species_id())
+            # Eliminar las más débiles (por fitness, no energía)
+            to_remove = sorted(self.creatures, key=lambda c: c.fitness)[:excess]
+            for creature in to_remove:
+                if self.remove_creature(creature):
+                    self.total_deaths += 1
         
-        self.species_count = len(species_ids)
+        self.metrics.record(self)
+    
+    @property
+    def species_count(self) -> int:
+        """Número de especies vivas (mantenido por el SpeciesTracker, O(1))"""
+        return self.species_tracker.living_count
     
     def update_predator_count(self):
         """Actualizar conteo de depredadores activos"""
         self.active_predators = sum(
             1 for c in self.creatures 
-            if hasattr(c, 'is_predator') and c.is_predator and 
-            c.complexity >= config.PREDATION_COMPLEXITY_THRESHOLD
+            if c.is_predator and c.complexity >= config.PREDATION_COMPLEXITY_THRESHOLD
         )
     
     def get_top_predators(self, limit: int = 5) -> List[Tuple]:
@@ -170,37 +195,40 @@ class World:
         predators = [
             (c.id, c.kills, c.complexity) 
             for c in self.creatures 
-            if hasattr(c, 'kills') and c.kills > 0
+            if c.kills > 0
         ]
         # Ordenar por kills (descendente)
         predators.sort(key=lambda x: x[1], reverse=True)
         return predators[:limit]
     
-    def _update_creatures_batched(self, dt: float, dead_creatures: List, creatures_to_process: List = None):
-        """Actualizar criaturas usando procesamiento por lotes en GPU"""
-        if creatures_to_process is None:
-            creatures_to_process = self.creatures
-        
-        # Procesar en lotes de tamaño fijo
-        for i in range(0, len(creatures_to_process), self.batch_size):
-            batch = creatures_to_process[i:i + self.batch_size]
+    def _update_creatures_batched(self, dt: float, dead_creatures: List, batch_size: int,
+                                  use_gpu: bool = True):
+        """Actualizar criaturas con la red procesada por lotes (OpenCL o numpy)
+        
+        Cada criatura sigue los mismos pasos que ``Creature.update``; solo
+        cambia que los sensores del lote se leen antes de que el lote se mueva.
+        """
+        creatures = self.creatures
+        for i in range(0, len(creatures), batch_size):
+            batch = creatures[i:i + batch_size]
             
-            # Preparar inputs para el lote (solo la parte neural)
-            inputs_batch = []
+            # Coste energético antes de leer sensores (como en Creature.update)
             for creature in batch:
-                # Preparar sensores (sin ejecutar la red aún)
-                inputs = creature.prepare_neural_inputs()
-                inputs_batch.append(np.array(inputs, dtype=np.float32))
+                creature.consume_energy(dt)
             
-            # Procesar lote en GPU
-            outputs_batch = self.batch_processor.process_batch(batch, inputs_batch)
+            # Solo las criaturas que usan la red entran en el lote
+            thinkers = [creature for creature in batch if creature.uses_brain()]
+            inputs_batch = [creature.prepare_neural_inputs() for creature in thinkers]
+            
+            # Procesar lote (las salidas son válidas hasta el siguiente lote)
+            outputs_batch = iter(self.batch_processor.process_batch(thinkers, inputs_batch, use_gpu))
             
             # Aplicar resultados y actualizar resto de la criatura
-            for creature, outputs in zip(batch, outputs_batch):
-                # Aplicar outputs de la red neuronal
-                creature.apply_neural_outputs(outputs)
+            for creature in batch:
+                # Aplicar outputs de la red neuronal (None = solo instinto)
+                creature.apply_neural_outputs(next(outputs_batch) if creature.uses_brain() else None)
                 
-                # Actualizar resto (física, energía, etc.) - CPU
+                # Actualizar resto (física, reproducción, inteligencia, etc.) - CPU
                 creature.update_non_neural(dt)
                 
                 # Marcar si murió
@@ -208,7 +236,7 @@ class World:
                     dead_creatures.append(creature)
                 
                 # Propagar enfermedades
-                if config.DISEASES_ENABLED and hasattr(creature, 'infection') and creature.infection:
+                if config.DISEASES_ENABLED and creature.infection:
                     nearby = self.get_creatures_near(creature.x, creature.y, 30)
                     self.disease_system.try_spread(creature, nearby)
     
@@ -234,12 +262,19 @@ class World:
             'size': 5,
             'color': config.DATA_COLORS[data_type]
         }
+        self.add_data_item(data_item)
+    
+    def add_data_item(self, data_item: dict):
+        """Añadir dato/alimento al mundo e indexarlo"""
         self.data_items.append(data_item)
+        self.data_grid.insert(data_item, data_item['x'], data_item['y'])
+        self.data_version += 1
     
     def consume_data(self, creature: Creature, data_item: dict):
         """Criatura consume un dato"""
-        if data_item in self.data_items:
-            self.data_items.remove(data_item)
+        if self.data_items.remove(data_item):
+            self.data_grid.remove(data_item)
+            self.data_version += 1
             
             # Aplicar nutrición
             nutrition = config.DATA_NUTRITION[data_item['type']]
@@ -250,11 +285,74 @@ class World:
     
     def add_creature(self, creature: Creature):
         """Añadir criatura al mundo (nacimiento)"""
-        self.creatures.append(creature)
+        self._register(creature)
         self.total_births += 1
         if config.DEBUG['LOG_BIRTHS']:
             print(f"🐣 Criatura {creature.id} nació (gen: {creature.generation})")
     
+    def remove_creature(self, creature: Creature) -> bool:
+        """Eliminar criatura del mundo. Retorna False si ya no estaba"""
+        if creature not in self.creatures:
+            return False
+        self.brain_store.detach(creature.handle[0])
+        self.knowledge_base.store.detach(creature.handle[0])
+        self.species_tracker.unregister(creature, self.cycle)
+        self.creature_grid.remove(creature)
+        return self.creatures.remove(creature)
+    
+    def _register(self, creature: Creature):
+        """Asignar slot a la criatura y enlazar su red a la fila del almacén"""
+        slot, _ = self.creatures.add(creature)
+        self.brain_store.attach(slot, creature.brain)
+        if creature.intelligence is not None:
+            self.knowledge_base.store.attach(slot, creature.intelligence)
+        self.species_tracker.register(creature, cycle=self.cycle)
+        self.creature_grid.insert(creature, creature.x, creature.y)
+    
+    @property
+    def projected_population(self) -> int:
+        """Población incluyendo nacimientos encolados en este ciclo"""
+        return len(self.creatures) + len(self.pending_births)
+    
+    def queue_birth(self, parent: Creature, x: float, y: float):
+        """Encolar nacimiento (se materializa en lote al final del ciclo)"""
+        # El hijo hereda parte del fitness del padre en el momento de reproducirse
+        self.pending_births.append((parent, x, y, parent.fitness * 0.1))
+        if not self._in_tick:
+            # Fuera de World.update (tests, carga): nacer inmediatamente
+            self._flush_births()
+    
+    def _flush_births(self):
+        """Crear todos los hijos encolados y heredar sus pesos en un solo lote"""
+        if not self.pending_births:
+            return
+        births = self.pending_births
+        self.pending_births = []
+        
+        children = []
+        for parent, x, y, fitness in births:
+            child = Creature(x, y, self, parent=parent, deferred_brain=True)
+            child.fitness = fitness
+            slot, _ = self.creatures.add(child)
+            # La inteligencia se creó sin handle: enlazarla ahora a su fila
+            if child.intelligence is not None:
+                self.knowledge_base.store.attach(slot, child.intelligence)
+            self.species_tracker.register(child, parent, self.cycle)
+            self.creature_grid.insert(child, x, y)
+            children.append(child)
+        
+        # Herencia + mutación vectorizada escribiendo en las filas de los hijos
+        self.brain_store.inherit_rows(
+            [child.handle[0] for child in children],
+            [child.brain for child in children],
+            [parent.brain for parent, _, _, _ in births]
+        )
+        
+        self.total_births += len(children)
+        if config.DEBUG['LOG_BIRTHS']:
+            for child in children:
+                print(f"🐣 Criatura {child.id} nació (gen: {child.generation})")
+    
     def select_creature_at(self, pos: Tuple[float, float]):
         """Seleccionar criatura en posición"""
         x, y = pos
@@ -267,10 +365,23 @@ class World:
                 return
         self.selected_creature = None
     
+    @property
+    def selected_creature(self) -> Optional[Creature]:
+        """Criatura seleccionada (None si ya murió) - O(1) por handle"""
+        return self.creatures.get(self.selected_handle)
+    
+    @selected_creature.setter
+    def selected_creature(self, creature: Optional[Creature]):
+        self.selected_handle = creature.handle if creature is not None else None
+    
+    def get_creature(self, creature_id: int) -> Optional[Creature]:
+        """Buscar criatura viva por id en O(1)"""
+        return self.creatures.get_by_id(creature_id)
+    
     def get_creatures_near(self, x: float, y: float, radius: float) -> List[Creature]:
-        """Obtener criaturas cerca de una posición"""
+        """Obtener criaturas cerca de una posición (índice espacial)"""
         nearby = []
-        for creature in self.creatures:
+        for creature in self.creature_grid.query_radius(x, y, radius):
             dx = creature.x - x
             dy = creature.y - y
             dist = (dx*dx + dy*dy) ** 0.5
@@ -279,9 +390,9 @@ class World:
         return nearby
     
     def get_data_near(self, x: float, y: float, radius: float) -> List[dict]:
-        """Obtener datos cerca de una posición"""
+        """Obtener datos cerca de una posición (índice espacial)"""
         nearby = []
-        for data in self.data_items:
+        for data in self.data_grid.query_radius(x, y, radius):
             dx = data['x'] - x
             dy = data['y'] - y
             dist = (dx*dx + dy*dy) ** 0.5
@@ -289,15 +400,47 @@ class World:
                 nearby.append(data)
         return nearby
     
+    def count_creatures_near(self, x: float, y: float, radius: float) -> int:
+        """Contar criaturas cerca de una posición (sin construir la lista)"""
+        radius_sq = radius * radius
+        count = 0
+        for creature in self.creature_grid.query_radius(x, y, radius):
+            dx = creature.x - x
+            dy = creature.y - y
+            if dx*dx + dy*dy < radius_sq:
+                count += 1
+        return count
+    
+    def count_data_near(self, x: float, y: float, radius: float) -> int:
+        """Contar datos cerca de una posición (sin construir la lista)"""
+        radius_sq = radius * radius
+        count = 0
+        for data in self.data_grid.query_radius(x, y, radius):
+            dx = data['x'] - x
+            dy = data['y'] - y
+            if dx*dx + dy*dy < radius_sq:
+                count += 1
+        return count
+    
     def reset(self):
         """Reiniciar mundo"""
+        self.brain_store.clear()
+        self.knowledge_base.store.clear()
+        self.communication.clear()
+        self.dispatch.invalidate()
         self.creatures.clear()
+        self.pending_births.clear()
+        self.species_tracker.clear()
+        self.creature_grid.clear()
+        self.data_grid.clear()
         self.data_items.clear()
-        self.selected_creature = None
+        self.data_version += 1
+        self.selected_handle = None
         self.cycle = 0
         self.total_births = 0
         self.total_deaths = 0
-        self.species_count = 0
+        self.stats.invalidate()
+        self.metrics.clear()
     
     def save(self, filename: str):
         """Guardar estado del mundo"""
@@ -305,7 +448,7 @@ class World:
             'width': self.width,
             'height': self.height,
             'creatures': [c.to_dict() for c in self.creatures],
-            'data_items': self.data_items,
+            'data_items': list(self.data_items),
             'cycle': self.cycle,
             'total_births': self.total_births,
             'total_deaths': self.total_deaths,
@@ -321,17 +464,28 @@ class World:
         
         self.width = state['width']
         self.height = state['height']
-        self.data_items = state['data_items']
+        self.data_items.clear()
+        self.data_grid.clear()
+        for data_item in state['data_items']:
+            self.add_data_item(data_item)
         self.cycle = state['cycle']
         self.total_births = state['total_births']
         self.total_deaths = state['total_deaths']
-        self.species_count = state['species_count']
         
-        # Reconstruir criaturas
+        # Reconstruir criaturas (las especies se reagrupan al registrarlas)
+        self.brain_store.clear()
+        self.knowledge_base.store.clear()
+        self.communication.clear()
+        self.dispatch.invalidate()
         self.creatures.clear()
+        self.pending_births.clear()
+        self.species_tracker.clear()
+        self.creature_grid.clear()
         for c_data in state['creatures']:
             creature = Creature.from_dict(c_data, self)
-            self.creatures.append(creature)
+            self._register(creature)
+        self.stats.invalidate()
+        self.metrics.clear()
     
     @property
     def population(self) -> int:
@@ -341,11 +495,13 @@ class World:
     @property
     def max_complexity(self) -> float:
         """Complejidad máxima en población"""
-        if not self.creatures:
-            return 0
-        return max(c.complexity for c in self.creatures)
+        return self.stats.snapshot().max_complexity
     
     @property
     def vocal_creatures(self) -> int:
         """Criaturas con capacidad vocal"""
-        return sum(1 for c in self.creatures if c.can_vocalize())
+        return self.stats.snapshot().vocal_creatures
+    
+    def get_stats_snapshot(self) -> StatsSnapshot:
+        """Instantánea de estadísticas para la UI"""
+        return self.stats.snapshot()
@@ -0,0 +1,201 @@
+"""
+Instantáneas inmutables del mundo para el renderizado
+"""
+
+import math
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+import numpy as np
+import config
+from .food_store import DATA_PALETTE
+from .world_stats import StatsSnapshot
+
+
+# Métricas del historial que se copian en cada refresco de estadísticas
+SNAPSHOT_HISTORY = ('population', 'species', 'max_complexity', 'food')
+
+
+class CreatureDetail(NamedTuple):
+    """Ficha de la criatura seleccionada (lo que muestra el panel)"""
+    id: int
+    name: Optional[str]
+    generation: int
+    age: float
+    energy: float
+    max_energy: float
+    complexity: float
+    fitness: float
+    phase: str
+    genome_length: int
+    x: float
+    y: float
+    speed: float
+    food_eaten: int
+    distance_traveled: float
+    vocabulary: Tuple[Tuple[str, int], ...]  # Primeras 8 palabras (palabra, usos)
+    intelligence: Optional[Mapping]  # Resumen de conocimiento (None si no tiene)
+
+
+class WorldSnapshot(NamedTuple):
+    """Estado del mundo en un instante, sin referencias a objetos vivos
+
+    Las columnas numéricas son arrays de solo lectura (una fila por
+    criatura) y el resto tuplas, así que la instantánea puede leerse desde
+    otro hilo mientras la simulación sigue avanzando.
+    """
+    cycle: int
+    published_at: float  # time.perf_counter() al publicarla
+    step_dt: float
+    speed: float
+    paused: bool
+    # Criaturas
+    ids: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    last_x: np.ndarray  # Posición antes del último paso (interpolación)
+    last_y: np.ndarray
+    size: np.ndarray
+    direction: np.ndarray
+    energy_ratio: np.ndarray
+    colors: Tuple[Tuple[int, int, int], ...]
+    phases: Tuple[str, ...]
+    vocal: Tuple[bool, ...]
+    names: Tuple[Optional[str], ...]  # Nombre personalizado o None
+    selected_index: Optional[int]  # Fila de la criatura seleccionada
+    # Alimento
+    data_version: int
+    food_x: np.ndarray
+    food_y: np.ndarray
+    food_size: np.ndarray
+    food_colors: np.ndarray
+    # Panel (se renuevan a STATS_REFRESH_HZ o al cambiar la selección)
+    stats: StatsSnapshot
+    selected: Optional[CreatureDetail]
+    history: Mapping[str, np.ndarray]
+    history_span: int
+    # Camino neuronal elegido por el autoajuste (overlay junto a los FPS)
+    dispatch: Tuple[str, ...]
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def creature_detail(creature) -> CreatureDetail:
+    """Copiar la ficha de una criatura viva"""
+    vocal_system = creature.vocal_system
+    vocabulary = ()
+    if vocal_system is not None and vocal_system.get_vocabulary_size() > 0:
+        vocabulary = tuple(vocal_system.used_words(8))
+
+    intelligence = None
+    if creature.intelligence:
+        summary = creature.intelligence.get_knowledge_summary()
+        intelligence = MappingProxyType({
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in summary.items()
+        })
+
+    return CreatureDetail(
+        id=creature.id,
+        name=creature.custom_name or None,
+        generation=creature.generation,
+        age=creature.age,
+        energy=creature.energy,
+        max_energy=creature.max_energy,
+        complexity=creature.complexity,
+        fitness=creature.fitness,
+        phase=creature.get_phase(),
+        genome_length=len(creature.genome),
+        x=creature.x,
+        y=creature.y,
+        speed=math.sqrt(creature.vx ** 2 + creature.vy ** 2),
+        food_eaten=creature.food_eaten,
+        distance_traveled=creature.distance_traveled,
+        vocabulary=vocabulary,
+        intelligence=intelligence
+    )
+
+
+class SnapshotBuilder:
+    """Construye instantáneas del mundo reutilizando lo que no cambió
+
+    Las posiciones se copian en cada instantánea; el alimento solo cuando
+    cambia ``world.data_version``, y las estadísticas, la ficha de la
+    seleccionada y el historial a ``STATS_REFRESH_HZ`` (o antes si cambia
+    la selección o se pide con ``force_stats``).
+    """
+
+    def __init__(self, world, stats_hz: float = None):
+        self.world = world
+        self.stats_hz = config.STATS_REFRESH_HZ if stats_hz is None else stats_hz
+        self._food = None
+        self._food_version = None
+        self._panel = None  # (stats, selected, history, history_span)
+        self._panel_selected_id = None
+        self._next_stats = 0.0
+
+    def build(self, step_dt: float = 0.0, paused: bool = False,
+              force_stats: bool = False) -> WorldSnapshot:
+        """Copiar el estado actual del mundo"""
+        world = self.world
+        creatures = world.creatures
+        now = time.perf_counter()
+
+        # Columnas numéricas en una sola pasada
+        rows, colors, phases, vocal, names = [], [], [], [], []
+        selected = world.selected_creature
+        selected_index = None
+        for i, c in enumerate(creatures):
+            rows.append((c.id, c.x, c.y, c.last_x, c.last_y, c.size, c.direction,
+                         c.energy / c.max_energy))
+            colors.append(c.color)
+            phases.append(c.get_phase())
+            vocal.append(c.can_vocalize())
+            names.append(c.custom_name or None)
+            if c is selected:
+                selected_index = i
+        numeric = np.array(rows, dtype=np.float64).reshape(len(rows), 8)
+        columns = [_frozen(np.ascontiguousarray(numeric[:, j])) for j in range(8)]
+        columns[0] = _frozen(columns[0].astype(np.int64))
+
+        # Alimento (compartido entre instantáneas mientras no cambie)
+        if self._food is None or self._food_version != world.data_version:
+            food = world.data_items
+            self._food = (_frozen(food.xs.copy()), _frozen(food.ys.copy()),
+                          _frozen(food.sizes.copy()), _frozen(DATA_PALETTE[food.type_codes]))
+            self._food_version = world.data_version
+
+        # Estadísticas y panel
+        selected_id = selected.id if selected is not None else None
+        if (force_stats or self._panel is None or now >= self._next_stats or
+                selected_id != self._panel_selected_id):
+            metrics = world.metrics
+            history = {}
+            if len(metrics) >= 2:
+                history = {name: _frozen(metrics.history(name)[1]) for name in SNAPSHOT_HISTORY}
+            self._panel = (
+                world.get_stats_snapshot(),
+                creature_detail(selected) if selected is not None else None,
+                MappingProxyType(history),
+                metrics.history_span()
+            )
+            self._panel_selected_id = selected_id
+            if self.stats_hz > 0:
+                self._next_stats = now + 1.0 / self.stats_hz
+
+        return WorldSnapshot(
+            world.cycle, now, step_dt, world.speed_multiplier, paused,
+            *columns,
+            tuple(colors), tuple(phases), tuple(vocal), tuple(names), selected_index,
+            world.data_version, *self._food,
+            *self._panel,
+            world.dispatch.overlay_lines()
+        )
+
+    def invalidate(self):
+        """Forzar copia completa en la próxima instantánea"""
+        self._food = None
+        self._panel = None
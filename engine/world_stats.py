@@ -0,0 +1,180 @@
+"""
+Estadísticas agregadas del mundo (una pasada por ciclo)
+"""
+
+from collections import Counter
+from typing import NamedTuple, Optional, Tuple
+import config
+
+
+class CreatureSummary(NamedTuple):
+    """Datos de una criatura destacada (sin referencia al objeto)"""
+    id: int
+    name: str
+    fitness: float
+    generation: int
+    complexity: float
+
+
+class StatsSnapshot(NamedTuple):
+    """Instantánea inmutable de las estadísticas que muestra la UI"""
+    cycle: int
+    days: int
+    population: int
+    total_births: int
+    total_deaths: int
+    species_count: int
+    max_complexity: float
+    vocal_creatures: int
+    data_count: int
+    speed_multiplier: float
+    environment_status: str
+    most_consumed_data: Optional[str]
+    fittest: Optional[CreatureSummary]
+    weakest: Optional[CreatureSummary]
+    most_potential: Optional[CreatureSummary]
+    avg_fitness: float
+    avg_age: float
+    avg_energy: float
+    epidemics: Tuple[dict, ...]
+    active_predators: int
+    predation_kills: int
+    top_predators: Tuple[Tuple[str, int, float], ...]  # (nombre, kills, complejidad)
+
+
+def _summary(creature) -> CreatureSummary:
+    return CreatureSummary(
+        creature.id,
+        creature.custom_name or f"#{creature.id}",
+        creature.fitness,
+        creature.generation,
+        creature.complexity
+    )
+
+
+class WorldStats:
+    """Agregador de estadísticas del mundo
+
+    Recorre la población una sola vez para obtener todos los máximos,
+    mínimos, medias, infectados y depredadores, y guarda el resultado como
+    ``StatsSnapshot``. La instantánea se reutiliza mientras el mundo no
+    avance de ciclo ni cambien la población o la velocidad.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self._snapshot: Optional[StatsSnapshot] = None
+        self._key = None
+
+    def invalidate(self):
+        """Forzar recálculo en la próxima consulta"""
+        self._snapshot = None
+        self._key = None
+
+    def snapshot(self) -> StatsSnapshot:
+        """Obtener instantánea (recalculada como mucho una vez por ciclo)"""
+        world = self.world
+        key = (world.cycle, world.total_births, world.total_deaths, len(world.creatures),
+               world.speed_multiplier)
+        if self._snapshot is None or key != self._key:
+            self._snapshot = self._compute()
+            self._key = key
+        return self._snapshot
+
+    def _compute(self) -> StatsSnapshot:
+        """Calcular todas las estadísticas en una pasada"""
+        world = self.world
+        creatures = world.creatures
+        population = len(creatures)
+
+        fittest = weakest = potential = None
+        best_potential = float('-inf')
+        max_complexity = 0
+        vocal = 0
+        sum_fitness = sum_age = sum_energy = sum_energy_ratio = 0.0
+        infected = Counter()
+        predators = []
+
+        for c in creatures:
+            if fittest is None or c.fitness > fittest.fitness:
+                fittest = c
+            if weakest is None or c.fitness < weakest.fitness:
+                weakest = c
+
+            # Más potencial: joven + alta complejidad + buen fitness
+            score = c.complexity * 0.5 + c.fitness * 0.3 + (1000 - c.age) * 0.2
+            if score > best_potential:
+                best_potential = score
+                potential = c
+
+            if c.complexity > max_complexity:
+                max_complexity = c.complexity
+            if c.can_vocalize():
+                vocal += 1
+
+            sum_fitness += c.fitness
+            sum_age += c.age
+            sum_energy += c.energy
+            sum_energy_ratio += c.energy / c.max_energy
+
+            infection = c.infection
+            if infection:
+                infected[infection.disease] += 1
+            if c.kills > 0:
+                predators.append(c)
+
+        # Estado del entorno basado en población, recursos y energía
+        if population:
+            population_ratio = population / config.MAX_POPULATION
+            data_ratio = len(world.data_items) / max(1, config.DATA_SPAWN_RATE * 5)
+            health_score = (population_ratio * 0.4 + data_ratio * 0.3 +
+                            sum_energy_ratio / population * 0.3)
+            if health_score < 0.2:
+                environment_status = 'Crítico'
+            elif health_score < 0.4:
+                environment_status = 'Difícil'
+            elif health_score < 0.7:
+                environment_status = 'Estable'
+            else:
+                environment_status = 'Próspero'
+
+            # Tipo de dato más consumido (simulado por distribución)
+            most_consumed = max(config.DATA_TYPES_DISTRIBUTION.items(), key=lambda x: x[1])[0]
+        else:
+            environment_status = 'Crítico'
+            most_consumed = None
+
+        # Top 5 depredadores por kills
+        predators.sort(key=lambda c: c.kills, reverse=True)
+        top_predators = tuple(
+            (c.custom_name or f"#{c.id}", c.kills, c.complexity)
+            for c in predators[:5]
+        )
+
+        epidemics = tuple(world.disease_system.get_active_epidemics(infected))
+
+        divisor = max(1, population)
+        return StatsSnapshot(
+            cycle=world.cycle,
+            days=world.cycle // config.CYCLES_PER_DAY,
+            population=population,
+            total_births=world.total_births,
+            total_deaths=world.total_deaths,
+            species_count=world.species_count,
+            max_complexity=max_complexity,
+            vocal_creatures=vocal,
+            data_count=len(world.data_items),
+            speed_multiplier=world.speed_multiplier,
+            environment_status=environment_status,
+            most_consumed_data=most_consumed,
+            fittest=_summary(fittest) if fittest else None,
+            weakest=_summary(weakest) if weakest else None,
+            most_potential=_summary(potential) if potential else None,
+            avg_fitness=sum_fitness / divisor,
+            avg_age=sum_age / divisor,
+            avg_energy=sum_energy / divisor,
+            epidemics=epidemics,
+            active_predators=world.active_predators,
+            predation_kills=world.predation_kills,
+            top_predators=top_predators
+        )
@@ -14,11 +14,36 @@ import config
 
 # Importar módulos del motor
 from engine.world import World
+from engine.sim_thread import create_simulation
 from ui.renderer import Renderer
 from ui.controls import ControlPanel
 from ui.stats_panel import StatsPanel
 from ui.menu import ConfigMenu
 from ui.help_menu import HelpMenu
+from ui.text_cache import get_text_cache
+
+
+def apply_arguments(args):
+    """Aplicar argumentos de línea de comandos a la configuración"""
+    if args.population:
+        config.INITIAL_POPULATION = args.population
+    if args.data_rate:
+        config.DATA_SPAWN_RATE = args.data_rate
+    if args.world_size:
+        w, h = map(int, args.world_size.split('x'))
+        config.WORLD_WIDTH = w
+        config.WORLD_HEIGHT = h
+    if args.no_gpu:
+        config.USE_GPU = False
+    if args.no_audio:
+        config.AUDIO_ENABLED = False
+    if args.debug:
+        for key in config.DEBUG:
+            config.DEBUG[key] = True
+    if args.fps:
+        config.TARGET_FPS = args.fps
+    if args.threaded:
+        config.SIM_THREADED = True
 
 
 class DigiLife:
@@ -35,24 +60,7 @@ class DigiLife:
         self.window_width = config.WORLD_WIDTH + config.UI_PANEL_WIDTH
         self.window_height = config.WORLD_HEIGHT
         
-        # Aplicar argumentos a configuración
-        if args.population:
-            config.INITIAL_POPULATION = args.population
-        if args.data_rate:
-            config.DATA_SPAWN_RATE = args.data_rate
-        if args.world_size:
-            w, h = map(int, args.world_size.split('x'))
-            config.WORLD_WIDTH = w
-            config.WORLD_HEIGHT = h
-        if args.no_gpu:
-            config.USE_GPU = False
-        if args.no_audio:
-            config.AUDIO_ENABLED = False
-        if args.debug:
-            for key in config.DEBUG:
-                config.DEBUG[key] = True
-        if args.fps:
-            config.TARGET_FPS = args.fps
+        apply_arguments(args)
         
         print("Inicializando DigiLife...")
         self.init_pygame()
@@ -81,8 +89,12 @@ class DigiLife:
     
     def init_components(self):
         """Inicializar componentes del simulador"""
-        # Mundo
+        # Mundo (la UI solo lo modifica mediante comandos a la simulación)
         self.world = World(config.WORLD_WIDTH, config.WORLD_HEIGHT)
+        self.simulation = create_simulation(self.world)
+        self.snapshot = None
+        self.awaiting_selection = False  # Click pendiente de reflejarse en la instantánea
+        self.selection_before_click = None
         
         # Renderer
         self.renderer = Renderer(self.screen, self.world)
@@ -92,9 +104,20 @@ class DigiLife:
         self.stats_panel = StatsPanel(self.screen, self.world)
         self.config_menu = ConfigMenu(self.screen, self.world)
         self.help_menu = HelpMenu(self.screen)
+        self.stats_panel.simulation = self.simulation
+        self.config_menu.simulation = self.simulation
         
-        # Poblar mundo inicial
+        # Fuentes y textos de overlays (creados una sola vez)
+        self.text_cache = get_text_cache()
+        self.fps_font = pygame.font.Font(None, 24)
+        self.indicator_font = pygame.font.Font(None, 20)
+        self.menu_hint_overlay = self.build_menu_hint_overlay()
+        
+        # Poblar mundo inicial y arrancar la simulación
         self.world.populate(config.INITIAL_POPULATION)
+        self.simulation.start()
+        if config.SIM_THREADED:
+            print("🧵 Simulación en hilo propio")
     
     def handle_events(self):
         """Manejar eventos de entrada"""
@@ -146,6 +169,7 @@ class DigiLife:
         """Manejar teclas presionadas"""
         if key == pygame.K_SPACE:
             self.paused = not self.paused
+            self.simulation.submit('pause', self.paused)
         elif key == pygame.K_ESCAPE:
             if self.config_menu.visible:
                 self.config_menu.hide()
@@ -169,14 +193,18 @@ class DigiLife:
             self.save_simulation()
         elif key == pygame.K_l:
             self.load_simulation()
+        elif key == pygame.K_e:
+            self.export_metrics()
+        elif key == pygame.K_i:
+            self.simulation.submit('memory_report')
         elif key == pygame.K_F11:
             self.toggle_fullscreen()
         elif key == pygame.K_PLUS or key == pygame.K_EQUALS or key == pygame.K_KP_PLUS:
-            self.world.speed_multiplier = min(10, self.world.speed_multiplier * 2)
-            print(f"⚡ Velocidad: {self.world.speed_multiplier}x")
+            speed = self.simulation.set_speed(min(10, self.simulation.requested_speed * 2))
+            print(f"⚡ Velocidad: {speed}x")
         elif key == pygame.K_MINUS or key == pygame.K_UNDERSCORE or key == pygame.K_KP_MINUS:
-            self.world.speed_multiplier = max(0.5, self.world.speed_multiplier / 2)
-            print(f"🐌 Velocidad: {self.world.speed_multiplier}x")
+            speed = self.simulation.set_speed(max(0.5, self.simulation.requested_speed / 2))
+            print(f"🐌 Velocidad: {speed}x")
     
     def handle_mouse_click(self, pos, button):
         """Manejar clicks del ratón"""
@@ -187,17 +215,28 @@ class DigiLife:
             # Verificar si click en mundo o UI
             if pos[0] < scaled_world_width:
                 world_pos = self.renderer.screen_to_world(pos)
-                prev_selected = self.world.selected_creature
-                self.world.select_creature_at(world_pos)
-                # Iniciar seguimiento automático solo si seleccionamos una nueva criatura
-                if self.world.selected_creature and self.world.selected_creature != prev_selected:
-                    self.renderer.start_following()
-                    print(f"📍 Criatura seleccionada: {self.world.selected_creature.id}")
+                selected = self.snapshot.selected if self.snapshot else None
+                self.selection_before_click = selected.id if selected else None
+                self.awaiting_selection = True
+                self.simulation.submit('select', world_pos)
     
     def update(self, dt):
-        """Actualizar simulación"""
-        if not self.paused:
-            self.world.update(dt)
+        """Avanzar la simulación y tomar la última instantánea publicada"""
+        self.simulation.advance(dt)
+        snapshot = self.simulation.latest()
+        self.snapshot = snapshot
+        
+        # Renderer y panel dibujan la misma instantánea
+        self.renderer.snapshot = snapshot
+        self.renderer.interpolation = self.simulation.interpolation(snapshot)
+        self.stats_panel.snapshot = snapshot
+        
+        # Iniciar seguimiento automático solo si el click seleccionó una nueva criatura
+        if self.awaiting_selection and snapshot.selected is not None:
+            if snapshot.selected.id != self.selection_before_click:
+                self.awaiting_selection = False
+                self.renderer.start_following()
+                print(f"📍 Criatura seleccionada: {snapshot.selected.id}")
     
     def render(self):
         """Renderizar frame"""
@@ -225,7 +264,7 @@ class DigiLife:
             self.render_menu_hint()
         
         # Mostrar indicador de seguimiento
-        if self.renderer.following_creature and self.world.selected_creature:
+        if self.renderer.following_creature and self.snapshot.selected is not None:
             self.render_following_indicator()
         
         # Actualizar pantalla
@@ -233,19 +272,27 @@ class DigiLife:
     
     def render_fps(self):
         """Renderizar contador de FPS"""
-        font = pygame.font.Font(None, 24)
         fps = self.clock.get_fps()
-        fps_text = font.render(f"FPS: {fps:.1f}", True, (0, 255, 0))
+        fps_text = self.text_cache.render(self.fps_font, f"FPS: {fps:.1f}", True, (0, 255, 0))
         self.screen.blit(fps_text, (10, 10))
+        
+        # Camino neuronal elegido por el autoajuste (debajo de los FPS)
+        y = 30
+        for line in self.snapshot.dispatch:
+            text = self.text_cache.render(self.indicator_font, line, True, (150, 220, 150))
+            self.screen.blit(text, (10, y))
+            y += 16
     
-    def render_menu_hint(self):
-        """Renderizar indicadores de controles"""
+    def build_menu_hint_overlay(self) -> pygame.Surface:
+        """Prerenderizar el overlay de controles (texto estático)"""
         font = pygame.font.Font(None, 16)
         hints = [
             "M: Menú Config",
             "H: Ayuda",
             "F: Seguir criatura",
             "N: Renombrar",
+            "E: Exportar métricas",
+            "I: Informe de memoria",
             "ESPACIO: Pausa",
             "+/-: Velocidad",
             "F11: Pantalla completa",
@@ -254,6 +301,19 @@ class DigiLife:
             "Rueda: Zoom"
         ]
         
+        # Fondo semi-transparente
+        overlay = pygame.Surface((200, len(hints) * 18 + 10), pygame.SRCALPHA)
+        overlay.fill((20, 20, 30, 200))
+        
+        y_offset = 5
+        for hint in hints:
+            hint_text = font.render(hint, True, (180, 180, 180))
+            overlay.blit(hint_text, (5, y_offset))
+            y_offset += 18
+        return overlay
+    
+    def render_menu_hint(self):
+        """Renderizar indicadores de controles"""
         # Calcular posición según si estamos en pantalla completa
         if self.fullscreen:
             # En pantalla completa, usar altura real de pantalla
@@ -262,30 +322,19 @@ class DigiLife:
             # En modo ventana, usar altura del mundo
             screen_height = config.WORLD_HEIGHT
         
-        y_offset = screen_height - 25 - (len(hints) * 18)
-        
-        # Fondo semi-transparente
-        bg_surface = pygame.Surface((200, len(hints) * 18 + 10))
-        bg_surface.set_alpha(200)
-        bg_surface.fill((20, 20, 30))
-        self.screen.blit(bg_surface, (5, y_offset - 5))
-        
-        for hint in hints:
-            hint_text = font.render(hint, True, (180, 180, 180))
-            self.screen.blit(hint_text, (10, y_offset))
-            y_offset += 18
+        overlay_height = self.menu_hint_overlay.get_height()
+        self.screen.blit(self.menu_hint_overlay, (5, screen_height - 20 - overlay_height))
     
     def render_following_indicator(self):
         """Renderizar indicador de seguimiento activo"""
-        font = pygame.font.Font(None, 20)
-        creature = self.world.selected_creature
+        creature = self.snapshot.selected
         
-        if hasattr(creature, 'custom_name') and creature.custom_name:
-            text = f"Siguiendo: {creature.custom_name}"
+        if creature.name:
+            text = f"Siguiendo: {creature.name}"
         else:
             text = f"Siguiendo: C-{creature.id}"
         
-        indicator = font.render(text, True, (255, 255, 100))
+        indicator = self.text_cache.render(self.indicator_font, text, True, (255, 255, 100))
         
         # Calcular centro según si estamos en pantalla completa
         if self.fullscreen:
@@ -313,8 +362,7 @@ class DigiLife:
     def reset_simulation(self):
         """Reiniciar simulación"""
         print("Reiniciando simulación...")
-        self.world.reset()
-        self.world.populate(config.INITIAL_POPULATION)
+        self.simulation.submit('reset')
     
     def save_simulation(self, filename=None):
         """Guardar estado de la simulación"""
@@ -322,11 +370,15 @@ class DigiLife:
             from datetime import datetime
             filename = f"digilife_save_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pkl"
         
-        try:
-            self.world.save(filename)
-            print(f"✅ Simulación guardada: {filename}")
-        except Exception as e:
-            print(f"❌ Error al guardar: {e}")
+        self.simulation.submit('save', filename)
+    
+    def export_metrics(self, basename=None):
+        """Exportar historial de métricas (CSV + columnar .npz)"""
+        if basename is None:
+            from datetime import datetime
+            basename = f"digilife_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
+        self.simulation.submit('export_metrics', basename)
     
     def load_simulation(self, filename=None):
         """Cargar simulación guardada"""
@@ -335,11 +387,7 @@ class DigiLife:
             print("⚠️  Especifica un archivo con --load")
             return
         
-        try:
-            self.world.load(filename)
-            print(f"✅ Simulación cargada: {filename}")
-        except Exception as e:
-            print(f"❌ Error al cargar: {e}")
+        self.simulation.submit('load', filename)
     
     def run(self):
         """Loop principal"""
@@ -356,6 +404,8 @@ class DigiLife:
         print("  N       - Renombrar criatura")
         print("  R       - Reiniciar")
         print("  S       - Guardar")
+        print("  E       - Exportar métricas")
+        print("  I       - Informe de memoria")
         print("  ESC     - Salir")
         print("  +/-     - Velocidad")
         print("  F11     - Pantalla completa")
@@ -451,10 +501,35 @@ class DigiLife:
     def cleanup(self):
         """Limpieza al salir"""
         print("\nCerrando DigiLife...")
+        self.simulation.stop()
         pygame.quit()
         sys.exit(0)
 
 
+def run_headless(args):
+    """Simular sin ventana imprimiendo informes de memoria periódicos"""
+    from engine.memory_report import build_report, format_report, get_memory_tracker
+    
+    apply_arguments(args)
+    world = World(config.WORLD_WIDTH, config.WORLD_HEIGHT)
+    if args.load:
+        world.load(args.load)
+    else:
+        world.populate(config.INITIAL_POPULATION)
+    
+    step_dt = 1.0 / (config.SIM_TICK_RATE * max(1, config.PHYSICS_SUBSTEPS))
+    interval = args.memory_every or config.MEMORY_REPORT_INTERVAL
+    tracker = get_memory_tracker()
+    print(f"🖥️  Modo headless: {args.headless} ciclos, informe cada {interval}")
+    print(format_report(build_report(world, tracker)))
+    
+    for step in range(1, args.headless + 1):
+        world.update(step_dt)
+        if step % interval == 0 or step == args.headless:
+            print(format_report(build_report(world, tracker)))
+    tracker.stop()
+
+
 def parse_arguments():
     """Parsear argumentos de línea de comandos"""
     parser = argparse.ArgumentParser(
@@ -497,6 +572,18 @@ def parse_arguments():
         '--load', type=str,
         help='Cargar simulación guardada'
     )
+    parser.add_argument(
+        '--threaded', action='store_true',
+        help='Ejecutar la simulación en un hilo separado del renderizado'
+    )
+    parser.add_argument(
+        '--headless', type=int, metavar='CICLOS',
+        help='Simular CICLOS pasos sin ventana con informes de memoria'
+    )
+    parser.add_argument(
+        '--memory-every', type=int, metavar='CICLOS',
+        help='Ciclos entre informes de memoria en modo headless (default: 1000)'
+    )
     
     return parser.parse_args()
 
@@ -506,6 +593,9 @@ def main():
     args = parse_arguments()
     
     try:
+        if args.headless:
+            run_headless(args)
+            return
         app = DigiLife(args)
         app.run()
     except KeyboardInterrupt:
@@ -0,0 +1,55 @@
+"""
+Tests para los efectos de comunicación aplicados en lote
+"""
+
+import pytest
+from engine.vocal_system import WORD_IDS
+from engine.world import World
+
+
+def make_world(count):
+    world = World(800, 600)
+    world.populate(count)
+    for i, creature in enumerate(world.creatures):
+        creature.x, creature.y = 100 + 10 * i, 100
+        creature.vx = creature.vy = 0.0
+        creature.energy = creature.max_energy * 0.6
+    return world
+
+
+def test_effects_are_deferred_and_accumulated():
+    """Test que las palabras se encolan y sus efectos se suman al aplicar el lote"""
+    world = make_world(3)
+    speaker, near, far = world.creatures
+    fitness = [c.fitness for c in world.creatures]
+
+    world.communication.emit(speaker, WORD_IDS['peligro'], [speaker, near, far])
+    world.communication.emit(speaker, WORD_IDS['hambre'], [near])
+    assert len(world.communication) == 2
+    assert near.vx == 0.0  # Aún no aplicado
+
+    world.communication.flush()
+    assert len(world.communication) == 0
+    # Peligro: los oyentes se alejan del hablante con fuerza 0.2
+    assert near.vx == pytest.approx(0.2)
+    assert far.vx == pytest.approx(0.2)
+    assert near.fitness == pytest.approx(fitness[1] + 0.3 + 0.3)
+    assert far.fitness == pytest.approx(fitness[2] + 0.3)
+    assert speaker.fitness == pytest.approx(fitness[0] + 1 + 0.5)
+
+
+def test_share_transfers_decaying_energy():
+    """Test que compartir cede un 10% de lo que le queda al hablante por oyente débil"""
+    world = make_world(3)
+    speaker, first, second = world.creatures
+    speaker.energy = 80.0
+    speaker.max_energy = 100.0
+    for weak in (first, second):
+        weak.energy = 1.0
+
+    world.communication.emit(speaker, WORD_IDS['compartir'], [first, second])
+    world.communication.flush()
+
+    assert first.energy == pytest.approx(1.0 + 8.0)
+    assert second.energy == pytest.approx(1.0 + 7.2)
+    assert speaker.energy == pytest.approx(80.0 - 8.0 - 7.2)
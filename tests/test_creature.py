@@ -72,3 +72,25 @@ def test_creature_phases():
     
     creature.complexity = 1200
     assert creature.get_phase() == 'complex'
+
+
+def test_batched_births():
+    """Test nacimientos encolados y materializados en lote"""
+    world = World(800, 600)
+    world.populate(2)
+    parent = world.creatures[0]
+    
+    world._in_tick = True
+    parent.reproduce()
+    parent.reproduce()
+    assert world.population == 2  # Encolados, aún no nacidos
+    assert world.projected_population == 4
+    
+    world._in_tick = False
+    world._flush_births()
+    assert world.population == 4
+    
+    for child in world.creatures[2:]:
+        assert child.generation == 1
+        assert child.brain.row == child.handle[0]
+        assert child.brain.weights_ih1.shape == parent.brain.weights_ih1.shape
@@ -0,0 +1,66 @@
+"""
+Tests para el autoajuste del despacho neuronal
+"""
+
+import numpy as np
+import config
+from engine.world import World
+
+
+def test_probes_spread_across_ticks(monkeypatch):
+    """Test que la ronda mide un candidato por tick, intercalado con la decisión vigente"""
+    monkeypatch.setattr(config, 'DISPATCH_BATCH_SIZES', (16, 64))
+    monkeypatch.setattr(config, 'DISPATCH_SAMPLES', 2)
+    monkeypatch.setattr(config, 'DISPATCH_PROBE_INTERVAL', 1)
+    world = World(800, 600)
+    world.populate(10)
+    tuner = world.dispatch
+    costs = {('scalar', 0): 3.0, ('cpu', 16): 2.0, ('cpu', 64): 1.0, ('opencl', 16): 4.0, ('opencl', 64): 4.0}
+
+    probed = []
+    while tuner.calibrations == 0:
+        decision = tuner.decide(world)
+        if tuner.calibrating and tuner._probing is None:
+            assert decision == tuner.decision  # Tick normal entre dos mediciones
+        elif tuner._probing is not None:
+            probed.append(tuner._probing)
+        tuner.record(costs[decision[:2]] * 1e-3, len(world.creatures))
+        world.cycle += 1
+
+    assert sorted(probed) == sorted(tuner.candidates() * 2)
+    assert set(tuner.timings) == set(tuner.candidates())
+    assert tuner.decision[:2] == ('cpu', 64)
+    assert tuner.overlay_lines()[0].startswith("Red: lotes CPU x64")
+
+    # No vuelve a medir hasta que pasa el periodo o cambia mucho la población
+    decision = tuner.decide(world)
+    assert not tuner.calibrating and decision == tuner.decision
+
+
+def test_batched_path_runs_same_creature_logic():
+    """Test que el camino por lotes respeta el umbral de la red y activa la inteligencia"""
+    world = World(800, 600)
+    world.populate(2)
+    simple, smart = world.creatures
+    simple.complexity = config.COMPLEXITY_THRESHOLD_NEURAL  # Sin red, como en Creature.think
+    smart.complexity = 2000
+    smart.intelligence = None
+    simple.brain.memory[:] = 0.5
+
+    world._update_creatures_batched(1 / 60, [], 16, use_gpu=False)
+
+    assert np.all(simple.brain.memory == 0.5)
+    assert smart.intelligence is not None
+
+
+def test_fixed_rule_without_autotune(monkeypatch):
+    """Test que sin autoajuste se aplica la regla fija por umbral de población"""
+    monkeypatch.setattr(config, 'DISPATCH_AUTOTUNE', False)
+    monkeypatch.setattr(config, 'USE_GPU', True)
+    world = World(800, 600)
+    world.populate(config.GPU_THRESHOLD_CREATURES)
+    decision = world.dispatch.decide(world)
+    assert decision.path in ('cpu', 'opencl')
+    assert decision.batch_size == config.GPU_BATCH_SIZE
+    world.update(1 / 60)
+    assert world.dispatch.calibrations == 0
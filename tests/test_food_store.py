@@ -0,0 +1,28 @@
+"""
+Tests para el almacén de alimento
+"""
+
+import pytest
+import numpy as np
+from engine.food_store import FoodStore, DATA_PALETTE, DATA_TYPE_CODES
+
+
+def _food(x, y, data_type='numeric'):
+    return {'type': data_type, 'x': x, 'y': y, 'size': 5, 'color': (0, 0, 0)}
+
+
+def test_food_store_arrays_follow_items():
+    """Test que los arrays siguen a los dicts tras altas y bajas"""
+    store = FoodStore(capacity=2)
+    items = [_food(i * 10, i * 20, 'text' if i % 2 else 'audio') for i in range(6)]
+    for item in items:
+        store.append(item)
+
+    assert store.remove(items[1])
+    assert not store.remove(items[1])
+    assert items[1] not in store
+    assert len(store) == 5
+
+    assert np.array_equal(store.xs, [d['x'] for d in store])
+    assert np.array_equal(store.ys, [d['y'] for d in store])
+    assert np.array_equal(store.colors, DATA_PALETTE[[DATA_TYPE_CODES[d['type']] for d in store]])
@@ -36,3 +36,17 @@ def test_genome_crossover():
     # Debe contener material de ambos padres
     assert any(inst in genome1.instructions or inst in genome2.instructions 
               for inst in child.instructions)
+
+
+def test_genome_opcodes_and_similarity():
+    """Test codificación uint8 y similitud por máscara de presencia"""
+    genome1 = Genome(['SEEK_FOOD', 'SEEK_FOOD', 'FLEE'])
+    genome2 = Genome(['FLEE', 'REST'])
+    
+    assert genome1.opcodes.dtype.name == 'uint8'
+    assert genome1.instructions == ['SEEK_FOOD', 'SEEK_FOOD', 'FLEE']
+    assert genome1.histogram.sum() == 3
+    # Jaccard: {SEEK_FOOD, FLEE} vs {FLEE, REST} -> 1/3
+    assert abs(genome1.similarity(genome2) - 1 / 3) < 1e-9
+    # Mismo multiconjunto -> mismo hash de especie
+    assert Genome(['FLEE', 'SEEK_FOOD', 'SEEK_FOOD']).species_hash == genome1.species_hash
@@ -0,0 +1,111 @@
+"""
+Tests para el análisis del mundo de la base de conocimiento
+"""
+
+import numpy as np
+import pytest
+from engine.knowledge_system import CreatureIntelligence, KnowledgeBase, analyze_world
+from engine.world import World
+
+
+def test_analyze_world_density_grid():
+    """Test que el análisis cuenta alimento y depredadores por celda"""
+    food_x = np.array([10.0, 20.0, 30.0, 390.0])
+    food_y = np.array([10.0, 15.0, 20.0, 290.0])
+    analysis = analyze_world(food_x, food_y, np.array([395.0]), np.array([295.0]),
+                             [], 400, 300, bins=(4, 3))
+
+    assert analysis['food_density'].shape == (4, 3)
+    assert analysis['food_density'].sum() == 4
+    assert analysis['food_hotspots'][0] == (50.0, 50.0, 3)
+    assert analysis['danger_zones'] == [(350.0, 250.0, 1)]
+    assert analysis['safe_zones'] == [(50.0, 50.0, 3)]
+
+
+def test_knowledge_base_top_decile():
+    """Test que las estrategias exitosas son el 10% con más fitness, ordenado"""
+    world = World(800, 600)
+    world.populate(30)
+    for i, creature in enumerate(world.creatures):
+        creature.fitness = i
+
+    knowledge = KnowledgeBase()
+    knowledge.apply_analysis(analyze_world(*knowledge.gather(world)))
+
+    strategies = knowledge.world_stats['successful_strategies']
+    expected = [c.complexity for c in world.creatures[-3:][::-1]]
+    assert [s['complexity'] for s in strategies] == expected
+    assert knowledge.food_density.sum() == len(world.data_items)
+
+
+def test_intelligence_ring_buffer_and_bitsets():
+    """Test que las observaciones son circulares y el conocimiento se fusiona con OR"""
+    world = World(800, 600)
+    world.populate(2)
+    first, second = world.creatures
+    knowledge = world.knowledge_base
+    intelligence = CreatureIntelligence(first, knowledge)
+
+    for i in range(60):
+        intelligence.record_observation(i / 100, 0, 0)
+    assert intelligence.observation_count == 60
+    assert intelligence.recent_average(intelligence.ENERGY) == pytest.approx(0.545)
+
+    intelligence.learned = knowledge.mask_of(['huir_amenaza', 'formar_grupos'])
+    other = CreatureIntelligence(second, knowledge)
+    other.learned = knowledge.bit['formar_grupos']
+    assert other.merge(intelligence.learned) == 1
+    assert other.learned_knowledge == {'huir_amenaza', 'formar_grupos'}
+    assert other.wisdom == 1
+
+
+def test_knowledge_store_batched_propagation():
+    """Test que los intercambios encolados se aplican en lote al final del ciclo"""
+    world = World(800, 600)
+    world.populate(3)
+    knowledge = world.knowledge_base
+    teacher, *students = world.creatures
+    for creature in world.creatures:
+        creature.complexity = 2000
+        creature.intelligence = CreatureIntelligence(creature, knowledge)
+    teacher.intelligence.learned = knowledge.mask_of(knowledge.social_knowledge)
+    knowledge.store.SHARE_CHANCE = 1.0
+
+    for student in students:
+        teacher.intelligence.share_knowledge(student)
+    assert students[0].intelligence.learned == 0  # Aún encolado
+
+    assert knowledge.store.propagate() == 2 * len(knowledge.social_knowledge)
+    for student in students:
+        assert student.intelligence.learned == teacher.intelligence.learned
+        assert student.intelligence.wisdom == len(knowledge.social_knowledge)
+
+    # Al morir, la inteligencia conserva su conocimiento fuera del almacén
+    world.remove_creature(students[0])
+    assert students[0].intelligence.row is None
+    assert students[0].intelligence.learned == teacher.intelligence.learned
+
+
+def test_batched_birth_attaches_intelligence():
+    """Test que un hijo que nace inteligente en lote entra en el almacén de conocimiento"""
+    world = World(800, 600)
+    world.populate(1)
+    knowledge = world.knowledge_base
+    parent = world.creatures[0]
+    parent.complexity = 3000  # El hijo hereda el 70%: por encima del umbral
+    parent.intelligence = CreatureIntelligence(parent, knowledge)
+    parent.intelligence.learned = knowledge.mask_of(knowledge.social_knowledge)
+    knowledge.store.SHARE_CHANCE = 1.0
+
+    world._in_tick = True  # Encolar como durante World.update
+    parent.reproduce()
+    world._in_tick = False
+    world._flush_births()
+
+    child = world.creatures[-1]
+    assert child is not parent and child.intelligence is not None
+    assert child.intelligence.row == child.handle[0]
+
+    parent.intelligence.share_knowledge(child)
+    assert knowledge.store.propagate() == len(knowledge.social_knowledge)
+    assert child.intelligence.learned == parent.intelligence.learned
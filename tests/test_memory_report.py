@@ -0,0 +1,42 @@
+"""
+Tests para el informe de memoria
+"""
+
+import numpy as np
+from engine.world import World
+from engine.memory_report import MemoryTracker, build_report, deep_sizeof, format_report
+
+
+def test_view_retains_whole_buffer_once():
+    """Test que una vista cuenta el búfer completo que mantiene vivo, una sola vez"""
+    buffer = np.zeros((100, 16), dtype=np.float32)
+    seen = set()
+    first = deep_sizeof(buffer[3], seen)
+    second = deep_sizeof(buffer[4], seen)
+    assert first >= buffer.nbytes
+    assert second < buffer.nbytes
+
+
+def test_report_covers_subsystems_and_growth():
+    """Test que el informe reparte bytes por subsistema y componente y compara instantáneas"""
+    world = World(800, 600)
+    world.populate(8)
+    creature = world.creatures[0]
+    batch = np.zeros((64, creature.brain.hidden_size2), dtype=np.float32)
+    creature.brain.memory = batch[0]  # Vista de un lote que retiene el búfer entero
+
+    tracker = MemoryTracker()
+    try:
+        first = build_report(world, tracker)
+        assert first['since_cycle'] is None
+        assert first['subsystems']['Pesos neuronales (BrainStore)'] >= world.brain_store.params.nbytes
+        assert first['components']['Genoma'] > 0
+        assert first['memory_views'] == 1
+        assert first['retained_bytes'] == batch.nbytes
+
+        world.update(1 / 60)
+        second = build_report(world, tracker)
+        assert second['since_cycle'] == 0
+        assert "desde el ciclo 0" in format_report(second)
+    finally:
+        tracker.stop()
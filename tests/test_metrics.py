@@ -0,0 +1,55 @@
+"""
+Tests para el historial de métricas
+"""
+
+import numpy as np
+from engine.metrics import MetricsRecorder, METRIC_NAMES
+from engine.world import World
+
+
+def _row(population, births=0):
+    row = np.zeros(len(METRIC_NAMES))
+    row[METRIC_NAMES.index('population')] = population
+    row[METRIC_NAMES.index('births')] = births
+    return row
+
+
+def test_metrics_downsampling_bounded():
+    """Test que los niveles agregan por media/suma y la memoria no crece"""
+    recorder = MetricsRecorder(capacity=20, factor=10, levels=3)
+    for cycle in range(1, 1001):
+        recorder.push(cycle, _row(cycle, births=1))
+
+    cycles, population = recorder.series('population', 0)
+    assert len(population) == 20
+    assert cycles[-1] == 1000 and population[0] == 981
+
+    cycles, population = recorder.series('population', 1)
+    assert len(population) == 20
+    assert population[-1] == np.mean(np.arange(991, 1001))
+    assert recorder.series('births', 1)[1][-1] == 10
+
+    cycles, births = recorder.series('births', 2)
+    assert len(births) == 10 and births.sum() == 1000
+    assert recorder.history_level() == 2
+
+
+def test_metrics_recorded_by_world(tmp_path):
+    """Test que el mundo registra un ciclo por update y exporta el historial"""
+    world = World(800, 600)
+    world.populate(5)
+    for _ in range(3):
+        world.update(0.016)
+
+    assert len(world.metrics) == 3
+    _, population = world.metrics.series('population')
+    assert population[-1] == len(world.creatures)
+
+    world.metrics.export_csv(str(tmp_path / 'metrics.csv'))
+    lines = (tmp_path / 'metrics.csv').read_text().splitlines()
+    assert lines[0].split(',') == ['cycle'] + list(METRIC_NAMES)
+    assert len(lines) == 4
+
+    world.metrics.export_columns(str(tmp_path / 'metrics.npz'))
+    columns = np.load(tmp_path / 'metrics.npz')
+    assert len(columns['level0/population']) == 3
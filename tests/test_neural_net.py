@@ -30,8 +30,57 @@ def test_neural_network_mutation():
     """Test mutación de pesos"""
     nn = NeuralNetwork(8, 16, 4)
     
-    original_weights = nn.weights_ih.copy()
+    original_weights = nn.weights_ih1.copy()
     nn.mutate(rate=1.0)  # 100% mutación
     
     # Verificar que cambió algo
-    assert not (nn.weights_ih == original_weights).all()
+    assert not (nn.weights_ih1 == original_weights).all()
+
+
+def test_brain_store_mutate_rows():
+    """Test mutación vectorizada de filas del almacén"""
+    from engine.brain_store import BrainStore
+    
+    store = BrainStore(8, 16, 4, seed=0)
+    nets = [NeuralNetwork(8, 16, 4) for _ in range(3)]
+    for row, net in enumerate(nets):
+        store.attach(row, net)
+    
+    before = store.params.copy()
+    store.mutate_rows([0, 2], rate=1.0)
+    
+    assert not (store.params[0] == before[0]).all()
+    assert (store.params[1] == before[1]).all()  # Fila no seleccionada intacta
+    assert not (store.params[2] == before[2]).all()
+    # Las redes ven la mutación a través de sus vistas
+    assert (nets[0].weights_ih1 == store.tensors['weights_ih1'][0]).all()
+
+
+def test_batch_writes_memory_into_store_rows():
+    """Test que el lote escribe la memoria en la fila de cada red sin retener búferes del lote"""
+    import numpy as np
+    from engine.brain_store import BrainStore
+    from engine.neural_batch import NeuralBatchProcessor
+    
+    store = BrainStore(8, 16, 4, seed=0)
+    nets = [NeuralNetwork(8, 16, 4) for _ in range(5)]
+    for row, net in enumerate(nets):
+        store.attach(row, net)
+    creatures = [type('Stub', (), {'brain': net})() for net in nets]
+    inputs = [np.random.random(8).tolist() for _ in nets]
+    
+    processor = NeuralBatchProcessor()
+    processor.initialized = False  # Camino numpy (igual con o sin OpenCL instalado)
+    outputs = np.array(processor.process_batch(creatures, inputs))
+    batched_memory = store.memory[:5].copy()
+    first_buffer = processor._outputs
+    
+    store.memory[:5] = 0
+    expected = [net.forward(values) for net, values in zip(nets, inputs)]
+    assert np.allclose(outputs, expected, atol=1e-6)
+    assert np.allclose(batched_memory, store.memory[:5], atol=1e-6)
+    
+    # La memoria de cada red sigue siendo su fila del almacén y los búferes se reutilizan
+    processor.process_batch(creatures, inputs)
+    assert all(np.shares_memory(net.memory, store.memory) for net in nets)
+    assert processor._outputs is first_buffer
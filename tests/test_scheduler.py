@@ -0,0 +1,41 @@
+"""
+Tests para el planificador escalonado de comportamientos
+"""
+
+from engine.scheduler import BehaviorScheduler
+from engine.world import World
+
+
+def test_scheduler_spreads_population_over_period():
+    """Test que cada tick procesa una fracción fija y cada slot actúa una vez por periodo"""
+    scheduler = BehaviorScheduler({'predation': 1.0, 'communication': 0.5}, step_dt=0.1)
+    assert scheduler.period_ticks('predation') == 10
+    assert scheduler.period_ticks('communication') == 5
+
+    slots = range(100)
+    fired = {slot: 0 for slot in slots}
+    for tick in range(10):
+        scheduler.begin_tick(tick, 0.1)
+        due = [slot for slot in slots if scheduler.due('predation', slot)]
+        assert len(due) == 10
+        for slot in due:
+            fired[slot] += 1
+    assert all(count == 1 for count in fired.values())
+
+    # Comportamientos distintos no coinciden en el mismo tick para el mismo slot
+    scheduler.begin_tick(0, 0.1)
+    assert scheduler.due('predation', 0) != scheduler.due('communication', 0)
+
+
+def test_world_advances_scheduler():
+    """Test que el mundo fija la cubeta activa en cada tick"""
+    world = World(800, 600)
+    world.populate(10)
+    world.update(1 / 60)
+    creature = world.creatures[0]
+    ticks = world.scheduler.period_ticks('reproduce')
+    due_ticks = 0
+    for tick in range(world.cycle, world.cycle + ticks):
+        world.scheduler.begin_tick(tick, 1 / 60)
+        due_ticks += creature.is_due('reproduce')
+    assert due_ticks == 1
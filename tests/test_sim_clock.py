@@ -0,0 +1,28 @@
+"""
+Tests para el reloj de simulación de paso fijo
+"""
+
+import pytest
+from engine.sim_clock import SimulationClock
+
+
+def test_clock_speed_adds_fixed_steps():
+    """Test que la velocidad multiplica los pasos, no su duración"""
+    clock = SimulationClock(tick_rate=60, substeps=2, max_steps=100)
+    assert clock.step_dt == pytest.approx(1 / 120)
+
+    assert clock.advance(1 / 60) == 2
+    assert clock.advance(1 / 60, speed=10) == 20
+
+    # Medio paso pendiente se acumula para el siguiente frame
+    assert clock.advance(1 / 240) == 0
+    assert clock.alpha == pytest.approx(0.5)
+    assert clock.advance(1 / 240) == 1
+
+
+def test_clock_caps_steps_per_frame():
+    """Test que un frame lento descarta tiempo en vez de alargar los pasos"""
+    clock = SimulationClock(tick_rate=60, substeps=1, max_steps=5)
+    assert clock.advance(0.2) == 5
+    assert clock.dropped_time == pytest.approx(0.2 - 5 / 60)
+    assert 0 <= clock.alpha < 1
@@ -0,0 +1,83 @@
+"""
+Tests para las instantáneas del mundo y la simulación en hilo propio
+"""
+
+import time
+import pytest
+from engine.world import World
+from engine.world_snapshot import SnapshotBuilder
+from engine.sim_thread import LocalSimulation, SimulationThread
+
+
+def test_snapshot_is_immutable_copy():
+    """Test que la instantánea copia el estado y no cambia con el mundo"""
+    world = World(800, 600)
+    world.populate(6)
+    selected = world.creatures[2]
+    world.selected_creature = selected
+
+    snapshot = SnapshotBuilder(world).build()
+
+    assert len(snapshot.ids) == 6
+    assert snapshot.selected.id == selected.id
+    assert snapshot.ids[snapshot.selected_index] == selected.id
+    with pytest.raises(ValueError):
+        snapshot.x[0] = 0.0
+
+    old_x = snapshot.x[snapshot.selected_index]
+    selected.x += 50
+    assert snapshot.x[snapshot.selected_index] == old_x
+
+
+def test_local_simulation_applies_commands():
+    """Test que los comandos se aplican y se publican en la siguiente instantánea"""
+    world = World(800, 600)
+    world.populate(5)
+    simulation = LocalSimulation(world)
+    simulation.start()
+
+    target = world.creatures[0]
+    simulation.submit('select', (target.x, target.y))
+    simulation.submit('rename', target.id, "Ada")
+    simulation.set_speed(2)
+    simulation.advance(1 / 60)
+
+    snapshot = simulation.latest()
+    assert snapshot.selected.name == "Ada"
+    assert snapshot.speed == 2
+    assert world.cycle == 2  # Velocidad 2x: dos pasos fijos por frame
+
+
+def test_simulation_thread_publishes_snapshots():
+    """Test que el hilo avanza el mundo y atiende la cola de comandos"""
+    world = World(800, 600)
+    world.populate(5)
+    simulation = SimulationThread(world)
+    simulation.start()
+    try:
+        deadline = time.time() + 5
+        while simulation.latest().cycle < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert simulation.latest().cycle >= 3
+
+        simulation.submit('pause', True)
+        while not simulation.latest().paused and time.time() < deadline:
+            time.sleep(0.01)
+        paused_cycle = simulation.latest().cycle
+        time.sleep(0.1)
+        assert simulation.latest().cycle == paused_cycle
+    finally:
+        simulation.stop()
+    assert simulation.error is None
+
+
+def test_incomplete_host_fails_on_construction():
+    """Test que un host sin submit/latest/_publish no llega a construirse"""
+    from engine.sim_thread import SimulationHost
+
+    class PartialHost(SimulationHost):
+        def submit(self, command, *args):
+            pass
+
+    with pytest.raises(TypeError):
+        PartialHost(World(800, 600))
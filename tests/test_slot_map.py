@@ -0,0 +1,71 @@
+"""
+Tests para el contenedor SlotMap
+"""
+
+import pytest
+from engine.slot_map import SlotMap
+from engine.creature import Creature
+from engine.world import World
+
+
+class _Item:
+    def __init__(self, item_id):
+        self.id = item_id
+        self.handle = None
+
+
+def test_slot_map_add_and_remove():
+    """Test altas y bajas con swap-remove"""
+    slots = SlotMap()
+    items = [_Item(i) for i in range(5)]
+    for item in items:
+        slots.add(item)
+
+    assert len(slots) == 5
+    assert slots.remove(items[1])
+    assert len(slots) == 4
+    assert items[1] not in slots
+    assert all(item in slots for item in items if item is not items[1])
+    assert not slots.remove(items[1])  # Segunda baja no hace nada
+
+
+def test_slot_map_stale_handle():
+    """Test que un handle antiguo no apunta al nuevo ocupante del slot"""
+    slots = SlotMap()
+    first = _Item(1)
+    old_handle = slots.add(first)
+    slots.remove(first)
+
+    second = _Item(2)
+    new_handle = slots.add(second)
+
+    assert new_handle[0] == old_handle[0]  # Slot reutilizado
+    assert not slots.is_alive(old_handle)
+    assert slots.get(old_handle) is None
+    assert slots.get(new_handle) is second
+
+
+def test_slot_map_lookup_by_id():
+    """Test búsqueda por id"""
+    slots = SlotMap()
+    items = [_Item(i) for i in range(10, 15)]
+    for item in items:
+        slots.add(item)
+
+    assert slots.get_by_id(12) is items[2]
+    slots.remove(items[2])
+    assert slots.get_by_id(12) is None
+
+
+def test_world_selection_cleared_on_death():
+    """Test que la selección se invalida cuando la criatura muere"""
+    world = World(800, 600)
+    world.populate(3)
+    creature = world.creatures[0]
+    world.selected_creature = creature
+
+    assert world.selected_creature is creature
+    assert world.get_creature(creature.id) is creature
+
+    world.remove_creature(creature)
+    assert world.selected_creature is None
@@ -0,0 +1,48 @@
+"""
+Tests para el índice espacial
+"""
+
+import pytest
+from engine.spatial_grid import SpatialGrid
+from engine.world import World
+
+
+class _Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def test_spatial_grid_move_and_query():
+    """Test que mover re-indexa y las consultas solo ven celdas cercanas"""
+    grid = SpatialGrid(50)
+    near = _Point(10, 10)
+    far = _Point(400, 400)
+    grid.insert(near, near.x, near.y)
+    grid.insert(far, far.x, far.y)
+
+    assert set(map(id, grid.query_radius(0, 0, 30))) == {id(near)}
+
+    far.x, far.y = 20, 20
+    grid.move(far, far.x, far.y)
+    assert set(map(id, grid.query_radius(0, 0, 30))) == {id(near), id(far)}
+
+    assert grid.remove(near)
+    assert not grid.remove(near)
+    assert len(grid) == 1
+
+
+def test_world_queries_follow_movement():
+    """Test que get_creatures_near usa posiciones actualizadas"""
+    world = World(800, 600)
+    world.populate(10)
+    creature = world.creatures[0]
+
+    creature.x, creature.y = 700, 500
+    creature.vx = creature.vy = 0
+    creature.move(0.0)
+
+    assert creature in world.get_creatures_near(700, 500, 5)
+
+    world.remove_creature(creature)
+    assert creature not in world.get_creatures_near(700, 500, 5)
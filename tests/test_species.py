@@ -0,0 +1,49 @@
+"""
+Tests para el seguimiento de especies
+"""
+
+import pytest
+import numpy as np
+from engine.genome import Genome
+from engine.world import World
+
+
+def test_species_inherited_and_split():
+    """Test que un hijo similar hereda la especie y uno distinto se separa"""
+    world = World(800, 600)
+    world.populate(1)
+    parent = world.creatures[0]
+    parent.energy = parent.max_energy
+    root_id = parent.species_id
+
+    # Todo hijo queda registrado en alguna especie viva
+    parent.reproduce()
+    child = world.creatures[-1]
+    assert child.species_id in world.species_tracker.living
+
+    # Forzar un genoma muy distinto para el siguiente hijo
+    tracker = world.species_tracker
+    tracker.get(root_id).representative_genome = Genome(np.zeros(20, dtype=np.uint8))
+    parent.genome = Genome(np.full(20, 7, dtype=np.uint8))
+    parent.energy = parent.max_energy
+    parent.reproduce()
+    split = world.creatures[-1]
+
+    assert split.species_id != root_id
+    assert tracker.get(split.species_id).parent_id == root_id
+
+
+def test_species_extinction_history():
+    """Test que las bajas actualizan contadores y el historial conserva las extintas"""
+    world = World(800, 600)
+    world.populate(5)
+    living = world.species_count
+    assert sum(s.members for s in world.species_tracker.living.values()) == 5
+
+    for creature in list(world.creatures):
+        world.remove_creature(creature)
+
+    assert world.species_count == 0
+    phylogeny = world.species_tracker.get_phylogeny()
+    assert len(phylogeny) == living
+    assert all(record['extinct_cycle'] is not None for record in phylogeny)
@@ -0,0 +1,27 @@
+"""
+Tests para el sistema de vocalización
+"""
+
+import config
+from engine.vocal_system import VocalSystem, WORD_IDS
+from engine.world import World
+
+
+def test_learned_mask_follows_association_threshold():
+    """Test que una palabra cuenta como aprendida al cruzar el umbral"""
+    world = World(800, 600)
+    world.populate(1)
+    vocal = VocalSystem(world.creatures[0])
+    vocal._set_association(WORD_IDS['hola'], 0)
+    base = vocal.get_vocabulary_size()
+    word_id = WORD_IDS['peligro']
+
+    for _ in range(config.ASSOCIATION_THRESHOLD - 1):
+        vocal.try_learn(word_id)
+    assert not vocal.has_learned('peligro')
+
+    vocal.try_learn(word_id)
+    assert vocal.has_learned('peligro')
+    assert vocal.has_learned(word_id)
+    assert vocal.get_vocabulary_size() == base + 1
+    assert vocal.associations[word_id] == config.ASSOCIATION_THRESHOLD
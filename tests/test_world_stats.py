@@ -0,0 +1,37 @@
+"""
+Tests para las estadísticas agregadas del mundo
+"""
+
+import pytest
+from engine.world import World
+
+
+def test_stats_snapshot_matches_population():
+    """Test que la instantánea coincide con un recorrido directo"""
+    world = World(800, 600)
+    world.populate(8)
+    for i, creature in enumerate(world.creatures):
+        creature.fitness = i * 3
+        creature.complexity = i * 10
+
+    snapshot = world.get_stats_snapshot()
+
+    assert snapshot.population == 8
+    assert snapshot.max_complexity == max(c.complexity for c in world.creatures)
+    assert snapshot.fittest.fitness == max(c.fitness for c in world.creatures)
+    assert snapshot.weakest.fitness == min(c.fitness for c in world.creatures)
+    assert snapshot.avg_fitness == pytest.approx(sum(c.fitness for c in world.creatures) / 8)
+
+
+def test_stats_snapshot_cached_per_cycle():
+    """Test que la instantánea se reutiliza hasta que cambia el mundo"""
+    world = World(800, 600)
+    world.populate(5)
+
+    first = world.get_stats_snapshot()
+    assert world.get_stats_snapshot() is first
+
+    world.remove_creature(world.creatures[0])
+    world.total_deaths += 1
+    assert world.get_stats_snapshot() is not first
+    assert world.get_stats_snapshot().population == 4
@@ -82,6 +82,8 @@ class HelpMenu:
             {'type': 'control', 'key': 'N', 'desc': 'Renombrar criatura seleccionada'},
             {'type': 'control', 'key': 'R', 'desc': 'Reiniciar simulación'},
             {'type': 'control', 'key': 'S', 'desc': 'Guardar simulación'},
+            {'type': 'control', 'key': 'E', 'desc': 'Exportar historial de métricas'},
+            {'type': 'control', 'key': 'I', 'desc': 'Informe de memoria en consola'},
             {'type': 'control', 'key': 'F11', 'desc': 'Pantalla completa'},
             {'type': 'control', 'key': 'ESC', 'desc': 'Salir'},
             
@@ -43,6 +43,9 @@ class CreatureInspector:
         self.screen.blit(title, (self.x + 20, y_offset))
         y_offset += 40
         
+        vocal_system = self.creature.vocal_system
+        vocabulary_size = vocal_system.get_vocabulary_size() if vocal_system else 0
+        
         # Información detallada
         info = [
             f"Generación: {self.creature.generation}",
@@ -52,7 +55,7 @@ class CreatureInspector:
             f"Fase: {self.creature.get_phase().title()}",
             "",
             f"Genoma: {len(self.creature.genome)} instrucciones",
-            f"Vocabulario: {self.creature.vocal_system.get_vocabulary_size()} palabras",
+            f"Vocabulario: {vocabulary_size} palabras",
             "",
             "Palabras conocidas:",
         ]
@@ -63,7 +66,7 @@ class CreatureInspector:
             y_offset += 25
         
         # Vocabulario
-        for word, count in list(self.creature.vocal_system.vocabulary.items())[:5]:
+        for word, count in (vocal_system.used_words(5) if vocal_system else []):
             text = self.font.render(f"  - '{word}' ({count} veces)", True, (150, 200, 150))
             self.screen.blit(text, (self.x + 30, y_offset))
             y_offset += 20
@@ -12,6 +12,7 @@ class ConfigMenu:
     def __init__(self, screen, world):
         self.screen = screen
         self.world = world
+        self.simulation = None  # Si se asigna, los cambios al mundo van por su cola
         self.visible = False
         
         # Dimensiones - más grande para mejor visualización
@@ -256,11 +257,7 @@ class ConfigMenu:
                 config.INITIAL_ENERGY = value
                 config.MAX_ENERGY = value * 1.5  # Actualizar también MAX_ENERGY
                 # Aplicar boost de energía a criaturas existentes
-                if hasattr(self, 'world') and self.world and self.world.creatures:
-                    energy_boost = value - old_initial
-                    for creature in self.world.creatures:
-                        creature.max_energy = config.MAX_ENERGY
-                        creature.energy = min(creature.energy + energy_boost, creature.max_energy)
+                self.run_on_world(self.boost_energy(value - old_initial, config.MAX_ENERGY))
                 changes_made.append(f"Energía Inicial: {value:.0f}")
             elif key == 'energy_cost':
                 config.ENERGY_COST_PER_CYCLE = value
@@ -279,6 +276,22 @@ class ConfigMenu:
         for change in changes_made:
             print(f"   • {change}")
     
+    @staticmethod
+    def boost_energy(energy_boost: float, max_energy: float):
+        """Cambio a aplicar sobre las criaturas existentes"""
+        def apply(world):
+            for creature in world.creatures:
+                creature.max_energy = max_energy
+                creature.energy = min(creature.energy + energy_boost, creature.max_energy)
+        return apply
+    
+    def run_on_world(self, function):
+        """Ejecutar un cambio sobre el mundo en el hilo de la simulación"""
+        if self.simulation is not None:
+            self.simulation.submit('call', function)
+        elif self.world:
+            function(self.world)
+    
     def reset_defaults(self):
         """Restablecer valores por defecto (MEJORADOS v2.7)"""
         defaults = {
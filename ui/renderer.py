@@ -4,11 +4,20 @@ Renderizador principal del mundo
 
 import pygame
 import math
+import numpy as np
 import config
+from engine.world_snapshot import SnapshotBuilder
+from .sprite_cache import SpriteCache
+from .text_cache import get_text_cache
 
 
 class Renderer:
-    """Renderiza el mundo y las criaturas"""
+    """Renderiza el mundo y las criaturas
+    
+    Dibuja a partir de ``WorldSnapshot`` (asignada en ``snapshot`` cada
+    frame) y nunca lee criaturas vivas, así que la simulación puede correr
+    en otro hilo. Sin instantánea asignada, la construye del mundo.
+    """
     
     def __init__(self, screen, world):
         self.screen = screen
@@ -24,31 +33,55 @@ class Renderer:
         self.following_creature = False
         self.auto_zoom_target = 1.5  # Zoom al seleccionar criatura
         
+        # Instantánea a dibujar y fracción del paso en curso (1.0 = posición actual)
+        self.snapshot = None
+        self.interpolation = 1.0
+        self._snapshot_builder = None
+        
         # Escala para pantalla completa
         self.scale_factor = 1.0
         
         # Fuentes
         self.font_small = pygame.font.Font(None, 16)
         self.font_medium = pygame.font.Font(None, 20)
+        
+        # Sprites prerenderizados (una criatura = un blit)
+        self.sprite_cache = SpriteCache()
+        self.text_cache = get_text_cache()
+        
+        # Mapa de calor de alimento (nivel de detalle bajo)
+        self._heatmap = None
+        self._heatmap_key = None
+        self._disc_offsets = {}  # radio -> píxeles de draw.circle
+    
+    def current_snapshot(self):
+        """Instantánea asignada o, si no hay, una nueva del mundo"""
+        if self.snapshot is not None:
+            return self.snapshot
+        if self._snapshot_builder is None:
+            self._snapshot_builder = SnapshotBuilder(self.world)
+        return self._snapshot_builder.build()
     
     def render(self):
         """Renderizar frame completo"""
+        snapshot = self.current_snapshot()
+        
         # Seguir criatura seleccionada si está activo
-        if self.following_creature and self.world.selected_creature:
-            self.follow_selected_creature()
+        if self.following_creature:
+            self.follow_selected_creature(snapshot)
         
         # Limpiar superficie del mundo
         self.world_surface.fill(config.BACKGROUND_COLOR)
         
         # Renderizar datos (alimento)
-        self.render_data()
+        self.render_data(snapshot)
         
         # Renderizar criaturas
-        self.render_creatures()
+        self.render_creatures(snapshot)
         
         # Renderizar criatura seleccionada (highlight)
-        if self.world.selected_creature:
-            self.render_selected_highlight()
+        if snapshot.selected_index is not None:
+            self.render_selected_highlight(snapshot)
         
         # Escalar y blit mundo a pantalla
         if hasattr(self, 'scale_factor') and self.scale_factor != 1.0:
@@ -64,16 +97,19 @@ class Renderer:
             # Renderizado normal
             self.screen.blit(self.world_surface, (0, 0))
     
-    def follow_selected_creature(self):
+    def follow_selected_creature(self, snapshot=None):
         """Seguir criatura seleccionada con la cámara"""
-        creature = self.world.selected_creature
-        if creature not in self.world.creatures:
+        if snapshot is None:
+            snapshot = self.current_snapshot()
+        index = snapshot.selected_index  # None si murió
+        if index is None:
             self.following_creature = False
             return
         
         # Centrar cámara en la criatura
-        target_x = creature.x - (config.WORLD_WIDTH / 2) / self.zoom
-        target_y = creature.y - (config.WORLD_HEIGHT / 2) / self.zoom
+        creature_x, creature_y = self.creature_position(snapshot, index)
+        target_x = creature_x - (config.WORLD_WIDTH / 2) / self.zoom
+        target_y = creature_y - (config.WORLD_HEIGHT / 2) / self.zoom
         
         # Suavizar movimiento de cámara
         self.camera_x += (target_x - self.camera_x) * 0.1
@@ -87,105 +123,225 @@ class Renderer:
     
     def start_following(self):
         """Iniciar seguimiento de criatura seleccionada"""
-        if self.world.selected_creature:
+        if self.current_snapshot().selected_index is not None:
             self.following_creature = True
     
     def stop_following(self):
         """Detener seguimiento"""
         self.following_creature = False
     
-    def render_data(self):
-        """Renderizar datos/alimento"""
-        for data in self.world.data_items:
-            x, y = self.world_to_screen(data['x'], data['y'])
-            size = int(data['size'] * self.zoom)
-            pygame.draw.circle(self.world_surface, data['color'], (int(x), int(y)), size)
+    def visible_bounds(self, margin: float = 0):
+        """Rectángulo visible de la cámara en coordenadas del mundo"""
+        x0 = self.camera_x - margin
+        y0 = self.camera_y - margin
+        x1 = self.camera_x + config.WORLD_WIDTH / self.zoom + margin
+        y1 = self.camera_y + config.WORLD_HEIGHT / self.zoom + margin
+        return x0, y0, x1, y1
+    
+    def render_data(self, snapshot):
+        """Renderizar datos/alimento (splat vectorizado sobre los píxeles)"""
+        if self.zoom < config.LOD_DOT_ZOOM:
+            self.render_data_heatmap(snapshot)
+            return
+        if not len(snapshot.food_x):
+            return
+        
+        try:
+            self.splat_data(snapshot)
+        except (ValueError, pygame.error):
+            # Superficie sin acceso directo a píxeles: un círculo por dato visible
+            x0, y0, x1, y1 = self.visible_bounds(10)
+            xs, ys = snapshot.food_x, snapshot.food_y
+            for i in np.flatnonzero((xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)):
+                x, y = self.world_to_screen(xs[i], ys[i])
+                size = int(snapshot.food_size[i] * self.zoom)
+                pygame.draw.circle(self.world_surface, tuple(snapshot.food_colors[i].tolist()),
+                                   (int(x), int(y)), size)
+    
+    def splat_data(self, snapshot=None):
+        """Escribir todos los discos de alimento en una sola operación numpy
+        
+        Cada disco usa los píxeles exactos de pygame.draw.circle para su
+        radio (plantilla precalculada), así que el resultado es idéntico al
+        dibujo círculo a círculo.
+        """
+        if snapshot is None:
+            snapshot = self.current_snapshot()
+        xs = ((snapshot.food_x - self.camera_x) * self.zoom).astype(np.intp)
+        ys = ((snapshot.food_y - self.camera_y) * self.zoom).astype(np.intp)
+        radii = (snapshot.food_size * self.zoom).astype(np.intp)
+        colors = snapshot.food_colors
+        
+        pixels = pygame.surfarray.pixels3d(self.world_surface)
+        width, height = pixels.shape[:2]
+        
+        for radius in np.unique(radii):
+            offset_x, offset_y = self.disc_offsets(int(radius))
+            if len(offset_x) == 0:
+                continue
+            
+            # Descartar centros fuera de la vista
+            selected = ((radii == radius) &
+                        (xs >= -radius) & (xs < width + radius) &
+                        (ys >= -radius) & (ys < height + radius))
+            px = (xs[selected, None] + offset_x).ravel()
+            py = (ys[selected, None] + offset_y).ravel()
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            pixels[px[inside], py[inside]] = np.repeat(colors[selected], len(offset_x), axis=0)[inside]
+        
+        del pixels  # Liberar el bloqueo de la superficie
+    
+    def disc_offsets(self, radius: int):
+        """Desplazamientos de los píxeles que pinta draw.circle para un radio"""
+        offsets = self._disc_offsets.get(radius)
+        if offsets is None:
+            side = radius * 2 + 3
+            stamp = pygame.Surface((side, side))
+            pygame.draw.circle(stamp, (255, 255, 255), (radius + 1, radius + 1), radius)
+            dx, dy = np.nonzero(pygame.surfarray.array2d(stamp))
+            offsets = (dx - (radius + 1), dy - (radius + 1))
+            self._disc_offsets[radius] = offsets
+        return offsets
     
-    def render_creatures(self):
-        """Renderizar todas las criaturas"""
-        for creature in self.world.creatures:
-            self.render_creature(creature)
+    def render_data_heatmap(self, snapshot):
+        """Renderizar alimento agregado como textura de densidad (zoom bajo)"""
+        if not len(snapshot.food_x):
+            return
+        
+        # Reconstruir la textura solo si el alimento o el zoom cambiaron
+        key = (snapshot.data_version, self.zoom)
+        if self._heatmap_key != key:
+            self._heatmap = self.build_data_heatmap(snapshot)
+            self._heatmap_key = key
+        self.world_surface.blit(self._heatmap, self.world_to_screen(0, 0))
     
-    def render_creature(self, creature):
-        """Renderizar una criatura"""
-        x, y = self.world_to_screen(creature.x, creature.y)
-        size = int(creature.size * self.zoom)
-        
-        # Dibujar forma según fase evolutiva
-        phase = creature.get_phase()
-        
-        if phase == 'primitive':
-            # Círculo simple
-            pygame.draw.circle(self.world_surface, creature.color, (int(x), int(y)), size)
-            pygame.draw.circle(self.world_surface, (255, 255, 255), (int(x), int(y)), size, 1)
-        
-        elif phase == 'intermediate':
-            # Hexágono
-            self.draw_polygon(x, y, size, 6, creature.color, creature.direction)
-        
-        elif phase == 'advanced':
-            # Octógono
-            self.draw_polygon(x, y, size, 8, creature.color, creature.direction)
-        
-        else:  # complex
-            # Estrella de 8 puntas
-            self.draw_star(x, y, size, creature.color, creature.direction)
-        
-        # Dirección (línea)
-        end_x = x + math.cos(creature.direction) * size * 0.7
-        end_y = y + math.sin(creature.direction) * size * 0.7
-        pygame.draw.line(self.world_surface, (255, 255, 255), 
-                        (int(x), int(y)), (int(end_x), int(end_y)), 2)
-        
-        # Barra de energía si está activado
-        if config.SHOW_ENERGY_BAR:
-            self.render_energy_bar(creature, x, y, size)
-        
-        # Nombre si está activado o si tiene nombre personalizado
-        if (config.SHOW_NAMES and self.zoom > 0.8) or (hasattr(creature, 'custom_name') and creature.custom_name):
-            self.render_creature_name(creature, x, y, size)
-        
-        # Indicador vocal
-        if creature.can_vocalize():
-            self.render_vocal_indicator(x, y, size)
+    def build_data_heatmap(self, snapshot) -> pygame.Surface:
+        """Textura de densidad de alimento escalada al zoom actual"""
+        cell = config.LOD_HEATMAP_CELL
+        cols = max(1, int(math.ceil(config.WORLD_WIDTH / cell)))
+        rows = max(1, int(math.ceil(config.WORLD_HEIGHT / cell)))
+        colors = snapshot.food_colors.astype(np.float32)
+        
+        # Índice de celda plano (columna mayor, como espera surfarray)
+        cx = np.clip((snapshot.food_x // cell).astype(np.intp), 0, cols - 1)
+        cy = np.clip((snapshot.food_y // cell).astype(np.intp), 0, rows - 1)
+        flat = cx * rows + cy
+        
+        # Densidad y color medio por celda
+        counts = np.bincount(flat, minlength=cols * rows).astype(np.float32)
+        rgb = np.empty((cols * rows, 3), dtype=np.float32)
+        for channel in range(3):
+            rgb[:, channel] = np.bincount(flat, weights=colors[:, channel], minlength=cols * rows)
+        occupied = counts > 0
+        rgb[occupied] /= counts[occupied, None]
+        rgb *= (np.minimum(1.0, 0.4 + counts / 4.0) * occupied)[:, None]
+        
+        texture = pygame.surfarray.make_surface(rgb.reshape(cols, rows, 3).astype(np.uint8))
+        texture.set_colorkey((0, 0, 0))
+        return pygame.transform.scale(
+            texture, (int(cols * cell * self.zoom), int(rows * cell * self.zoom))
+        )
     
-    def render_energy_bar(self, creature, x, y, size):
-        """Renderizar barra de energía"""
-        bar_width = size * 2
-        bar_height = 4
-        bar_x = x - bar_width / 2
-        bar_y = y - size - 10
-        
-        # Fondo
-        pygame.draw.rect(self.world_surface, (50, 50, 50),
-                        (int(bar_x), int(bar_y), int(bar_width), bar_height))
-        
-        # Energía
-        energy_ratio = creature.energy / creature.max_energy
-        energy_width = bar_width * energy_ratio
-        
-        # Color según nivel
-        if energy_ratio > 0.6:
-            color = (0, 255, 0)
-        elif energy_ratio > 0.3:
-            color = (255, 255, 0)
-        else:
-            color = (255, 0, 0)
+    def creature_positions(self, snapshot):
+        """Posiciones interpoladas entre el paso anterior y el actual"""
+        alpha = self.interpolation
+        if alpha >= 1.0:
+            return snapshot.x, snapshot.y
+        dx = snapshot.x - snapshot.last_x
+        dy = snapshot.y - snapshot.last_y
+        # Sin interpolar saltos (p. ej. al cruzar el borde en topología toroidal)
+        jumped = (np.abs(dx) > self.world.width / 2) | (np.abs(dy) > self.world.height / 2)
+        alpha = np.where(jumped, 1.0, alpha)
+        return snapshot.last_x + dx * alpha, snapshot.last_y + dy * alpha
+    
+    def creature_position(self, snapshot, index: int):
+        """Posición interpolada de una criatura de la instantánea"""
+        x, y = float(snapshot.x[index]), float(snapshot.y[index])
+        alpha = self.interpolation
+        if alpha >= 1.0:
+            return x, y
+        last_x, last_y = float(snapshot.last_x[index]), float(snapshot.last_y[index])
+        dx, dy = x - last_x, y - last_y
+        if abs(dx) > self.world.width / 2 or abs(dy) > self.world.height / 2:
+            return x, y
+        return last_x + dx * alpha, last_y + dy * alpha
+    
+    def render_creatures(self, snapshot):
+        """Renderizar criaturas visibles (sprites en caché, blits en lote)"""
+        if not len(snapshot.ids):
+            return
+        
+        # Recorte vectorizado a la vista de la cámara
+        xs, ys = self.creature_positions(snapshot)
+        x0, y0, x1, y1 = self.visible_bounds(config.CREATURE_SIZE_MAX)
+        visible = np.flatnonzero((xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1))
+        screen_x = ((xs[visible] - self.camera_x) * self.zoom).tolist()
+        screen_y = ((ys[visible] - self.camera_y) * self.zoom).tolist()
+        sizes = snapshot.size[visible].tolist()
+        visible = visible.tolist()
+        colors = snapshot.colors
+        
+        if self.zoom < config.LOD_DOT_ZOOM:
+            # Nivel de detalle bajo: un punto por criatura
+            dots = []
+            for i, x, y, size in zip(visible, screen_x, screen_y, sizes):
+                surface, radius = self.sprite_cache.get_dot(colors[i], int(size * self.zoom * 0.4))
+                dots.append((surface, (int(x) - radius, int(y) - radius)))
+            self.blit_batch(dots)
+            return
         
-        pygame.draw.rect(self.world_surface, color,
-                        (int(bar_x), int(bar_y), int(energy_width), bar_height))
+        sprites = []
+        bars = []
+        named = []
+        detailed = self.zoom >= config.LOD_DETAIL_ZOOM
+        show_names = config.SHOW_NAMES and detailed
+        show_bars = config.SHOW_ENERGY_BAR and detailed
+        phases, vocal, names = snapshot.phases, snapshot.vocal, snapshot.names
+        directions, energy = snapshot.direction, snapshot.energy_ratio
+        
+        for i, x, y, size in zip(visible, screen_x, screen_y, sizes):
+            size = int(size * self.zoom)
+            
+            surface, half = self.sprite_cache.get_creature_sprite(
+                phases[i], size, colors[i], float(directions[i]), vocal[i]
+            )
+            sprites.append((surface, (int(x) - half, int(y) - half)))
+            
+            # Barra de energía si está activado
+            if show_bars:
+                bar_width = size * 2
+                bar = self.sprite_cache.get_energy_bar(bar_width, float(energy[i]))
+                bars.append((bar, (int(x - bar_width / 2), int(y - size - 10))))
+            
+            # Nombre si está activado o si tiene nombre personalizado
+            if show_names or names[i]:
+                named.append((names[i], int(snapshot.ids[i]), x, y, size))
+        
+        self.blit_batch(sprites)
+        self.blit_batch(bars)
+        for custom_name, creature_id, x, y, size in named:
+            self.render_creature_name(custom_name, creature_id, x, y, size)
+    
+    def blit_batch(self, sequence):
+        """Dibujar una secuencia de (superficie, posición) con una sola llamada"""
+        if not sequence:
+            return
+        if hasattr(self.world_surface, 'fblits'):
+            self.world_surface.fblits(sequence)  # pygame-ce
+        else:
+            self.world_surface.blits(sequence, doreturn=False)
     
-    def render_creature_name(self, creature, x, y, size):
+    def render_creature_name(self, custom_name, creature_id, x, y, size):
         """Renderizar nombre de criatura"""
         # Usar nombre personalizado si existe
-        if hasattr(creature, 'custom_name') and creature.custom_name:
-            name = creature.custom_name
+        if custom_name:
+            name = custom_name
             color = (255, 255, 100)  # Amarillo para nombres personalizados
         else:
-            name = f"C-{creature.id}"
+            name = f"C-{creature_id}"
             color = (200, 200, 200)
         
-        text = self.font_small.render(name, True, color)
+        text = self.text_cache.render(self.font_small, name, True, color)
         text_rect = text.get_rect(center=(int(x), int(y - size - 10)))  # Encima de la criatura
         
         # Fondo semi-transparente para mejor legibilidad
@@ -195,23 +351,14 @@ class Renderer:
         
         self.world_surface.blit(text, text_rect)
     
-    def render_vocal_indicator(self, x, y, size):
-        """Renderizar indicador de capacidad vocal"""
-        # Estrella pequeña
-        star_x = x + size - 5
-        star_y = y - size + 5
-        pygame.draw.circle(self.world_surface, (255, 255, 0), 
-                          (int(star_x), int(star_y)), 3)
-    
-    def render_selected_highlight(self):
+    def render_selected_highlight(self, snapshot):
         """Resaltar criatura seleccionada"""
-        creature = self.world.selected_creature
-        if creature not in self.world.creatures:
-            self.world.selected_creature = None
+        index = snapshot.selected_index
+        if index is None:
             return
         
-        x, y = self.world_to_screen(creature.x, creature.y)
-        size = int(creature.size * self.zoom) + 5
+        x, y = self.world_to_screen(*self.creature_position(snapshot, index))
+        size = int(snapshot.size[index] * self.zoom) + 5
         
         # Círculo pulsante
         pulse = abs(math.sin(pygame.time.get_ticks() / 200)) * 5
@@ -273,34 +420,3 @@ class Renderer:
         # Aplicar límites
         self.camera_x = max(min_x, min(max_x, self.camera_x))
         self.camera_y = max(min_y, min(max_y, self.camera_y))
-    
-    def draw_polygon(self, x, y, size, sides, color, rotation):
-        """Dibujar polígono regular"""
-        points = []
-        angle_step = 2 * math.pi / sides
-        
-        for i in range(sides):
-            angle = rotation + i * angle_step
-            px = x + math.cos(angle) * size
-            py = y + math.sin(angle) * size
-            points.append((int(px), int(py)))
-        
-        pygame.draw.polygon(self.world_surface, color, points)
-        pygame.draw.polygon(self.world_surface, (255, 255, 255), points, 1)
-    
-    def draw_star(self, x, y, size, color, rotation):
-        """Dibujar estrella de 8 puntas"""
-        points = []
-        outer_radius = size
-        inner_radius = size * 0.5
-        num_points = 8
-        
-        for i in range(num_points * 2):
-            angle = rotation + (i * math.pi / num_points)
-            radius = outer_radius if i % 2 == 0 else inner_radius
-            px = x + math.cos(angle) * radius
-            py = y + math.sin(angle) * radius
-            points.append((int(px), int(py)))
-        
-        pygame.draw.polygon(self.world_surface, color, points)
-        pygame.draw.polygon(self.world_surface, (255, 255, 255), points, 1)
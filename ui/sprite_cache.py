@@ -0,0 +1,159 @@
+"""
+Caché de sprites de criaturas (atlas LRU construido bajo demanda)
+"""
+
+import math
+from collections import OrderedDict
+import pygame
+import config
+
+
+OUTLINE_COLOR = (255, 255, 255)
+VOCAL_COLOR = (255, 255, 0)
+ENERGY_BAR_HEIGHT = 4
+
+
+class SpriteCache:
+    """Sprites prerenderizados por (fase, tamaño, color, rotación, vocal)
+
+    Cada sprite contiene el cuerpo, el contorno, la línea de dirección y el
+    indicador vocal, de modo que una criatura se dibuja con un único blit.
+    La rotación se cuantiza a ``SPRITE_ROTATIONS`` ángulos y el tamaño a
+    píxeles enteros; los sprites menos usados se descartan (LRU).
+    """
+
+    def __init__(self, max_sprites: int = None, rotations: int = None):
+        self.max_sprites = max_sprites or config.SPRITE_CACHE_SIZE
+        self.rotations = rotations or config.SPRITE_ROTATIONS
+        self._sprites = OrderedDict()
+        self._bars = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_creature_sprite(self, phase: str, size: int, color, direction: float,
+                            vocal: bool):
+        """Obtener sprite y offset al centro (lo construye si no existe)"""
+        step = int(round(direction / (2 * math.pi) * self.rotations)) % self.rotations
+        key = (phase, size, color, step, vocal)
+
+        entry = self._sprites.get(key)
+        if entry is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = self._build_creature_sprite(phase, size, color,
+                                            step * 2 * math.pi / self.rotations, vocal)
+        self._sprites[key] = entry
+        if len(self._sprites) > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return entry
+
+    def get_energy_bar(self, bar_width: int, energy_ratio: float):
+        """Obtener sprite de barra de energía (cuantizada a píxeles)"""
+        energy_width = max(0, min(bar_width, int(bar_width * energy_ratio)))
+
+        if energy_ratio > 0.6:
+            color = (0, 255, 0)
+        elif energy_ratio > 0.3:
+            color = (255, 255, 0)
+        else:
+            color = (255, 0, 0)
+
+        key = (bar_width, energy_width, color)
+        surface = self._bars.get(key)
+        if surface is not None:
+            self._bars.move_to_end(key)
+            return surface
+
+        surface = pygame.Surface((max(1, bar_width), ENERGY_BAR_HEIGHT))
+        surface.fill((50, 50, 50))
+        if energy_width > 0:
+            surface.fill(color, (0, 0, energy_width, ENERGY_BAR_HEIGHT))
+        self._bars[key] = surface
+        if len(self._bars) > self.max_sprites:
+            self._bars.popitem(last=False)
+        return surface
+
+    def get_dot(self, color, radius: int):
+        """Obtener sprite de punto (nivel de detalle bajo) y offset al centro"""
+        key = ('dot', color, radius)
+        entry = self._sprites.get(key)
+        if entry is not None:
+            self._sprites.move_to_end(key)
+            return entry
+
+        surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        if radius <= 0:
+            surface.set_at((0, 0), color)
+        else:
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+        entry = (surface, radius)
+        self._sprites[key] = entry
+        if len(self._sprites) > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return entry
+
+    def _build_creature_sprite(self, phase: str, size: int, color, rotation: float,
+                               vocal: bool):
+        """Dibujar el sprite de una criatura centrado en su superficie"""
+        # Margen para el contorno y el indicador vocal (radio 3)
+        half = size + 4
+        surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        center = (half, half)
+
+        if phase == 'primitive':
+            # Círculo simple
+            pygame.draw.circle(surface, color, center, size)
+            pygame.draw.circle(surface, OUTLINE_COLOR, center, size, 1)
+        elif phase == 'intermediate':
+            # Hexágono
+            self._draw_shape(surface, center, self._polygon_points(size, 6, rotation), color)
+        elif phase == 'advanced':
+            # Octógono
+            self._draw_shape(surface, center, self._polygon_points(size, 8, rotation), color)
+        else:
+            # Estrella de 8 puntas
+            self._draw_shape(surface, center, self._star_points(size, rotation), color)
+
+        # Dirección (línea)
+        end = (half + math.cos(rotation) * size * 0.7,
+               half + math.sin(rotation) * size * 0.7)
+        pygame.draw.line(surface, OUTLINE_COLOR, center, (int(end[0]), int(end[1])), 2)
+
+        # Indicador vocal
+        if vocal:
+            pygame.draw.circle(surface, VOCAL_COLOR, (half + size - 5, half - size + 5), 3)
+
+        return surface, half
+
+    @staticmethod
+    def _polygon_points(size: int, sides: int, rotation: float):
+        """Vértices de un polígono regular centrado en el origen"""
+        angle_step = 2 * math.pi / sides
+        return [(math.cos(rotation + i * angle_step) * size,
+                 math.sin(rotation + i * angle_step) * size) for i in range(sides)]
+
+    @staticmethod
+    def _star_points(size: int, rotation: float):
+        """Vértices de una estrella de 8 puntas centrada en el origen"""
+        points = []
+        for i in range(16):
+            angle = rotation + i * math.pi / 8
+            radius = size if i % 2 == 0 else size * 0.5
+            points.append((math.cos(angle) * radius, math.sin(angle) * radius))
+        return points
+
+    @staticmethod
+    def _draw_shape(surface, center, points, color):
+        """Rellenar y contornear una forma trasladada al centro del sprite"""
+        cx, cy = center
+        points = [(int(cx + px), int(cy + py)) for px, py in points]
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, OUTLINE_COLOR, points, 1)
+
+    def clear(self):
+        """Vaciar la caché"""
+        self._sprites.clear()
+        self._bars.clear()
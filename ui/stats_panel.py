@@ -3,8 +3,41 @@ Panel de estadísticas
 """
 
 import pygame
-import math
+import numpy as np
 import config
+from engine.world_snapshot import SnapshotBuilder
+from .text_cache import get_text_cache
+
+
+# Métricas del historial mostradas como sparklines (métrica, etiqueta, color)
+HISTORY_SPARKLINES = (
+    ('population', "Población", (150, 255, 150)),
+    ('species', "Especies", (100, 200, 255)),
+    ('max_complexity', "Complejidad Max", (255, 200, 100)),
+    ('food', "Datos", (200, 150, 255)),
+)
+SPARKLINE_HEIGHT = 24
+
+
+def sparkline_points(values: np.ndarray, width: int, height: int) -> tuple:
+    """Puntos de una sparkline de ``width`` x ``height`` px (origen arriba)"""
+    if len(values) > width:
+        # Una muestra por columna de píxeles
+        values = values[np.linspace(0, len(values) - 1, width).astype(np.intp)]
+    low, high = float(values.min()), float(values.max())
+    span = high - low or 1.0
+    xs = np.linspace(0, width - 1, len(values)).astype(np.intp)
+    ys = ((high - values) / span * (height - 1)).astype(np.intp)
+    return tuple(zip(xs.tolist(), ys.tolist()))
+
+
+class PanelSection:
+    """Sección del panel en modo retenido (superficie y firma de su contenido)"""
+    
+    def __init__(self):
+        self.signature = None  # Operaciones de dibujo con las que se renderizó
+        self.surface = None
+        self.height = 0
 
 
 class StatsPanel:
@@ -25,6 +58,7 @@ class StatsPanel:
         self.font_normal = pygame.font.Font(None, 22)
         self.font_small = pygame.font.Font(None, 18)
         self.font_tiny = pygame.font.Font(None, 14)
+        self.text_cache = get_text_cache()
         
         # Colores
         self.bg_color = config.UI_BACKGROUND_COLOR
@@ -35,6 +69,21 @@ class StatsPanel:
         self.max_scroll = 0
         self.creature_section_start = 0
         self.creature_content_height = 0
+        self._sections = {}  # nombre -> PanelSection
+        
+        # Instantánea del mundo (asignada cada frame) y simulación a la que
+        # se envían los comandos; sin ellas el panel lee el mundo directamente
+        self.snapshot = None
+        self.simulation = None
+        self._snapshot_builder = None
+        
+        # Datos del panel (se renuevan a STATS_REFRESH_HZ con la instantánea)
+        self.stats = None
+        self.selected = None  # CreatureDetail de la criatura seleccionada
+        self.history = {}
+        self.history_span = 0
+        self._layouts = None
+        self._history_layout = None
         
         # Input de texto para renombrar
         self.renaming = False
@@ -42,21 +91,53 @@ class StatsPanel:
     
     def render(self):
         """Renderizar panel con scroll completo cuando hay criatura seleccionada"""
+        self.refresh_stats()
+        
         # Fondo
         pygame.draw.rect(self.screen, self.bg_color,
                         (self.x, self.y, self.width, self.height))
         
         # Si hay criatura seleccionada, renderizar todo con scroll
-        if self.world.selected_creature:
+        if self.selected is not None:
             self.render_with_scroll()
         else:
             # Sin criatura seleccionada, renderizar normal sin scroll
             self.render_without_scroll()
     
+    def current_snapshot(self):
+        """Instantánea asignada o, si no hay, una nueva del mundo"""
+        if self.snapshot is not None:
+            return self.snapshot
+        if self._snapshot_builder is None:
+            self._snapshot_builder = SnapshotBuilder(self.world)
+        return self._snapshot_builder.build()
+    
+    def refresh_stats(self):
+        """Adoptar los datos de la instantánea si el publicador los renovó
+        
+        El publicador ya limita el refresco a STATS_REFRESH_HZ (o lo adelanta
+        al cambiar la selección), así que basta comparar por identidad.
+        """
+        snapshot = self.current_snapshot()
+        if snapshot.stats is not self.stats or snapshot.selected is not self.selected:
+            self.stats = snapshot.stats
+            self.selected = snapshot.selected
+            self.history = snapshot.history
+            self.history_span = snapshot.history_span
+            self._layouts = None
+            self._history_layout = None
+    
+    def request_refresh(self):
+        """Forzar redibujado en el próximo frame (p. ej. al escribir un nombre)"""
+        self._layouts = None
+        self._history_layout = None
+        if self._snapshot_builder is not None:
+            self._snapshot_builder.invalidate()
+    
     def render_without_scroll(self):
         """Renderizar panel sin scroll (sin criatura seleccionada)"""
         y_offset = 20
-        title = self.font_title.render("DigiLife Stats", True, (100, 200, 255))
+        title = self.text_cache.render(self.font_title, "DigiLife Stats", True, (100, 200, 255))
         self.screen.blit(title, (self.x + 10, y_offset))
         y_offset += 40
         
@@ -65,29 +146,29 @@ class StatsPanel:
         y_offset += 20
         
         # Estadísticas globales
-        days = self.world.cycle // config.CYCLES_PER_DAY
+        snapshot = self.stats
         
         stats = [
-            ("Ciclo", f"{self.world.cycle}"),
-            ("Días", f"{days}"),
-            ("Población", f"{self.world.population}"),
-            ("Nacimientos", f"{self.world.total_births}"),
-            ("Muertes", f"{self.world.total_deaths}"),
-            ("Especies", f"{self.world.species_count}"),
+            ("Ciclo", f"{snapshot.cycle}"),
+            ("Días", f"{snapshot.days}"),
+            ("Población", f"{snapshot.population}"),
+            ("Nacimientos", f"{snapshot.total_births}"),
+            ("Muertes", f"{snapshot.total_deaths}"),
+            ("Especies", f"{snapshot.species_count}"),
             ("", ""),
-            ("Complejidad Max", f"{self.world.max_complexity:.0f}"),
-            ("Con Voz", f"{self.world.vocal_creatures}"),
-            ("Datos", f"{len(self.world.data_items)}"),
+            ("Complejidad Max", f"{snapshot.max_complexity:.0f}"),
+            ("Con Voz", f"{snapshot.vocal_creatures}"),
+            ("Datos", f"{snapshot.data_count}"),
             ("", ""),
-            ("Velocidad", f"{self.world.speed_multiplier:.1f}x"),
+            ("Velocidad", f"{snapshot.speed_multiplier:.1f}x"),
         ]
         
         for label, value in stats:
             if label:
-                text = self.font_normal.render(f"{label}:", True, self.text_color)
+                text = self.text_cache.render(self.font_normal, f"{label}:", True, self.text_color)
                 self.screen.blit(text, (self.x + 15, y_offset))
                 
-                value_text = self.font_normal.render(str(value), True, (150, 255, 150))
+                value_text = self.text_cache.render(self.font_normal, str(value), True, (150, 255, 150))
                 self.screen.blit(value_text, (self.x + 180, y_offset))
             
             y_offset += 25
@@ -98,13 +179,12 @@ class StatsPanel:
                         (self.x + 10, y_offset), (self.x + self.width - 10, y_offset), 2)
         y_offset += 15
         
-        situation_title = self.font_title.render("Situación Global", True, (255, 200, 100))
+        situation_title = self.text_cache.render(self.font_title, "Situación Global", True, (255, 200, 100))
         self.screen.blit(situation_title, (self.x + 10, y_offset))
         y_offset += 35
         
-        ecosystem_stats = self.calculate_ecosystem_stats()
-        
-        env_status = ecosystem_stats['environment_status']
+        snapshot = self.stats
+        env_status = snapshot.environment_status
         env_color = {
             'Crítico': (255, 50, 50),
             'Difícil': (255, 150, 50),
@@ -112,77 +192,77 @@ class StatsPanel:
             'Próspero': (100, 255, 255)
         }.get(env_status, (200, 200, 200))
         
-        env_text = self.font_normal.render(f"Entorno: {env_status}", True, env_color)
+        env_text = self.text_cache.render(self.font_normal, f"Entorno: {env_status}", True, env_color)
         self.screen.blit(env_text, (self.x + 15, y_offset))
         y_offset += 30
         
-        if ecosystem_stats['most_consumed_data']:
-            data_type = ecosystem_stats['most_consumed_data']
+        if snapshot.most_consumed_data:
+            data_type = snapshot.most_consumed_data
             data_color = config.DATA_COLORS.get(data_type, (200, 200, 200))
-            data_text = self.font_small.render(f"Preferencia: {data_type.title()}", True, data_color)
+            data_text = self.text_cache.render(self.font_small, f"Preferencia: {data_type.title()}", True, data_color)
             self.screen.blit(data_text, (self.x + 15, y_offset))
             y_offset += 25
         
-        if ecosystem_stats['fittest_creature']:
-            creature = ecosystem_stats['fittest_creature']
-            name = getattr(creature, 'custom_name', f"#{creature.id}")
-            fitness_text = self.font_small.render(f"Más hábil: {name}", True, (100, 255, 100))
+        if snapshot.fittest:
+            creature = snapshot.fittest
+            name = creature.name
+            fitness_text = self.text_cache.render(self.font_small, f"Más hábil: {name}", True, (100, 255, 100))
             self.screen.blit(fitness_text, (self.x + 15, y_offset))
             
-            fitness_value = self.font_tiny.render(f"(Fitness: {creature.fitness:.0f})", True, (150, 150, 150))
+            fitness_value = self.text_cache.render(self.font_tiny, f"(Fitness: {creature.fitness:.0f})", True, (150, 150, 150))
             self.screen.blit(fitness_value, (self.x + 20, y_offset + 18))
             y_offset += 40
         
-        if ecosystem_stats['weakest_creature']:
-            creature = ecosystem_stats['weakest_creature']
-            name = getattr(creature, 'custom_name', f"#{creature.id}")
-            weak_text = self.font_small.render(f"Más débil: {name}", True, (255, 100, 100))
+        if snapshot.weakest:
+            creature = snapshot.weakest
+            name = creature.name
+            weak_text = self.text_cache.render(self.font_small, f"Más débil: {name}", True, (255, 100, 100))
             self.screen.blit(weak_text, (self.x + 15, y_offset))
             
-            fitness_value = self.font_tiny.render(f"(Fitness: {creature.fitness:.0f})", True, (150, 150, 150))
+            fitness_value = self.text_cache.render(self.font_tiny, f"(Fitness: {creature.fitness:.0f})", True, (150, 150, 150))
             self.screen.blit(fitness_value, (self.x + 20, y_offset + 18))
             y_offset += 40
         
-        if ecosystem_stats['most_potential']:
-            creature = ecosystem_stats['most_potential']
-            name = getattr(creature, 'custom_name', f"#{creature.id}")
-            potential_text = self.font_small.render(f"Más potencial: {name}", True, (255, 200, 100))
+        if snapshot.most_potential:
+            creature = snapshot.most_potential
+            name = creature.name
+            potential_text = self.text_cache.render(self.font_small, f"Más potencial: {name}", True, (255, 200, 100))
             self.screen.blit(potential_text, (self.x + 15, y_offset))
             
-            potential_value = self.font_tiny.render(f"(Gen: {creature.generation}, Comp: {creature.complexity:.0f})", True, (150, 150, 150))
+            potential_value = self.text_cache.render(self.font_tiny, f"(Gen: {creature.generation}, Comp: {creature.complexity:.0f})", True, (150, 150, 150))
             self.screen.blit(potential_value, (self.x + 20, y_offset + 18))
             y_offset += 40
         
         y_offset += 5
         avg_stats = [
-            ("Fitness Prom", f"{ecosystem_stats['avg_fitness']:.1f}"),
-            ("Edad Prom", f"{ecosystem_stats['avg_age']:.1f}"),
-            ("Energía Prom", f"{ecosystem_stats['avg_energy']:.1f}"),
+            ("Fitness Prom", f"{snapshot.avg_fitness:.1f}"),
+            ("Edad Prom", f"{snapshot.avg_age:.1f}"),
+            ("Energía Prom", f"{snapshot.avg_energy:.1f}"),
         ]
         
         for label, value in avg_stats:
-            text = self.font_small.render(f"{label}:", True, self.text_color)
+            text = self.text_cache.render(self.font_small, f"{label}:", True, self.text_color)
             self.screen.blit(text, (self.x + 15, y_offset))
             
-            value_text = self.font_small.render(str(value), True, (200, 200, 200))
+            value_text = self.text_cache.render(self.font_small, str(value), True, (200, 200, 200))
             self.screen.blit(value_text, (self.x + 180, y_offset))
             y_offset += 22
         
         # Epidemias activas (versión sin scroll)
-        if hasattr(self.world, 'disease_system'):
-            epidemics = self.world.disease_system.get_active_epidemics()
-            if epidemics and y_offset < self.height - 100:  # Solo si hay espacio
+        if snapshot.epidemics:
+            epidemics = snapshot.epidemics
+            if y_offset < self.height - 100:  # Solo si hay espacio
                 y_offset += 15
                 pygame.draw.line(self.screen, (255, 50, 50),
                                 (self.x + 10, y_offset), (self.x + self.width - 10, y_offset), 2)
                 y_offset += 15
                 
-                epidemic_title = self.font_small.render("EPIDEMIAS", True, (255, 100, 100))
+                epidemic_title = self.text_cache.render(self.font_small, "EPIDEMIAS", True, (255, 100, 100))
                 self.screen.blit(epidemic_title, (self.x + 10, y_offset))
                 y_offset += 25
                 
                 for epidemic in epidemics[:1]:  # Máximo 1 para no saturar
-                    disease_text = self.font_tiny.render(
+                    disease_text = self.text_cache.render(self.font_tiny, 
                         f"* {epidemic['name']}", 
                         True, (255, 150, 150)
                     )
@@ -191,7 +271,7 @@ class StatsPanel:
                     
                     # Paciente cero e infectados
                     if epidemic.get('patient_zero_id'):
-                        info_text = self.font_tiny.render(
+                        info_text = self.text_cache.render(self.font_tiny, 
                             f"  P0: #{epidemic['patient_zero_id']} | {epidemic['infected']} inf | {epidemic['deaths']} †", 
                             True, (200, 150, 150)
                         )
@@ -200,93 +280,176 @@ class StatsPanel:
         
         # Depredación (versión sin scroll)
         if config.PREDATION_ENABLED and y_offset < self.height - 120:
-            if self.world.active_predators > 0 or self.world.predation_kills > 0:
+            if snapshot.active_predators > 0 or snapshot.predation_kills > 0:
                 y_offset += 10
-                predation_title = self.font_small.render("DEPREDACION", True, (255, 150, 50))
+                predation_title = self.text_cache.render(self.font_small, "DEPREDACION", True, (255, 150, 50))
                 self.screen.blit(predation_title, (self.x + 10, y_offset))
                 y_offset += 22
                 
-                predation_text = self.font_tiny.render(
-                    f"{self.world.active_predators} activos | {self.world.predation_kills} muertes", 
+                predation_text = self.text_cache.render(self.font_tiny, 
+                    f"{snapshot.active_predators} activos | {snapshot.predation_kills} muertes", 
                     True, (255, 180, 100)
                 )
                 self.screen.blit(predation_text, (self.x + 15, y_offset))
                 y_offset += 20
                 
                 # Top 3 depredadores (versión compacta)
-                top_predators = self.world.get_top_predators(3)
+                top_predators = snapshot.top_predators[:3]
                 if top_predators and y_offset < self.height - 60:
-                    for i, (creature_id, kills, complexity) in enumerate(top_predators, 1):
-                        creature_name = f"#{creature_id}"
-                        for c in self.world.creatures:
-                            if c.id == creature_id and hasattr(c, 'custom_name') and c.custom_name:
-                                creature_name = c.custom_name
-                                break
-                        
-                        predator_text = self.font_tiny.render(
+                    for i, (creature_name, kills, complexity) in enumerate(top_predators, 1):
+                        predator_text = self.text_cache.render(self.font_tiny, 
                             f"{i}. {creature_name}: {kills} kills", 
                             True, (255, 180, 100)
                         )
                         self.screen.blit(predator_text, (self.x + 15, y_offset))
                         y_offset += 16
+        
+        # Gráficos de evolución (recortados al espacio restante del panel)
+        if self._history_layout is None:
+            self._history_layout = self._layout_history()
+        ops, height = self._history_layout
+        if ops and y_offset + 60 + SPARKLINE_HEIGHT <= self.height:
+            previous_clip = self.screen.get_clip()
+            self.screen.set_clip(pygame.Rect(self.x, y_offset, self.width, self.height - y_offset))
+            self._draw_ops(self.screen, ops, self.width - 20, (self.x + 10, y_offset))
+            self.screen.set_clip(previous_clip)
     
     def render_with_scroll(self):
-        """Renderizar todo el panel con scroll (cuando hay criatura seleccionada)"""
-        # Crear superficie temporal grande para todo el contenido
-        temp_surface = pygame.Surface((self.width - 20, 3000), pygame.SRCALPHA)
+        """Renderizar todo el panel con scroll (cuando hay criatura seleccionada)
+        
+        Modo retenido: el contenido se divide en secciones con superficie
+        propia. Una sección solo se vuelve a dibujar si cambian sus
+        operaciones de dibujo, y solo se componen las secciones visibles.
+        """
+        # Las operaciones de dibujo solo se recalculan al refrescar la instantánea
+        if self._layouts is None:
+            self._layouts = [
+                ('summary',) + self._layout_summary(),
+                ('situation',) + self._layout_situation(),
+                ('epidemics',) + self._layout_epidemics(),
+                ('predation',) + self._layout_predation(),
+                ('history',) + self._layout_history(),
+                ('creature',) + self._layout_creature(),
+            ]
+        
+        # Posición de cada sección dentro del contenido
+        placed = []
+        y_offset = 0
+        for name, ops, height in self._layouts:
+            placed.append((y_offset, self._update_section(name, ops, height)))
+            y_offset += height
+        
+        # Guardar altura total del contenido
+        self.creature_content_height = y_offset
+        
+        # Calcular scroll máximo
+        self.max_scroll = max(0, self.creature_content_height - self.height + 40)
+        
+        # Limitar scroll offset
+        self.scroll_offset = max(0, min(self.max_scroll, self.scroll_offset))
+        
+        # Componer solo las secciones dentro de la ventana visible
+        previous_clip = self.screen.get_clip()
+        self.screen.set_clip(pygame.Rect(self.x + 10, 0, self.width - 20, self.height))
+        for section_y, section in placed:
+            top = section_y - self.scroll_offset
+            if section.height == 0 or top >= self.height or top + section.height <= 0:
+                continue
+            self.screen.blit(section.surface, (self.x + 10, top),
+                             (0, 0, self.width - 20, section.height))
+        self.screen.set_clip(previous_clip)
         
+        # Renderizar scrollbar si es necesario
+        if self.max_scroll > 0:
+            self.render_scrollbar(0, self.height)
+    
+    def _update_section(self, name: str, ops: list, height: int) -> 'PanelSection':
+        """Redibujar la superficie de una sección solo si cambió su contenido"""
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = PanelSection()
+        section.height = height
+        if ops == section.signature:
+            return section
+        
+        # Reutilizar la superficie si cabe (solo se reserva al crecer)
+        width = self.width - 20
+        surface = section.surface
+        if surface is None or surface.get_width() != width or surface.get_height() < height:
+            surface = pygame.Surface((width, max(1, height)), pygame.SRCALPHA)
+            section.surface = surface
+        else:
+            surface.fill((0, 0, 0, 0))
+        
+        self._draw_ops(surface, ops, width)
+        section.signature = ops
+        return section
+    
+    def _draw_ops(self, surface, ops: list, width: int, origin=(0, 0)):
+        """Ejecutar operaciones de dibujo de una sección"""
+        ox, oy = origin
+        for op in ops:
+            if op[0] == 'text':
+                _, font, text, color, x, y = op
+                surface.blit(self.text_cache.render(font, text, True, color), (ox + x, oy + y))
+            elif op[0] == 'spark':
+                _, points, color, x, y = op
+                pygame.draw.lines(surface, color, False,
+                                  [(ox + x + px, oy + y + py) for px, py in points])
+            else:
+                _, color, y, line_width = op
+                pygame.draw.line(surface, color, (ox, oy + y), (ox + width, oy + y), line_width)
+    
+    def _layout_summary(self):
+        """Sección: título y estadísticas globales"""
+        ops = []
         y_offset = 0
         
         # Título
-        title = self.font_title.render("DigiLife Stats", True, (100, 200, 255))
-        temp_surface.blit(title, (0, y_offset))
+        ops.append(('text', self.font_title, "DigiLife Stats", (100, 200, 255), 0, y_offset))
         y_offset += 40
         
-        pygame.draw.line(temp_surface, (100, 100, 100),
-                        (0, y_offset), (self.width - 20, y_offset), 1)
+        ops.append(('line', (100, 100, 100), y_offset, 1))
         y_offset += 20
         
         # Estadísticas globales
-        days = self.world.cycle // config.CYCLES_PER_DAY
+        snapshot = self.stats
         
         stats = [
-            ("Ciclo", f"{self.world.cycle}"),
-            ("Días", f"{days}"),
-            ("Población", f"{self.world.population}"),
-            ("Nacimientos", f"{self.world.total_births}"),
-            ("Muertes", f"{self.world.total_deaths}"),
-            ("Especies", f"{self.world.species_count}"),
+            ("Ciclo", f"{snapshot.cycle}"),
+            ("Días", f"{snapshot.days}"),
+            ("Población", f"{snapshot.population}"),
+            ("Nacimientos", f"{snapshot.total_births}"),
+            ("Muertes", f"{snapshot.total_deaths}"),
+            ("Especies", f"{snapshot.species_count}"),
             ("", ""),
-            ("Complejidad Max", f"{self.world.max_complexity:.0f}"),
-            ("Con Voz", f"{self.world.vocal_creatures}"),
-            ("Datos", f"{len(self.world.data_items)}"),
+            ("Complejidad Max", f"{snapshot.max_complexity:.0f}"),
+            ("Con Voz", f"{snapshot.vocal_creatures}"),
+            ("Datos", f"{snapshot.data_count}"),
             ("", ""),
-            ("Velocidad", f"{self.world.speed_multiplier:.1f}x"),
+            ("Velocidad", f"{snapshot.speed_multiplier:.1f}x"),
         ]
         
         for label, value in stats:
             if label:
-                text = self.font_normal.render(f"{label}:", True, self.text_color)
-                temp_surface.blit(text, (5, y_offset))
-                
-                value_text = self.font_normal.render(str(value), True, (150, 255, 150))
-                temp_surface.blit(value_text, (170, y_offset))
-            
+                ops.append(('text', self.font_normal, f"{label}:", self.text_color, 5, y_offset))
+                ops.append(('text', self.font_normal, str(value), (150, 255, 150), 170, y_offset))
             y_offset += 25
         
-        # Situación Global
-        y_offset += 10
-        pygame.draw.line(temp_surface, (100, 100, 100),
-                        (0, y_offset), (self.width - 20, y_offset), 2)
+        return ops, y_offset
+    
+    def _layout_situation(self):
+        """Sección: situación global del ecosistema"""
+        ops = []
+        y_offset = 10
+        ops.append(('line', (100, 100, 100), y_offset, 2))
         y_offset += 15
         
-        situation_title = self.font_title.render("Situación Global", True, (255, 200, 100))
-        temp_surface.blit(situation_title, (0, y_offset))
+        ops.append(('text', self.font_title, "Situación Global", (255, 200, 100), 0, y_offset))
         y_offset += 35
         
-        ecosystem_stats = self.calculate_ecosystem_stats()
-        
-        env_status = ecosystem_stats['environment_status']
+        snapshot = self.stats
+        env_status = snapshot.environment_status
         env_color = {
             'Crítico': (255, 50, 50),
             'Difícil': (255, 150, 50),
@@ -294,247 +457,201 @@ class StatsPanel:
             'Próspero': (100, 255, 255)
         }.get(env_status, (200, 200, 200))
         
-        env_text = self.font_normal.render(f"Entorno: {env_status}", True, env_color)
-        temp_surface.blit(env_text, (5, y_offset))
+        ops.append(('text', self.font_normal, f"Entorno: {env_status}", env_color, 5, y_offset))
         y_offset += 30
         
-        if ecosystem_stats['most_consumed_data']:
-            data_type = ecosystem_stats['most_consumed_data']
+        if snapshot.most_consumed_data:
+            data_type = snapshot.most_consumed_data
             data_color = config.DATA_COLORS.get(data_type, (200, 200, 200))
-            data_text = self.font_small.render(f"Preferencia: {data_type.title()}", True, data_color)
-            temp_surface.blit(data_text, (5, y_offset))
+            ops.append(('text', self.font_small, f"Preferencia: {data_type.title()}", data_color, 5, y_offset))
             y_offset += 25
         
-        if ecosystem_stats['fittest_creature']:
-            creature = ecosystem_stats['fittest_creature']
-            name = getattr(creature, 'custom_name', f"#{creature.id}")
-            fitness_text = self.font_small.render(f"Más hábil: {name}", True, (100, 255, 100))
-            temp_surface.blit(fitness_text, (5, y_offset))
-            
-            fitness_value = self.font_tiny.render(f"(Fitness: {creature.fitness:.0f})", True, (150, 150, 150))
-            temp_surface.blit(fitness_value, (10, y_offset + 18))
+        if snapshot.fittest:
+            creature = snapshot.fittest
+            name = creature.name
+            ops.append(('text', self.font_small, f"Más hábil: {name}", (100, 255, 100), 5, y_offset))
+            ops.append(('text', self.font_tiny, f"(Fitness: {creature.fitness:.0f})", (150, 150, 150), 10, y_offset + 18))
             y_offset += 40
         
-        if ecosystem_stats['weakest_creature']:
-            creature = ecosystem_stats['weakest_creature']
-            name = getattr(creature, 'custom_name', f"#{creature.id}")
-            weak_text = self.font_small.render(f"Más débil: {name}", True, (255, 100, 100))
-            temp_surface.blit(weak_text, (5, y_offset))
-            
-            fitness_value = self.font_tiny.render(f"(Fitness: {creature.fitness:.0f})", True, (150, 150, 150))
-            temp_surface.blit(fitness_value, (10, y_offset + 18))
+        if snapshot.weakest:
+            creature = snapshot.weakest
+            name = creature.name
+            ops.append(('text', self.font_small, f"Más débil: {name}", (255, 100, 100), 5, y_offset))
+            ops.append(('text', self.font_tiny, f"(Fitness: {creature.fitness:.0f})", (150, 150, 150), 10, y_offset + 18))
             y_offset += 40
         
-        if ecosystem_stats['most_potential']:
-            creature = ecosystem_stats['most_potential']
-            name = getattr(creature, 'custom_name', f"#{creature.id}")
-            potential_text = self.font_small.render(f"Más potencial: {name}", True, (255, 200, 100))
-            temp_surface.blit(potential_text, (5, y_offset))
-            
-            potential_value = self.font_tiny.render(f"(Gen: {creature.generation}, Comp: {creature.complexity:.0f})", True, (150, 150, 150))
-            temp_surface.blit(potential_value, (10, y_offset + 18))
+        if snapshot.most_potential:
+            creature = snapshot.most_potential
+            name = creature.name
+            ops.append(('text', self.font_small, f"Más potencial: {name}", (255, 200, 100), 5, y_offset))
+            ops.append(('text', self.font_tiny, f"(Gen: {creature.generation}, Comp: {creature.complexity:.0f})",
+                        (150, 150, 150), 10, y_offset + 18))
             y_offset += 40
         
         y_offset += 5
         avg_stats = [
-            ("Fitness Prom", f"{ecosystem_stats['avg_fitness']:.1f}"),
-            ("Edad Prom", f"{ecosystem_stats['avg_age']:.1f}"),
-            ("Energía Prom", f"{ecosystem_stats['avg_energy']:.1f}"),
+            ("Fitness Prom", f"{snapshot.avg_fitness:.1f}"),
+            ("Edad Prom", f"{snapshot.avg_age:.1f}"),
+            ("Energía Prom", f"{snapshot.avg_energy:.1f}"),
         ]
         
         for label, value in avg_stats:
-            text = self.font_small.render(f"{label}:", True, self.text_color)
-            temp_surface.blit(text, (5, y_offset))
-            
-            value_text = self.font_small.render(str(value), True, (200, 200, 200))
-            temp_surface.blit(value_text, (170, y_offset))
+            ops.append(('text', self.font_small, f"{label}:", self.text_color, 5, y_offset))
+            ops.append(('text', self.font_small, str(value), (200, 200, 200), 170, y_offset))
             y_offset += 22
         
-        # Epidemias activas
-        if hasattr(self.world, 'disease_system'):
-            epidemics = self.world.disease_system.get_active_epidemics()
-            if epidemics:
-                y_offset += 15
-                pygame.draw.line(temp_surface, (255, 50, 50),
-                                (0, y_offset), (self.width - 20, y_offset), 2)
-                y_offset += 15
-                
-                epidemic_title = self.font_title.render("EPIDEMIAS", True, (255, 100, 100))
-                temp_surface.blit(epidemic_title, (0, y_offset))
-                y_offset += 30
-                
-                for epidemic in epidemics:
-                    # Nombre de la enfermedad
-                    disease_text = self.font_small.render(
-                        f"* {epidemic['name']}", 
-                        True, (255, 150, 150)
-                    )
-                    temp_surface.blit(disease_text, (5, y_offset))
-                    y_offset += 22
-                    
-                    # Paciente cero
-                    if epidemic.get('patient_zero_id'):
-                        patient_text = self.font_tiny.render(
-                            f"  Paciente cero: #{epidemic['patient_zero_id']}", 
-                            True, (255, 200, 100)
-                        )
-                        temp_surface.blit(patient_text, (5, y_offset))
-                        y_offset += 18
-                    
-                    # Estadísticas
-                    stats_text = self.font_tiny.render(
-                        f"  Infectados: {epidemic['infected']} | Muertes: {epidemic['deaths']}", 
-                        True, (200, 150, 150)
-                    )
-                    temp_surface.blit(stats_text, (5, y_offset))
-                    y_offset += 18
-                    
-                    # Contagio y letalidad
-                    danger_text = self.font_tiny.render(
-                        f"  Contagio: {epidemic['contagion_rate']*100:.1f}% | Letalidad: {epidemic['lethality']*100:.1f}%", 
-                        True, (255, 100, 100)
-                    )
-                    temp_surface.blit(danger_text, (5, y_offset))
-                    y_offset += 18
-                    
-                    # Síntomas
-                    symptoms_text = self.font_tiny.render(
-                        f"  {epidemic['symptoms']}", 
-                        True, (180, 180, 180)
-                    )
-                    temp_surface.blit(symptoms_text, (5, y_offset))
-                    y_offset += 25
+        return ops, y_offset
+    
+    def _layout_epidemics(self):
+        """Sección: epidemias activas (vacía si no hay)"""
+        ops = []
+        epidemics = self.stats.epidemics
+        if not epidemics:
+            return ops, 0
+        
+        y_offset = 15
+        ops.append(('line', (255, 50, 50), y_offset, 2))
+        y_offset += 15
         
-        # Depredación
-        if config.PREDATION_ENABLED and (self.world.active_predators > 0 or self.world.predation_kills > 0):
-            y_offset += 15
-            pygame.draw.line(temp_surface, (255, 150, 50),
-                            (0, y_offset), (self.width - 20, y_offset), 2)
-            y_offset += 15
-            
-            predation_title = self.font_title.render("DEPREDACION", True, (255, 150, 50))
-            temp_surface.blit(predation_title, (0, y_offset))
-            y_offset += 30
+        ops.append(('text', self.font_title, "EPIDEMIAS", (255, 100, 100), 0, y_offset))
+        y_offset += 30
+        
+        for epidemic in epidemics:
+            # Nombre de la enfermedad
+            ops.append(('text', self.font_small, f"* {epidemic['name']}", (255, 150, 150), 5, y_offset))
+            y_offset += 22
             
-            # Depredadores activos
-            predators_text = self.font_small.render(
-                f"Depredadores activos: {self.world.active_predators}", 
-                True, (255, 180, 100)
-            )
-            temp_surface.blit(predators_text, (5, y_offset))
-            y_offset += 25
+            # Paciente cero
+            if epidemic.get('patient_zero_id'):
+                ops.append(('text', self.font_tiny, f"  Paciente cero: #{epidemic['patient_zero_id']}",
+                            (255, 200, 100), 5, y_offset))
+                y_offset += 18
             
-            # Muertes por depredación
-            kills_text = self.font_small.render(
-                f"Muertes totales: {self.world.predation_kills}", 
-                True, (255, 150, 150)
-            )
-            temp_surface.blit(kills_text, (5, y_offset))
-            y_offset += 25
+            # Estadísticas
+            ops.append(('text', self.font_tiny,
+                        f"  Infectados: {epidemic['infected']} | Muertes: {epidemic['deaths']}",
+                        (200, 150, 150), 5, y_offset))
+            y_offset += 18
             
-            # Tasa de depredación
-            if self.world.total_deaths > 0:
-                predation_rate = (self.world.predation_kills / self.world.total_deaths) * 100
-                rate_text = self.font_tiny.render(
-                    f"Tasa: {predation_rate:.1f}% de todas las muertes", 
-                    True, (200, 200, 200)
-                )
-                temp_surface.blit(rate_text, (5, y_offset))
-                y_offset += 25
+            # Contagio y letalidad
+            ops.append(('text', self.font_tiny,
+                        f"  Contagio: {epidemic['contagion_rate']*100:.1f}% | Letalidad: {epidemic['lethality']*100:.1f}%",
+                        (255, 100, 100), 5, y_offset))
+            y_offset += 18
             
-            # Top 5 depredadores
-            top_predators = self.world.get_top_predators(5)
-            if top_predators:
-                y_offset += 5
-                top_title = self.font_small.render("Top 5 Depredadores:", True, (255, 200, 100))
-                temp_surface.blit(top_title, (5, y_offset))
-                y_offset += 22
-                
-                for i, (creature_id, kills, complexity) in enumerate(top_predators, 1):
-                    # Buscar si la criatura tiene nombre personalizado
-                    creature_name = f"#{creature_id}"
-                    for c in self.world.creatures:
-                        if c.id == creature_id and hasattr(c, 'custom_name') and c.custom_name:
-                            creature_name = c.custom_name
-                            break
-                    
-                    predator_text = self.font_tiny.render(
-                        f"  {i}. {creature_name} - {kills} kills (comp: {complexity:.0f})", 
-                        True, (255, 180, 100)
-                    )
-                    temp_surface.blit(predator_text, (5, y_offset))
-                    y_offset += 18
-        
-        # Criatura seleccionada
-        y_offset += 20
-        pygame.draw.line(temp_surface, (100, 100, 100),
-                        (0, y_offset), (self.width - 20, y_offset), 1)
-        y_offset += 20
-        
-        # Renderizar info de criatura en la misma superficie
-        y_offset = self.render_creature_info(temp_surface, y_offset)
-        
-        # Guardar altura total del contenido
-        self.creature_content_height = y_offset
+            # Síntomas
+            ops.append(('text', self.font_tiny, f"  {epidemic['symptoms']}", (180, 180, 180), 5, y_offset))
+            y_offset += 25
         
-        # Calcular scroll máximo
-        self.max_scroll = max(0, self.creature_content_height - self.height + 40)
+        return ops, y_offset
+    
+    def _layout_predation(self):
+        """Sección: depredación (vacía si no hay actividad)"""
+        ops = []
+        snapshot = self.stats
+        if not (config.PREDATION_ENABLED and
+                (snapshot.active_predators > 0 or snapshot.predation_kills > 0)):
+            return ops, 0
+        
+        y_offset = 15
+        ops.append(('line', (255, 150, 50), y_offset, 2))
+        y_offset += 15
         
-        # Limitar scroll offset
-        self.scroll_offset = max(0, min(self.max_scroll, self.scroll_offset))
+        ops.append(('text', self.font_title, "DEPREDACION", (255, 150, 50), 0, y_offset))
+        y_offset += 30
         
-        # Crear superficie visible con clip
-        visible_surface = pygame.Surface((self.width - 20, self.height))
-        visible_surface.fill(self.bg_color)
+        # Depredadores activos
+        ops.append(('text', self.font_small, f"Depredadores activos: {snapshot.active_predators}",
+                    (255, 180, 100), 5, y_offset))
+        y_offset += 25
+        
+        # Muertes por depredación
+        ops.append(('text', self.font_small, f"Muertes totales: {snapshot.predation_kills}",
+                    (255, 150, 150), 5, y_offset))
+        y_offset += 25
+        
+        # Tasa de depredación
+        if snapshot.total_deaths > 0:
+            predation_rate = (snapshot.predation_kills / snapshot.total_deaths) * 100
+            ops.append(('text', self.font_tiny, f"Tasa: {predation_rate:.1f}% de todas las muertes",
+                        (200, 200, 200), 5, y_offset))
+            y_offset += 25
         
-        # Copiar contenido con offset de scroll
-        visible_surface.blit(temp_surface, (0, -self.scroll_offset))
+        # Top 5 depredadores
+        top_predators = snapshot.top_predators
+        if top_predators:
+            y_offset += 5
+            ops.append(('text', self.font_small, "Top 5 Depredadores:", (255, 200, 100), 5, y_offset))
+            y_offset += 22
+            
+            for i, (creature_name, kills, complexity) in enumerate(top_predators, 1):
+                ops.append(('text', self.font_tiny,
+                            f"  {i}. {creature_name} - {kills} kills (comp: {complexity:.0f})",
+                            (255, 180, 100), 5, y_offset))
+                y_offset += 18
         
-        # Renderizar en pantalla
-        self.screen.blit(visible_surface, (self.x + 10, 0))
+        return ops, y_offset
+    
+    def _layout_history(self):
+        """Sección: gráficos de evolución (sparklines del historial)"""
+        ops = []
+        if not self.history:
+            return ops, 0
+        
+        y_offset = 15
+        ops.append(('line', (100, 100, 100), y_offset, 1))
+        y_offset += 15
         
-        # Renderizar scrollbar si es necesario
-        if self.max_scroll > 0:
-            self.render_scrollbar(0, self.height)
+        ops.append(('text', self.font_small, "Evolución", (100, 200, 255), 0, y_offset))
+        ops.append(('text', self.font_tiny, f"(últimos {self.history_span} ciclos)",
+                    (150, 150, 150), 90, y_offset + 3))
+        y_offset += 22
+        
+        spark_x = 130
+        spark_width = self.width - 20 - spark_x - 45
+        for name, label, color in HISTORY_SPARKLINES:
+            values = self.history[name]
+            ops.append(('text', self.font_tiny, label, self.text_color, 5, y_offset + 8))
+            ops.append(('spark', sparkline_points(values, spark_width, SPARKLINE_HEIGHT),
+                        color, spark_x, y_offset))
+            ops.append(('text', self.font_tiny, f"{values[-1]:.0f}", color,
+                        spark_x + spark_width + 5, y_offset + 8))
+            y_offset += SPARKLINE_HEIGHT + 6
+        
+        return ops, y_offset
     
-    def render_creature_info(self, surface, y_offset):
-        """Renderizar información de criatura en una superficie"""
-        creature = self.world.selected_creature
+    def _layout_creature(self):
+        """Sección: información de la criatura seleccionada"""
+        creature = self.selected
+        ops = []
+        y_offset = 20
+        ops.append(('line', (100, 100, 100), y_offset, 1))
+        y_offset += 20
         
         # Título
-        title = self.font_title.render("Criatura Seleccionada", True, (255, 200, 100))
-        surface.blit(title, (0, y_offset))
+        ops.append(('text', self.font_title, "Criatura Seleccionada", (255, 200, 100), 0, y_offset))
         y_offset += 35
         
         # Nombre personalizado o ID
-        if hasattr(creature, 'custom_name') and creature.custom_name:
-            name_text = f"Nombre: {creature.custom_name}"
+        if creature.name:
+            name_text = f"Nombre: {creature.name}"
             name_color = (255, 255, 100)
         else:
             name_text = f"ID: {creature.id}"
             name_color = (200, 255, 200)
         
         if self.renaming:
-            input_text = f"Nombre: {self.rename_text}_"
-            text = self.font_normal.render(input_text, True, (255, 255, 100))
+            ops.append(('text', self.font_normal, f"Nombre: {self.rename_text}_", (255, 255, 100), 0, y_offset))
         else:
-            text = self.font_normal.render(name_text, True, name_color)
-        
-        surface.blit(text, (0, y_offset))
+            ops.append(('text', self.font_normal, name_text, name_color, 0, y_offset))
         y_offset += 30
         
         # Botón de renombrar
         if not self.renaming:
-            rename_hint = self.font_tiny.render("(Presiona N para renombrar)", True, (150, 150, 150))
-            surface.blit(rename_hint, (0, y_offset))
-            y_offset += 25
+            ops.append(('text', self.font_tiny, "(Presiona N para renombrar)", (150, 150, 150), 0, y_offset))
         else:
-            rename_hint = self.font_tiny.render("(ENTER: confirmar, ESC: cancelar)", True, (255, 200, 100))
-            surface.blit(rename_hint, (0, y_offset))
-            y_offset += 25
-        
-        # Calcular velocidad
-        speed = math.sqrt(creature.vx**2 + creature.vy**2)
+            ops.append(('text', self.font_tiny, "(ENTER: confirmar, ESC: cancelar)", (255, 200, 100), 0, y_offset))
+        y_offset += 25
         
         # Info básica
         info = [
@@ -543,12 +660,12 @@ class StatsPanel:
             ("Energía", f"{creature.energy:.1f}/{creature.max_energy}"),
             ("Complejidad", f"{creature.complexity:.0f}"),
             ("Fitness", f"{creature.fitness:.1f}"),
-            ("Fase", creature.get_phase().title()),
-            ("Genoma", f"{len(creature.genome)} inst"),
+            ("Fase", creature.phase.title()),
+            ("Genoma", f"{creature.genome_length} inst"),
             ("", ""),
             ("Posición X", f"{creature.x:.1f}"),
             ("Posición Y", f"{creature.y:.1f}"),
-            ("Velocidad", f"{speed:.2f}"),
+            ("Velocidad", f"{creature.speed:.2f}"),
             ("", ""),
             ("Comida", f"{creature.food_eaten}"),
             ("Distancia", f"{creature.distance_traveled:.1f}"),
@@ -556,137 +673,56 @@ class StatsPanel:
         
         for label, value in info:
             if label:
-                text = self.font_small.render(f"{label}:", True, self.text_color)
-                surface.blit(text, (0, y_offset))
-                
-                value_text = self.font_small.render(str(value), True, (200, 200, 200))
-                surface.blit(value_text, (130, y_offset))
-            
+                ops.append(('text', self.font_small, f"{label}:", self.text_color, 0, y_offset))
+                ops.append(('text', self.font_small, str(value), (200, 200, 200), 130, y_offset))
             y_offset += 20
         
         # Vocabulario si tiene
-        if hasattr(creature, 'vocal_system') and creature.vocal_system.get_vocabulary_size() > 0:
+        if creature.vocabulary:
             y_offset += 10
-            vocab_title = self.font_small.render("Vocabulario:", True, (150, 200, 255))
-            surface.blit(vocab_title, (0, y_offset))
+            ops.append(('text', self.font_small, "Vocabulario:", (150, 200, 255), 0, y_offset))
             y_offset += 22
             
-            for word, count in list(creature.vocal_system.vocabulary.items())[:8]:
-                word_text = self.font_tiny.render(f"  '{word}' ({count}x)", True, (180, 180, 180))
-                surface.blit(word_text, (10, y_offset))
+            for word, count in creature.vocabulary:
+                ops.append(('text', self.font_tiny, f"  '{word}' ({count}x)", (180, 180, 180), 10, y_offset))
                 y_offset += 18
         
         # Inteligencia avanzada si tiene
-        if hasattr(creature, 'intelligence') and creature.intelligence:
+        if creature.intelligence:
             y_offset += 15
-            pygame.draw.line(surface, (100, 200, 255),
-                            (0, y_offset), (self.width - 20, y_offset), 2)
+            ops.append(('line', (100, 200, 255), y_offset, 2))
             y_offset += 15
             
-            intel_title = self.font_small.render("INTELIGENCIA AVANZADA", True, (100, 200, 255))
-            surface.blit(intel_title, (0, y_offset))
+            ops.append(('text', self.font_small, "INTELIGENCIA AVANZADA", (100, 200, 255), 0, y_offset))
             y_offset += 25
             
-            knowledge_summary = creature.intelligence.get_knowledge_summary()
+            knowledge_summary = creature.intelligence
             
             # Sabiduría
-            wisdom_text = self.font_small.render(
-                f"Sabiduría: {knowledge_summary['wisdom']}", 
-                True, (200, 200, 255)
-            )
-            surface.blit(wisdom_text, (5, y_offset))
+            ops.append(('text', self.font_small, f"Sabiduría: {knowledge_summary['wisdom']}",
+                        (200, 200, 255), 5, y_offset))
             y_offset += 22
             
             # Conocimientos aprendidos
-            knowledge_text = self.font_tiny.render(
-                f"Conocimientos: {knowledge_summary['knowledge_count']}", 
-                True, (180, 180, 200)
-            )
-            surface.blit(knowledge_text, (5, y_offset))
+            ops.append(('text', self.font_tiny, f"Conocimientos: {knowledge_summary['knowledge_count']}",
+                        (180, 180, 200), 5, y_offset))
             y_offset += 20
             
             # Insights descubiertos
             if knowledge_summary['recent_insights']:
                 y_offset += 5
-                insights_title = self.font_tiny.render("Descubrimientos recientes:", True, (150, 200, 255))
-                surface.blit(insights_title, (5, y_offset))
+                ops.append(('text', self.font_tiny, "Descubrimientos recientes:", (150, 200, 255), 5, y_offset))
                 y_offset += 18
                 
                 for insight in knowledge_summary['recent_insights']:
-                    insight_text = self.font_tiny.render(f"  • {insight}", True, (180, 180, 180))
-                    surface.blit(insight_text, (10, y_offset))
+                    ops.append(('text', self.font_tiny, f"  • {insight}", (180, 180, 180), 10, y_offset))
                     y_offset += 16
         
-        return y_offset
-    
-    def calculate_ecosystem_stats(self):
-        """Calcular estadísticas avanzadas del ecosistema"""
-        if not self.world.creatures:
-            return {
-                'environment_status': 'Crítico',
-                'most_consumed_data': None,
-                'fittest_creature': None,
-                'weakest_creature': None,
-                'most_potential': None,
-                'avg_fitness': 0,
-                'avg_age': 0,
-                'avg_energy': 0
-            }
-        
-        # Estado del entorno basado en población y recursos (AJUSTADO)
-        population_ratio = self.world.population / config.MAX_POPULATION
-        data_ratio = len(self.world.data_items) / max(1, config.DATA_SPAWN_RATE * 5)  # Más generoso
-        
-        # Calcular salud general
-        avg_energy_ratio = 0
-        if self.world.creatures:
-            avg_energy_ratio = sum(c.energy / c.max_energy for c in self.world.creatures) / len(self.world.creatures)
-        
-        # Estado basado en múltiples factores
-        health_score = (population_ratio * 0.4 + data_ratio * 0.3 + avg_energy_ratio * 0.3)
-        
-        if health_score < 0.2:
-            env_status = 'Crítico'
-        elif health_score < 0.4:
-            env_status = 'Difícil'
-        elif health_score < 0.7:
-            env_status = 'Estable'
-        else:
-            env_status = 'Próspero'
-        
-        # Tipo de dato más consumido (simulado por distribución)
-        # En una implementación completa, trackearíamos esto en world
-        most_consumed = max(config.DATA_TYPES_DISTRIBUTION.items(), key=lambda x: x[1])[0]
-        
-        # Criatura más hábil (mayor fitness)
-        fittest = max(self.world.creatures, key=lambda c: c.fitness)
-        
-        # Criatura más débil (menor fitness, pero viva)
-        weakest = min(self.world.creatures, key=lambda c: c.fitness)
-        
-        # Criatura con más potencial (joven + alta complejidad + buen fitness)
-        potential_score = lambda c: (c.complexity * 0.5 + c.fitness * 0.3 + (1000 - c.age) * 0.2)
-        most_potential = max(self.world.creatures, key=potential_score)
-        
-        # Promedios
-        avg_fitness = sum(c.fitness for c in self.world.creatures) / len(self.world.creatures)
-        avg_age = sum(c.age for c in self.world.creatures) / len(self.world.creatures)
-        avg_energy = sum(c.energy for c in self.world.creatures) / len(self.world.creatures)
-        
-        return {
-            'environment_status': env_status,
-            'most_consumed_data': most_consumed,
-            'fittest_creature': fittest,
-            'weakest_creature': weakest,
-            'most_potential': most_potential,
-            'avg_fitness': avg_fitness,
-            'avg_age': avg_age,
-            'avg_energy': avg_energy
-        }
+        return ops, y_offset
     
     def handle_event(self, event):
         """Manejar eventos del panel"""
-        if not self.world.selected_creature:
+        if self.selected is None:
             return False
         
         # Scroll en la sección de criatura seleccionada
@@ -697,38 +733,57 @@ class StatsPanel:
                 self.scroll_offset = max(0, min(self.max_scroll, self.scroll_offset))
                 return True
         
-        # Renombrar criatura
+        # Renombrar criatura (el texto cambia: redibujar sin esperar al refresco)
         if event.type == pygame.KEYDOWN:
-            if self.renaming:
-                if event.key == pygame.K_RETURN:
-                    # Confirmar nombre
-                    if self.rename_text.strip():
-                        self.world.selected_creature.custom_name = self.rename_text.strip()
-                    self.renaming = False
-                    self.rename_text = ""
-                    return True
-                elif event.key == pygame.K_ESCAPE:
-                    # Cancelar
-                    self.renaming = False
-                    self.rename_text = ""
-                    return True
-                elif event.key == pygame.K_BACKSPACE:
-                    self.rename_text = self.rename_text[:-1]
-                    return True
-                elif len(self.rename_text) < 20 and event.unicode.isprintable():
-                    self.rename_text += event.unicode
-                    return True
-            elif event.key == pygame.K_n:
-                # Iniciar renombrado
-                mouse_x, mouse_y = pygame.mouse.get_pos()
-                if self.x < mouse_x < self.x + self.width:
-                    self.renaming = True
-                    self.rename_text = getattr(self.world.selected_creature, 'custom_name', '')
-                    return True
+            handled = self._handle_rename_key(event)
+            if handled:
+                self.request_refresh()
+            return handled
+        
+        return False
+    
+    def _handle_rename_key(self, event) -> bool:
+        """Procesar tecla del modo renombrar"""
+        if self.renaming:
+            if event.key == pygame.K_RETURN:
+                # Confirmar nombre
+                if self.rename_text.strip():
+                    self.rename_selected(self.rename_text.strip())
+                self.renaming = False
+                self.rename_text = ""
+                return True
+            elif event.key == pygame.K_ESCAPE:
+                # Cancelar
+                self.renaming = False
+                self.rename_text = ""
+                return True
+            elif event.key == pygame.K_BACKSPACE:
+                self.rename_text = self.rename_text[:-1]
+                return True
+            elif len(self.rename_text) < 20 and event.unicode.isprintable():
+                self.rename_text += event.unicode
+                return True
+        elif event.key == pygame.K_n:
+            # Iniciar renombrado
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            if self.x < mouse_x < self.x + self.width:
+                self.renaming = True
+                self.rename_text = self.selected.name or ''
+                return True
         
         return False
     
 
+    def rename_selected(self, name: str):
+        """Renombrar la criatura seleccionada (vía la simulación si la hay)"""
+        if self.simulation is not None:
+            self.simulation.submit('rename', self.selected.id, name)
+            return
+        creature = self.world.get_creature(self.selected.id)
+        if creature is not None:
+            creature.custom_name = name
+            self.world.stats.invalidate()
+    
     def render_scrollbar(self, y_start, available_height):
         """Renderizar barra de scroll"""
         # Barra de fondo
@@ -0,0 +1,55 @@
+"""
+Caché de texto renderizado compartida por toda la UI
+"""
+
+from collections import OrderedDict
+import pygame
+import config
+
+
+class TextCache:
+    """Superficies de texto por (fuente, texto, antialias, color, fondo) con LRU
+
+    ``render`` tiene la misma firma que ``Font.render`` (con la fuente como
+    primer argumento), así que sustituye llamadas directas sin más cambios.
+    Las superficies devueltas se comparten: no deben modificarse.
+    """
+
+    def __init__(self, max_entries: int = None):
+        self.max_entries = max_entries or config.TEXT_CACHE_SIZE
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text: str, antialias: bool, color, background=None):
+        """Obtener superficie de texto (renderiza solo si no está en caché)"""
+        key = (font, text, antialias, tuple(color),
+               tuple(background) if background is not None else None)
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Vaciar la caché"""
+        self._surfaces.clear()
+
+
+# Instancia global
+_text_cache = None
+
+def get_text_cache() -> TextCache:
+    """Obtener caché de texto global"""
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
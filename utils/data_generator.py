@@ -41,4 +41,4 @@ class DataGenerator:
                 'size': 5,
                 'color': config.DATA_COLORS[data_type]
             }
-            self.world.data_items.append(data_item)
+            self.world.add_data_item(data_item)